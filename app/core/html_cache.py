@@ -0,0 +1,319 @@
+import os
+import re
+import time
+import codecs
+import asyncio
+import sqlite3
+import hashlib
+import threading
+from collections import Counter
+
+from app.core.http_client import get_http_client, HttpStats
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEFAULT_CACHE_DIR = os.getenv("HTML_CACHE_DIR", os.path.join(BASE_DIR, "data", "html_cache"))
+
+# ==========================================
+# [설정] URL 종류별 캐시 정책
+# ==========================================
+# namespace: 저장소(디렉터리/용량 한도)를 분리하는 단위. 랭킹 페이지와 기사 페이지는 따로 관리
+# ttl: 이 시간(초) 안에는 서버에 묻지 않고 캐시를 그대로 사용. 지나면 ETag/Last-Modified로 재검증
+CACHE_CLASSES = {
+    "ranking": {"namespace": "ranking", "ttl": 10 * 60},                  # 오늘자 랭킹 (계속 바뀜)
+    "ranking_archive": {"namespace": "ranking", "ttl": 30 * 24 * 3600},   # 지난 날짜 랭킹 (거의 고정)
+    "article": {"namespace": "article", "ttl": 7 * 24 * 3600},            # 기사 상세 페이지
+}
+NAMESPACE_MAX_BYTES = {
+    "ranking": 64 * 1024 * 1024,
+    "article": 512 * 1024 * 1024,
+}
+
+
+# Content-Type에 charset이 없을 때: <meta charset> -> UTF-8로 읽히면 UTF-8 -> 아니면 CP949 (EUC-KR 상위 집합)
+_HEADER_CHARSET = re.compile(r'charset=["\']?([\w-]+)', re.I)
+_META_CHARSET = re.compile(rb'<meta[^>]+charset=["\']?([\w-]+)', re.I)
+# EUC-KR로 표기한 페이지도 CP949 글자를 쓰는 경우가 많음
+_ENCODING_ALIASES = {"euc-kr": "cp949", "euc_kr": "cp949", "ks_c_5601-1987": "cp949"}
+
+
+def _known_encoding(name):
+    name = _ENCODING_ALIASES.get(name.lower(), name.lower())
+    try:
+        codecs.lookup(name)
+        return name
+    except LookupError:
+        return None
+
+
+def sniff_encoding(content):
+    """ 헤더에 charset이 없는 HTML의 인코딩 추정 """
+    match = _META_CHARSET.search(content[:4096])
+    encoding = match and _known_encoding(match.group(1).decode("ascii"))
+    if encoding:
+        return encoding
+    try:
+        content.decode("utf-8")
+        return "utf-8"
+    except UnicodeDecodeError:
+        return "cp949"
+
+
+def response_encoding(res):
+    """
+    응답 인코딩: Content-Type의 charset, 없으면 본문에서 추정
+    (res.encoding은 쓰지 않음: requests는 charset 없는 text/html을 ISO-8859-1, httpx는 UTF-8로 봄)
+    """
+    match = _HEADER_CHARSET.search(res.headers.get("Content-Type", ""))
+    encoding = match and _known_encoding(match.group(1))
+    return encoding or sniff_encoding(res.content)
+
+
+class CachedResponse:
+    """ requests.Response 중 호출부가 쓰는 부분만 흉내낸 결과 객체 """
+    def __init__(self, status_code, content, encoding, from_cache):
+        self.status_code = status_code
+        self.content = content
+        self.encoding = encoding
+        self.from_cache = from_cache
+
+    @property
+    def text(self):
+        encoding = self.encoding
+        # 예전에 requests 기본값(ISO-8859-1)으로 저장된 항목은 본문에서 다시 추정
+        if not encoding or encoding.lower() == "iso-8859-1":
+            encoding = sniff_encoding(self.content)
+        return str(self.content, encoding, errors="replace")
+
+
+class HtmlCacheStats(HttpStats):
+    """ URL 종류별 hit/miss/재검증 횟수와 절약한 바이트 """
+    def snapshot(self):
+        with self._lock:
+            counts = dict(self._counts)
+        result = {}
+        for url_class in sorted({key.split(":")[0] for key in counts}):
+            c = Counter({k.split(":")[1]: v for k, v in counts.items() if k.startswith(url_class + ":")})
+            lookups = c["hit"] + c["revalidated"] + c["miss"]
+            result[url_class] = {
+                **c,
+                "hit_ratio": round((c["hit"] + c["revalidated"]) / lookups, 3) if lookups else 0.0,
+            }
+        return result
+
+
+class _Namespace:
+    """ 디렉터리 하나 = 콘텐츠 주소(sha256) blob 저장소 + URL 인덱스 + 용량 기반 LRU """
+    def __init__(self, root, max_bytes):
+        self.root = root
+        self.max_bytes = max_bytes
+        # 스레드 여러 개가 같은 커넥션을 쓰므로 직렬화
+        self._lock = threading.RLock()
+        os.makedirs(os.path.join(root, "blobs"), exist_ok=True)
+        self.conn = sqlite3.connect(os.path.join(root, "index.sqlite3"), check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS blobs (
+                digest TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                last_access REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_blobs_access ON blobs(last_access);
+            CREATE TABLE IF NOT EXISTS entries (
+                url TEXT PRIMARY KEY,
+                digest TEXT NOT NULL,
+                encoding TEXT,
+                etag TEXT,
+                last_modified TEXT,
+                fetched_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_entries_digest ON entries(digest);
+        """)
+        self.conn.commit()
+
+    def _blob_path(self, digest):
+        return os.path.join(self.root, "blobs", digest[:2], digest)
+
+    def get(self, url):
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT e.digest, e.encoding, e.etag, e.last_modified, e.fetched_at, b.size "
+                "FROM entries e JOIN blobs b ON b.digest = e.digest WHERE e.url = ?", (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        keys = ("digest", "encoding", "etag", "last_modified", "fetched_at", "size")
+        return dict(zip(keys, row))
+
+    def read(self, entry):
+        try:
+            with open(self._blob_path(entry["digest"]), "rb") as f:
+                content = f.read()
+        except FileNotFoundError:
+            return None
+        with self._lock, self.conn:
+            self.conn.execute("UPDATE blobs SET last_access = ? WHERE digest = ?", (time.time(), entry["digest"]))
+        return content
+
+    def touch(self, url, etag=None, last_modified=None):
+        """ 304 응답으로 재검증된 항목의 신선도 갱신 """
+        with self._lock, self.conn:
+            self.conn.execute(
+                "UPDATE entries SET fetched_at = ?, etag = COALESCE(?, etag), "
+                "last_modified = COALESCE(?, last_modified) WHERE url = ?",
+                (time.time(), etag, last_modified, url)
+            )
+
+    def put(self, url, content, encoding, etag, last_modified):
+        digest = hashlib.sha256(content).hexdigest()
+        path = self._blob_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(content)
+            os.replace(tmp, path)
+
+        now = time.time()
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT INTO blobs (digest, size, last_access) VALUES (?, ?, ?) "
+                "ON CONFLICT(digest) DO UPDATE SET last_access = excluded.last_access",
+                (digest, len(content), now)
+            )
+            self.conn.execute(
+                "INSERT OR REPLACE INTO entries (url, digest, encoding, etag, last_modified, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (url, digest, encoding, etag, last_modified, now)
+            )
+            self._evict()
+
+    def total_bytes(self):
+        with self._lock:
+            return self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+
+    def _evict(self):
+        """ 용량 한도를 넘으면 가장 오래 안 쓴 blob부터 삭제 (그 blob을 가리키는 URL 항목도 함께) """
+        total = self.total_bytes()
+        if total <= self.max_bytes:
+            return
+        victims = []
+        for digest, size in self.conn.execute("SELECT digest, size FROM blobs ORDER BY last_access"):
+            if total <= self.max_bytes:
+                break
+            victims.append(digest)
+            total -= size
+        with self.conn:
+            self.conn.executemany("DELETE FROM entries WHERE digest = ?", [(d,) for d in victims])
+            self.conn.executemany("DELETE FROM blobs WHERE digest = ?", [(d,) for d in victims])
+        for digest in victims:
+            try:
+                os.remove(self._blob_path(digest))
+            except FileNotFoundError:
+                pass
+
+
+class HtmlCache:
+    """
+    가져온 HTML의 디스크 캐시 (크롤러와 NLP 검색 에이전트가 함께 사용)
+    - URL 종류별 TTL, 랭킹/기사 저장소 분리, 저장소별 용량 한도 LRU
+    - TTL이 지나면 ETag / Last-Modified 조건부 GET으로 재검증 (304면 본문을 다시 받지 않음)
+    """
+    def __init__(self, root=DEFAULT_CACHE_DIR, http=None, classes=None, max_bytes=None):
+        self.root = root
+        self.http = http or get_http_client()
+        self.classes = classes or CACHE_CLASSES
+        self.max_bytes = max_bytes or NAMESPACE_MAX_BYTES
+        self.stats = HtmlCacheStats()
+        self._lock = threading.Lock()
+        self._namespaces = {}
+
+    def _namespace(self, url_class):
+        name = self.classes[url_class]["namespace"]
+        with self._lock:
+            if name not in self._namespaces:
+                self._namespaces[name] = _Namespace(os.path.join(self.root, name), self.max_bytes[name])
+            return self._namespaces[name]
+
+    def _lookup(self, url, url_class):
+        """ (신선한 캐시 응답, 재검증용 헤더, 기존 항목) """
+        ns = self._namespace(url_class)
+        entry = ns.get(url)
+        if entry is None:
+            return None, {}, None
+
+        if time.time() - entry["fetched_at"] < self.classes[url_class]["ttl"]:
+            content = ns.read(entry)
+            if content is not None:
+                self.stats.incr(f"{url_class}:hit")
+                self.stats.incr(f"{url_class}:bytes_saved", entry["size"])
+                return CachedResponse(200, content, entry["encoding"], True), {}, entry
+            return None, {}, None
+
+        conditional = {}
+        if entry["etag"]:
+            conditional["If-None-Match"] = entry["etag"]
+        if entry["last_modified"]:
+            conditional["If-Modified-Since"] = entry["last_modified"]
+        return None, conditional, entry
+
+    def _store(self, url, url_class, res, entry):
+        """ 네트워크 응답을 반영하고 호출부에 돌려줄 응답을 만듭니다. """
+        ns = self._namespace(url_class)
+        if res.status_code == 304 and entry is not None:
+            content = ns.read(entry)
+            if content is not None:
+                ns.touch(url, res.headers.get("ETag"), res.headers.get("Last-Modified"))
+                self.stats.incr(f"{url_class}:revalidated")
+                self.stats.incr(f"{url_class}:bytes_saved", entry["size"])
+                return CachedResponse(200, content, entry["encoding"], True)
+            return None
+
+        self.stats.incr(f"{url_class}:miss")
+        self.stats.incr(f"{url_class}:bytes_downloaded", len(res.content))
+        encoding = response_encoding(res)
+        if res.status_code == 200:
+            ns.put(url, res.content, encoding, res.headers.get("ETag"), res.headers.get("Last-Modified"))
+        return CachedResponse(res.status_code, res.content, encoding, False)
+
+    def fetch(self, url, url_class, headers=None):
+        cached, conditional, entry = self._lookup(url, url_class)
+        if cached is not None:
+            return cached
+
+        res = self.http.get(url, headers={**(headers or {}), **conditional})
+        result = self._store(url, url_class, res, entry)
+        if result is None:
+            # 304인데 blob이 사라진 경우: 조건 없이 다시 받기
+            res = self.http.get(url, headers=headers)
+            result = self._store(url, url_class, res, None)
+        return result
+
+    async def afetch(self, url, url_class, client, headers=None):
+        """
+        fetch의 asyncio 버전. client는 AsyncHttpClient
+        인덱스 조회/본문 파일 읽기·쓰기는 스레드에서 실행해 이벤트 루프를 막지 않음
+        """
+        cached, conditional, entry = await asyncio.to_thread(self._lookup, url, url_class)
+        if cached is not None:
+            return cached
+
+        res = await client.get(url, headers={**(headers or {}), **conditional})
+        result = await asyncio.to_thread(self._store, url, url_class, res, entry)
+        if result is None:
+            res = await client.get(url, headers=headers)
+            result = await asyncio.to_thread(self._store, url, url_class, res, None)
+        return result
+
+
+_shared_cache = None
+_shared_lock = threading.Lock()
+
+
+def get_html_cache():
+    """ 프로세스 전역 공용 HtmlCache """
+    global _shared_cache
+    if _shared_cache is None:
+        with _shared_lock:
+            if _shared_cache is None:
+                _shared_cache = HtmlCache()
+    return _shared_cache
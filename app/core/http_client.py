@@ -0,0 +1,226 @@
+import asyncio
+import random
+import threading
+import time
+from collections import Counter
+from urllib.parse import urlsplit
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+# ==========================================
+# [설정] 공용 HTTP 클라이언트
+# ==========================================
+DEFAULT_HEADERS = {"User-Agent": "Mozilla/5.0"}
+# 호스트별 (connect, read) 타임아웃. 없는 호스트는 DEFAULT_TIMEOUT 사용
+HOST_TIMEOUTS = {
+    "news.naver.com": (3.05, 10),
+    "n.news.naver.com": (3.05, 5),
+    "openapi.naver.com": (3.05, 5),
+}
+DEFAULT_TIMEOUT = (3.05, 10)
+POOL_MAXSIZE = 32
+MAX_RETRIES = 3
+BACKOFF_BASE = 0.3
+BACKOFF_MAX = 5.0
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+class HttpStats:
+    """ 요청/재시도/커넥션 재사용 카운터 (스레드 안전) """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = Counter()
+
+    def incr(self, key, n=1):
+        with self._lock:
+            self._counts[key] += n
+
+    def snapshot(self):
+        with self._lock:
+            counts = dict(self._counts)
+        attempts = counts.get("attempts", 0)
+        opened = counts.get("connections_opened", 0)
+        counts["connections_reused"] = max(attempts - opened, 0)
+        counts["reuse_ratio"] = round(counts["connections_reused"] / attempts, 3) if attempts else 0.0
+        return counts
+
+
+class RetryPolicy:
+    """ 지수 백오프 + full jitter. Retry-After 헤더가 있으면 그 값을 우선합니다. """
+    def __init__(self, max_retries=MAX_RETRIES, backoff_base=BACKOFF_BASE, backoff_max=BACKOFF_MAX,
+                 retry_status=RETRY_STATUS):
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_status = retry_status
+
+    def should_retry_status(self, status_code):
+        return status_code in self.retry_status
+
+    def backoff(self, attempt, retry_after=None):
+        if retry_after:
+            try:
+                return min(float(retry_after), self.backoff_max)
+            except ValueError:
+                pass
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+
+def timeout_for(url, host_timeouts=HOST_TIMEOUTS, default=DEFAULT_TIMEOUT):
+    return host_timeouts.get(urlsplit(url).hostname or "", default)
+
+
+class _CountingAdapter(HTTPAdapter):
+    """ urllib3 커넥션이 실제로 소켓을 새로 열(connect) 때마다 카운트하는 어댑터 """
+    def __init__(self, stats, **kwargs):
+        self._stats = stats
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        stats = self._stats
+
+        class CountingHTTPConnection(HTTPConnection):
+            def connect(self):
+                stats.incr("connections_opened")
+                return super().connect()
+
+        class CountingHTTPSConnection(HTTPSConnection):
+            def connect(self):
+                stats.incr("connections_opened")
+                stats.incr("tls_handshakes")
+                return super().connect()
+
+        class CountingHTTPConnectionPool(HTTPConnectionPool):
+            ConnectionCls = CountingHTTPConnection
+
+        class CountingHTTPSConnectionPool(HTTPSConnectionPool):
+            ConnectionCls = CountingHTTPSConnection
+
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": CountingHTTPConnectionPool,
+            "https": CountingHTTPSConnectionPool,
+        }
+
+
+class HttpClient:
+    """
+    크롤러/검색 에이전트가 함께 쓰는 동기 HTTP 클라이언트
+    - keep-alive 커넥션 풀 (호스트별 재사용)
+    - 일시적 실패(커넥션 에러, 타임아웃, 429/5xx)에 대한 제한된 재시도 + jitter
+    - 호스트별 타임아웃
+    """
+    def __init__(self, headers=None, pool_maxsize=POOL_MAXSIZE, retry=None, host_timeouts=None):
+        self.stats = HttpStats()
+        self.retry = retry or RetryPolicy()
+        self.host_timeouts = HOST_TIMEOUTS if host_timeouts is None else host_timeouts
+
+        self.session = requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS if headers is None else headers)
+        adapter = _CountingAdapter(self.stats, pool_connections=pool_maxsize,
+                                   pool_maxsize=pool_maxsize, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", timeout_for(url, self.host_timeouts))
+        self.stats.incr("requests")
+
+        for attempt in range(self.retry.max_retries + 1):
+            self.stats.incr("attempts")
+            try:
+                res = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt >= self.retry.max_retries:
+                    self.stats.incr("failures")
+                    raise
+                self.stats.incr("retries")
+                time.sleep(self.retry.backoff(attempt))
+                continue
+
+            if self.retry.should_retry_status(res.status_code) and attempt < self.retry.max_retries:
+                self.stats.incr("retries")
+                delay = self.retry.backoff(attempt, res.headers.get("Retry-After"))
+                res.close()
+                time.sleep(delay)
+                continue
+            return res
+
+    def close(self):
+        self.session.close()
+
+
+class AsyncHttpClient:
+    """
+    HttpClient의 asyncio 버전 (httpx 기반). 같은 재시도/타임아웃 정책과 카운터를 씁니다.
+    새 커넥션 수는 httpcore trace 이벤트로 셉니다.
+    """
+    def __init__(self, headers=None, max_connections=POOL_MAXSIZE, retry=None, host_timeouts=None):
+        self.stats = HttpStats()
+        self.retry = retry or RetryPolicy()
+        self.host_timeouts = HOST_TIMEOUTS if host_timeouts is None else host_timeouts
+        limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+        self.client = httpx.AsyncClient(headers=DEFAULT_HEADERS if headers is None else headers,
+                                        follow_redirects=True, limits=limits)
+
+    async def _trace(self, event_name, info):
+        if event_name == "connection.connect_tcp.complete":
+            self.stats.incr("connections_opened")
+        elif event_name == "connection.start_tls.complete":
+            self.stats.incr("tls_handshakes")
+
+    def _timeout(self, url):
+        timeout = timeout_for(url, self.host_timeouts)
+        if isinstance(timeout, tuple):
+            return httpx.Timeout(timeout[1], connect=timeout[0])
+        return timeout
+
+    async def get(self, url, **kwargs):
+        return await self.request("GET", url, **kwargs)
+
+    async def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", self._timeout(url))
+        kwargs["extensions"] = {**kwargs.get("extensions", {}), "trace": self._trace}
+        self.stats.incr("requests")
+
+        for attempt in range(self.retry.max_retries + 1):
+            self.stats.incr("attempts")
+            try:
+                res = await self.client.request(method, url, **kwargs)
+            except httpx.TransportError:
+                if attempt >= self.retry.max_retries:
+                    self.stats.incr("failures")
+                    raise
+                self.stats.incr("retries")
+                await asyncio.sleep(self.retry.backoff(attempt))
+                continue
+
+            if self.retry.should_retry_status(res.status_code) and attempt < self.retry.max_retries:
+                self.stats.incr("retries")
+                await asyncio.sleep(self.retry.backoff(attempt, res.headers.get("Retry-After")))
+                continue
+            return res
+
+    async def aclose(self):
+        await self.client.aclose()
+
+
+_shared_client = None
+_shared_lock = threading.Lock()
+
+
+def get_http_client():
+    """ 프로세스 전역 공용 HttpClient (커넥션 풀을 모든 호출부가 공유) """
+    global _shared_client
+    if _shared_client is None:
+        with _shared_lock:
+            if _shared_client is None:
+                _shared_client = HttpClient()
+    return _shared_client
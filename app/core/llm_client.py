@@ -0,0 +1,414 @@
+import os
+import re
+import asyncio
+import sys
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+
+from app.core.http_client import HttpStats
+from app.core.llm_scheduler import get_llm_scheduler, BATCH, PRIORITY_NAMES
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEFAULT_CACHE_DIR = os.getenv("LLM_CACHE_DIR", os.path.join(BASE_DIR, "data", "llm_cache"))
+
+# ==========================================
+# [설정] LLM 호출 / 응답 캐시
+# ==========================================
+# gemini: Google Gemini / stub: 로컬 고정 응답 (테스트, 벤치마크)
+LLM_BACKEND = os.getenv("LLM_BACKEND", "gemini")
+# 같은 (모델, 프롬프트) 응답을 재사용하는 기간 (초). 0이면 캐시를 쓰지 않음
+LLM_CACHE_TTL = int(os.getenv("LLM_CACHE_TTL", str(7 * 24 * 3600)))
+# 캐시 용량 한도. 넘으면 가장 오래 안 쓴 응답부터 삭제
+LLM_CACHE_MAX_BYTES = 128 * 1024 * 1024
+# stub 스트리밍 조각 크기 (글자)
+STUB_CHUNK_CHARS = 20
+
+
+def normalize_prompt(prompt):
+    """ 들여쓰기/줄 끝 공백/빈 줄 차이는 같은 프롬프트로 봄 (코드 안 f-string 들여쓰기가 바뀌어도 hit) """
+    lines = (re.sub(r"[ \t]+", " ", line).strip() for line in str(prompt).splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+def cache_key(model_name, prompt, generation_config=None):
+    config = json.dumps(generation_config or {}, sort_keys=True, ensure_ascii=False)
+    raw = f"{model_name}\0{config}\0{normalize_prompt(prompt)}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class LLMResponse:
+    """ genai 응답 중 호출부가 쓰는 부분(.text)만 흉내낸 결과 객체 """
+    def __init__(self, text, from_cache=False, latency=0.0):
+        self.text = text
+        self.from_cache = from_cache
+        self.latency = latency
+
+
+class LLMStats(HttpStats):
+    """ hit/miss 횟수, 캐시로 아낀 모델 호출 시간(초) """
+    def snapshot(self):
+        with self._lock:
+            counts = dict(self._counts)
+        lookups = counts.get("hit", 0) + counts.get("miss", 0)
+        counts["hit_ratio"] = round(counts.get("hit", 0) / lookups, 3) if lookups else 0.0
+        counts["seconds_saved"] = round(counts.get("seconds_saved", 0.0), 3)
+        return counts
+
+
+class LLMCache:
+    """
+    LLM 응답 디스크 캐시 (sqlite 파일 하나)
+    - 키: (모델, 생성 설정, 정규화한 프롬프트)의 sha256
+    - 일반 응답은 텍스트, 스트리밍 응답은 조각 리스트로 저장해 같은 조각 단위로 다시 흘려보냄
+    - TTL이 지난 항목은 읽지 않고, 용량 한도를 넘으면 가장 오래 안 쓴 항목부터 삭제
+    - 항목별 hit 수와 원래 호출 시간을 기록해 실행을 넘어선 절약 시간도 집계
+    """
+    def __init__(self, root=DEFAULT_CACHE_DIR, ttl=LLM_CACHE_TTL, max_bytes=LLM_CACHE_MAX_BYTES):
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        # 스레드 여러 개가 같은 커넥션을 쓰므로 직렬화
+        self._lock = threading.RLock()
+        os.makedirs(root, exist_ok=True)
+        self.conn = sqlite3.connect(os.path.join(root, "responses.sqlite3"), check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT NOT NULL,
+                model TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                latency REAL NOT NULL,
+                hits INTEGER NOT NULL DEFAULT 0,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL,
+                PRIMARY KEY (key, kind)
+            );
+            CREATE INDEX IF NOT EXISTS idx_responses_access ON responses(last_access);
+        """)
+        self.conn.commit()
+
+    def get(self, key, kind):
+        """ 신선한 항목이면 (텍스트 또는 조각 리스트, 원래 호출 시간) """
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT payload, latency, created_at FROM responses WHERE key = ? AND kind = ?", (key, kind)
+            ).fetchone()
+            if row is None or time.time() - row[2] >= self.ttl:
+                return None
+            with self.conn:
+                self.conn.execute("UPDATE responses SET hits = hits + 1, last_access = ? WHERE key = ? AND kind = ?",
+                                  (time.time(), key, kind))
+        return json.loads(row[0]), row[1]
+
+    def put(self, key, model_name, kind, value, latency):
+        payload = json.dumps(value, ensure_ascii=False)
+        now = time.time()
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses (key, model, kind, payload, size, latency, hits, created_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?, 0, ?, ?)",
+                (key, model_name, kind, payload, len(payload.encode("utf-8")), latency, now, now)
+            )
+            self._evict()
+
+    def delete(self, key):
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def total_bytes(self):
+        with self._lock:
+            return self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def _evict(self):
+        """ 만료 항목을 지우고, 그래도 한도를 넘으면 가장 오래 안 쓴 항목부터 삭제 """
+        self.conn.execute("DELETE FROM responses WHERE created_at <= ?", (time.time() - self.ttl,))
+        total = self.total_bytes()
+        if total <= self.max_bytes:
+            return
+        victims = []
+        for key, kind, size in self.conn.execute("SELECT key, kind, size FROM responses ORDER BY last_access"):
+            if total <= self.max_bytes:
+                break
+            victims.append((key, kind))
+            total -= size
+        self.conn.executemany("DELETE FROM responses WHERE key = ? AND kind = ?", victims)
+
+    def summary(self):
+        """ 모델별 저장 항목 수, 용량, 누적 hit 수, 누적 절약 시간(초) """
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT model, COUNT(*), SUM(size), SUM(hits), SUM(hits * latency) FROM responses GROUP BY model"
+            ).fetchall()
+        return {model: {"entries": n, "bytes": size, "hits": hits, "seconds_saved": round(saved, 3)}
+                for model, n, size, hits, saved in rows}
+
+
+class GeminiBackend:
+    def __init__(self, model_name):
+        import google.generativeai as genai
+        genai.configure(api_key=os.getenv("GOOGLE_API_KEY"))
+        self.model = genai.GenerativeModel(model_name)
+
+    def generate(self, prompt, generation_config=None):
+        if generation_config:
+            return self.model.generate_content(prompt, generation_config=generation_config).text
+        return self.model.generate_content(prompt).text
+
+    async def agenerate(self, prompt, generation_config=None):
+        if generation_config:
+            response = await self.model.generate_content_async(prompt, generation_config=generation_config)
+        else:
+            response = await self.model.generate_content_async(prompt)
+        return response.text
+
+    def stream(self, prompt, generation_config=None):
+        if generation_config:
+            response = self.model.generate_content(prompt, generation_config=generation_config, stream=True)
+        else:
+            response = self.model.generate_content(prompt, stream=True)
+        for chunk in response:
+            yield chunk.text
+
+    async def astream(self, prompt, generation_config=None):
+        if generation_config:
+            response = await self.model.generate_content_async(prompt, generation_config=generation_config, stream=True)
+        else:
+            response = await self.model.generate_content_async(prompt, stream=True)
+        async for chunk in response:
+            yield chunk.text
+
+
+class StubBackend:
+    """
+    테스트/벤치마크용 로컬 백엔드: 미리 정한 응답을 돌려줍니다.
+    model_name: GeminiBackend와 생성자를 맞추기 위한 자리 (LLM_BACKEND=stub일 때 BACKENDS에서 같은 방식으로 생성)
+    responses: 문자열 리스트(순서대로, 마지막 것을 반복) 또는 prompt -> 문자열 함수. 예외 객체면 그대로 raise
+    latency: 요청마다 기다리는 초 (네트워크 왕복 흉내)
+    """
+    def __init__(self, model_name=None, responses=None, latency=0.0, chunk_chars=STUB_CHUNK_CHARS):
+        self.model_name = model_name
+        self.responses = responses if responses is not None else (lambda prompt: f"stub: {normalize_prompt(prompt)[:40]}")
+        self.latency = latency
+        self.chunk_chars = chunk_chars
+        self.prompts = []
+        self._lock = threading.Lock()
+
+    def _respond(self, prompt):
+        with self._lock:
+            self.prompts.append(prompt)
+            n = len(self.prompts)
+        if callable(self.responses):
+            text = self.responses(prompt)
+        else:
+            text = self.responses[min(n, len(self.responses)) - 1]
+        if isinstance(text, Exception):
+            raise text
+        return text
+
+    def generate(self, prompt, generation_config=None):
+        if self.latency:
+            time.sleep(self.latency)
+        return self._respond(prompt)
+
+    async def agenerate(self, prompt, generation_config=None):
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self._respond(prompt)
+
+    def stream(self, prompt, generation_config=None):
+        text = self.generate(prompt, generation_config)
+        for i in range(0, len(text), self.chunk_chars):
+            yield text[i:i + self.chunk_chars]
+
+    async def astream(self, prompt, generation_config=None):
+        text = await self.agenerate(prompt, generation_config)
+        for i in range(0, len(text), self.chunk_chars):
+            yield text[i:i + self.chunk_chars]
+
+
+BACKENDS = {"gemini": GeminiBackend, "stub": StubBackend}
+
+
+class LLMClient:
+    """
+    LLM 호출 공용 래퍼 (이슈 제목 생성, 검색 브리핑, 초안 작성이 함께 사용)
+    같은 (모델, 프롬프트) 요청은 디스크 캐시의 응답을 재사용합니다. 스트리밍 응답은 조각 단위로 재생
+    캐시 miss만 공용 스케줄러(llm_scheduler)를 거쳐 priority 순서와 분당 한도에 맞춰 모델을 호출합니다.
+    generate_content(prompt)는 genai GenerativeModel과 같은 모양이라 기존 호출부에 그대로 넘길 수 있습니다.
+    """
+    def __init__(self, model_name, backend=None, cache=None, use_cache=None, priority=BATCH, scheduler=None):
+        self.model_name = model_name
+        self.priority = priority
+        self.scheduler = scheduler or get_llm_scheduler()
+        self._backend = backend
+        self._backend_lock = threading.Lock()
+        self.use_cache = LLM_CACHE_TTL > 0 if use_cache is None else use_cache
+        self.cache = cache if cache is not None or not self.use_cache else get_llm_cache()
+        self.stats = LLMStats()
+
+    @property
+    def backend(self):
+        # Gemini 모델은 처음 캐시 miss가 날 때 만듦 (전부 hit이면 API 설정 없이도 동작)
+        if self._backend is None:
+            with self._backend_lock:
+                if self._backend is None:
+                    self._backend = BACKENDS[LLM_BACKEND](self.model_name)
+        return self._backend
+
+    def _cached(self, key, kind):
+        if not self.use_cache:
+            return None
+        found = self.cache.get(key, kind)
+        if found is None:
+            self.stats.incr("miss")
+            return None
+        self.stats.incr("hit")
+        self.stats.incr("seconds_saved", found[1])
+        return found
+
+    def generate(self, prompt, generation_config=None, use_cache=True):
+        key = cache_key(self.model_name, prompt, generation_config)
+        found = self._cached(key, "text") if use_cache else None
+        if found is not None:
+            return LLMResponse(found[0], from_cache=True, latency=found[1])
+
+        timing = []
+
+        def call():
+            # 대기열에서 기다린 시간은 빼고 모델 호출 시간만 잼 (캐시 hit 때 아낀 시간으로 집계)
+            start = time.perf_counter()
+            text = self.backend.generate(prompt, generation_config)
+            timing.append(time.perf_counter() - start)
+            return text
+
+        text = self.scheduler.call(call, prompt, self.priority)
+        latency = timing[-1]
+        if self.use_cache and use_cache:
+            self.cache.put(key, self.model_name, "text", text, latency)
+        return LLMResponse(text, latency=latency)
+
+    async def agenerate(self, prompt, generation_config=None, use_cache=True):
+        """
+        generate의 asyncio 버전 (모델 호출은 async API, 스케줄러 대기도 이벤트 루프를 막지 않음)
+        SQLite 캐시 조회/저장은 디스크 I/O와 잠금 대기가 있으므로 스레드에서 실행
+        """
+        key = cache_key(self.model_name, prompt, generation_config)
+        found = await asyncio.to_thread(self._cached, key, "text") if use_cache else None
+        if found is not None:
+            return LLMResponse(found[0], from_cache=True, latency=found[1])
+
+        timing = []
+
+        async def call():
+            start = time.perf_counter()
+            text = await self.backend.agenerate(prompt, generation_config)
+            timing.append(time.perf_counter() - start)
+            return text
+
+        text = await self.scheduler.acall(call, prompt, self.priority)
+        latency = timing[-1]
+        if self.use_cache and use_cache:
+            await asyncio.to_thread(self.cache.put, key, self.model_name, "text", text, latency)
+        return LLMResponse(text, latency=latency)
+
+    def generate_content(self, prompt, generation_config=None):
+        return self.generate(prompt, generation_config)
+
+    def stream(self, prompt, generation_config=None, use_cache=True):
+        """ 응답 조각 제너레이터. 끝까지 받은 스트림만 캐시에 저장 (중간에 끊기면 저장하지 않음) """
+        key = cache_key(self.model_name, prompt, generation_config)
+        found = self._cached(key, "stream") if use_cache else None
+        if found is not None:
+            yield from found[0]
+            return
+
+        timing = []
+
+        def call():
+            timing.append(time.perf_counter())
+            return self.backend.stream(prompt, generation_config)
+
+        chunks = []
+        for chunk in self.scheduler.stream(call, prompt, self.priority):
+            chunks.append(chunk)
+            yield chunk
+        if self.use_cache and use_cache:
+            self.cache.put(key, self.model_name, "stream", chunks, time.perf_counter() - timing[-1])
+
+    async def astream(self, prompt, generation_config=None, use_cache=True):
+        """ stream의 asyncio 버전 (async 핸들러에서 사용. 스케줄러 대기와 캐시 I/O가 이벤트 루프를 막지 않음) """
+        key = cache_key(self.model_name, prompt, generation_config)
+        found = await asyncio.to_thread(self._cached, key, "stream") if use_cache else None
+        if found is not None:
+            for chunk in found[0]:
+                yield chunk
+            return
+
+        timing = []
+
+        def call():
+            timing.append(time.perf_counter())
+            return self.backend.astream(prompt, generation_config)
+
+        chunks = []
+        async for chunk in self.scheduler.astream(call, prompt, self.priority):
+            chunks.append(chunk)
+            yield chunk
+        if self.use_cache and use_cache:
+            await asyncio.to_thread(self.cache.put, key, self.model_name, "stream", chunks,
+                                    time.perf_counter() - timing[-1])
+
+    def invalidate(self, prompt, generation_config=None):
+        """ 호출부가 쓸 수 없다고 판단한 응답(JSON 파싱 실패 등)을 지움 """
+        if self.use_cache:
+            self.cache.delete(cache_key(self.model_name, prompt, generation_config))
+
+
+_shared_cache = None
+_shared_lock = threading.Lock()
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def get_llm_cache():
+    """ 프로세스 전역 공용 LLMCache """
+    global _shared_cache
+    if _shared_cache is None:
+        with _shared_lock:
+            if _shared_cache is None:
+                _shared_cache = LLMCache()
+    return _shared_cache
+
+
+def get_llm_client(model_name, priority=BATCH):
+    """ 프로세스 전역 (모델, 우선순위)별 LLMClient. 캐시와 스케줄러는 모두 공유 """
+    # LLMClient 생성 중 get_llm_cache()가 _shared_lock을 잡으므로 별도 잠금 사용
+    with _clients_lock:
+        if (model_name, priority) not in _clients:
+            _clients[(model_name, priority)] = LLMClient(model_name, priority=priority)
+        return _clients[(model_name, priority)]
+
+
+def llm_stats():
+    """ 스케줄러 상태/대기 시간과 클라이언트별 캐시 hit 통계 """
+    with _clients_lock:
+        clients = dict(_clients)
+    return {
+        "scheduler": get_llm_scheduler().snapshot(),
+        "clients": {f"{model}:{PRIORITY_NAMES.get(priority, priority)}": client.stats.snapshot()
+                    for (model, priority), client in clients.items()},
+    }
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] != ["stats"]:
+        print("사용법: python -m app.core.llm_client stats")
+        sys.exit(1)
+    cache = get_llm_cache()
+    for model, summary in cache.summary().items():
+        print(f"{model}: 응답 {summary['entries']}건 ({summary['bytes'] / 1024:.0f}KB), "
+              f"누적 hit {summary['hits']}회, 아낀 시간 {summary['seconds_saved']:.1f}초")
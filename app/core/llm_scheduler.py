@@ -0,0 +1,355 @@
+import os
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+from collections import deque
+
+from app.core.http_client import HttpStats, RetryPolicy
+
+# ==========================================
+# [설정] LLM 호출 스케줄러
+# ==========================================
+# 분당 요청 수 / 분당 토큰 수 한도 (API 키 한도에 맞춰 설정. 프로세스 단위로 적용)
+LLM_RPM = int(os.getenv("LLM_RPM", "60"))
+LLM_TPM = int(os.getenv("LLM_TPM", "1000000"))
+# 동시에 진행하는 모델 호출 수
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "4"))
+# 버킷에 쌓아둘 수 있는 양 (한도의 몇 초치까지 몰아서 보낼지)
+BURST_SECONDS = 10
+# 429/쿼터 초과 재시도: 지수 백오프 (초)
+RATE_LIMIT_RETRIES = 4
+RATE_LIMIT_BACKOFF_BASE = 2.0
+RATE_LIMIT_BACKOFF_MAX = 60.0
+# 429를 받으면 요청 속도를 이 비율로 줄이고, 성공할 때마다 한도의 RECOVERY_STEP 비율씩 회복
+BACKOFF_FACTOR = 0.5
+RECOVERY_STEP = 0.05
+MIN_RATE_FRACTION = 0.05
+# 한국어 프롬프트 토큰 수 추정 (글자 2개당 1토큰) + 응답 토큰 추정치
+CHARS_PER_TOKEN = 2
+OUTPUT_TOKEN_ESTIMATE = 512
+# 대기 시간 백분위 계산에 쓰는 최근 요청 수
+WAIT_SAMPLES = 1024
+
+# 우선순위 (숫자가 작을수록 먼저)
+INTERACTIVE = 0   # /scroller/nlp 브리핑, 초안 작성 등 사용자가 기다리는 요청
+BATCH = 1         # 주간 이슈 제목 생성 등 배치 작업
+PRIORITY_NAMES = {INTERACTIVE: "interactive", BATCH: "batch"}
+
+
+def estimate_tokens(prompt):
+    return len(str(prompt)) // CHARS_PER_TOKEN + OUTPUT_TOKEN_ESTIMATE
+
+
+def is_rate_limited(error):
+    """ 429 / 쿼터 초과 예외인지 (google.api_core.exceptions.ResourceExhausted 등) """
+    if getattr(error, "code", None) == 429 or getattr(error, "status_code", None) == 429:
+        return True
+    if type(error).__name__ in ("ResourceExhausted", "TooManyRequests"):
+        return True
+    message = str(error).lower()
+    return "429" in message or "quota" in message or "rate limit" in message
+
+
+class TokenBucket:
+    """ 초당 rate만큼 차오르고 capacity까지 쌓이는 버킷 (호출부에서 잠금) """
+    def __init__(self, per_minute, burst_seconds=BURST_SECONDS):
+        self.limit = per_minute / 60.0
+        self.rate = self.limit
+        self.capacity = max(1.0, self.limit * burst_seconds)
+        self.level = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now):
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount, now):
+        """ amount를 꺼낼 수 있을 때까지 남은 초 (0이면 지금 가능) """
+        self._refill(now)
+        amount = min(amount, self.capacity)  # 버킷보다 큰 요청도 가득 차면 보냄
+        return 0.0 if self.level >= amount else (amount - self.level) / self.rate
+
+    def take(self, amount):
+        self.level -= min(amount, self.capacity)
+
+    def slow_down(self):
+        self.rate = max(self.limit * MIN_RATE_FRACTION, self.rate * BACKOFF_FACTOR)
+
+    def recover(self):
+        self.rate = min(self.limit, self.rate + self.limit * RECOVERY_STEP)
+
+
+class SchedulerStats(HttpStats):
+    """ 우선순위별 요청/429/재시도 횟수와 대기열 대기 시간 (평균, p50, p95, 최대) """
+    def __init__(self):
+        super().__init__()
+        self._waits = {}
+
+    def add_wait(self, priority, seconds):
+        name = PRIORITY_NAMES.get(priority, str(priority))
+        with self._lock:
+            self._counts[f"{name}:requests"] += 1
+            self._counts[f"{name}:wait_total"] += seconds
+            self._waits.setdefault(name, deque(maxlen=WAIT_SAMPLES)).append(seconds)
+
+    def snapshot(self):
+        with self._lock:
+            counts = dict(self._counts)
+            waits = {name: sorted(samples) for name, samples in self._waits.items()}
+        result = {k: v for k, v in counts.items() if not k.endswith(":wait_total")}
+        for name, samples in waits.items():
+            requests = counts.get(f"{name}:requests", 0)
+            result[f"{name}:wait_mean"] = round(counts.get(f"{name}:wait_total", 0.0) / requests, 3) if requests else 0.0
+            result[f"{name}:wait_p50"] = round(samples[len(samples) // 2], 3)
+            result[f"{name}:wait_p95"] = round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 3)
+            result[f"{name}:wait_max"] = round(samples[-1], 3)
+        return result
+
+
+def _wake_up(wake):
+    if not wake.done():
+        wake.set_result(None)
+
+
+class LLMScheduler:
+    """
+    프로세스 전역 LLM 호출 스케줄러
+    - 분당 요청 수 / 토큰 수 토큰 버킷 + 동시 호출 수 제한
+    - 우선순위 대기열: 대화형 요청이 배치 작업보다 먼저 나감 (같은 우선순위는 도착 순)
+    - 429/쿼터 초과를 받으면 잠시 전체 호출을 멈추고 요청 속도를 절반으로 줄인 뒤, 성공할 때마다 조금씩 회복
+    """
+    def __init__(self, rpm=LLM_RPM, tpm=LLM_TPM, max_concurrency=LLM_MAX_CONCURRENCY, retry=None):
+        self.requests = TokenBucket(rpm)
+        self.tokens = TokenBucket(tpm)
+        self.max_concurrency = max_concurrency
+        self.retry = retry or RetryPolicy(RATE_LIMIT_RETRIES, RATE_LIMIT_BACKOFF_BASE, RATE_LIMIT_BACKOFF_MAX)
+        self.stats = SchedulerStats()
+        self._cond = threading.Condition()
+        self._queue = []
+        # 이벤트 루프에서 기다리는 요청: 대기열 항목 -> (루프, 깨울 Future)
+        self._async_waiters = {}
+        self._seq = itertools.count()
+        self._active = 0
+        self._paused_until = 0.0
+
+    def _ready_in(self, tokens, now):
+        """ 대기열 맨 앞 요청이 나가기까지 남은 초 (동시 호출 수가 찼으면 None: 자리가 날 때까지) """
+        if self._active >= self.max_concurrency:
+            return None
+        return max(self._paused_until - now, self.requests.wait_time(1, now), self.tokens.wait_time(tokens, now))
+
+    def _notify_locked(self):
+        """ 스레드 대기자와 이벤트 루프 대기자 모두 조건을 다시 확인하게 함 (self._cond를 잡은 채 호출) """
+        self._cond.notify_all()
+        for loop, wake in self._async_waiters.values():
+            try:
+                loop.call_soon_threadsafe(_wake_up, wake)
+            except RuntimeError: # 루프가 이미 닫힘
+                pass
+
+    def _take_locked(self, tokens):
+        self.requests.take(1)
+        self.tokens.take(tokens)
+        self._active += 1
+        # 다음 요청도 조건을 다시 확인하도록
+        self._notify_locked()
+
+    def _leave_locked(self, entry):
+        self._queue.remove(entry)
+        heapq.heapify(self._queue)
+
+    def acquire(self, tokens, priority=BATCH):
+        """ 차례가 올 때까지 기다렸다가 호출 자리를 잡습니다. 반환: 대기 초 """
+        start = time.monotonic()
+        with self._cond:
+            entry = (priority, next(self._seq))
+            heapq.heappush(self._queue, entry)
+            try:
+                while True:
+                    now = time.monotonic()
+                    delay = self._ready_in(tokens, now) if self._queue[0] == entry else None
+                    if delay == 0:
+                        break
+                    self._cond.wait(delay)
+            finally:
+                self._leave_locked(entry)
+            self._take_locked(tokens)
+        waited = time.monotonic() - start
+        self.stats.add_wait(priority, waited)
+        return waited
+
+    def release(self, rate_limited=False, backoff=0.0):
+        with self._cond:
+            self._active -= 1
+            if rate_limited:
+                self._paused_until = max(self._paused_until, time.monotonic() + backoff)
+                self.requests.slow_down()
+                self.tokens.slow_down()
+            else:
+                self.requests.recover()
+                self.tokens.recover()
+            self._notify_locked()
+
+    def _rate_limit_backoff(self, attempt, priority):
+        """ 429를 받은 뒤 재시도 전 쉴 초 (재시도를 다 썼으면 None) """
+        name = PRIORITY_NAMES.get(priority, str(priority))
+        self.stats.incr(f"{name}:rate_limited")
+        if attempt >= self.retry.max_retries:
+            return None
+        self.stats.incr(f"{name}:retries")
+        return self.retry.backoff(attempt)
+
+    def call(self, fn, prompt, priority=BATCH):
+        """ fn()을 한도 안에서 실행합니다. 429/쿼터 초과면 백오프 후 재시도 """
+        tokens = estimate_tokens(prompt)
+        for attempt in range(self.retry.max_retries + 1):
+            self.acquire(tokens, priority)
+            try:
+                result = fn()
+            except Exception as e:
+                if not is_rate_limited(e):
+                    self.release()
+                    raise
+                backoff = self._rate_limit_backoff(attempt, priority)
+                self.release(rate_limited=True, backoff=backoff or 0.0)
+                if backoff is None:
+                    raise
+                continue
+            self.release()
+            return result
+
+    async def _aacquire(self, tokens, priority):
+        """
+        acquire의 asyncio 버전. 스레드를 잡아두지 않고 이벤트 루프에서 기다립니다.
+        release/다른 요청의 출발 때 call_soon_threadsafe로 깨우고, 버킷이 차기를 기다릴 때는 그 시간만큼만 잠듦
+        """
+        start = time.monotonic()
+        loop = asyncio.get_running_loop()
+        with self._cond:
+            entry = (priority, next(self._seq))
+            heapq.heappush(self._queue, entry)
+        try:
+            while True:
+                wake = loop.create_future()
+                with self._cond:
+                    now = time.monotonic()
+                    delay = self._ready_in(tokens, now) if self._queue[0] == entry else None
+                    if delay == 0:
+                        self._async_waiters.pop(entry, None)
+                        self._leave_locked(entry)
+                        self._take_locked(tokens)
+                        break
+                    self._async_waiters[entry] = (loop, wake)
+                await asyncio.wait([wake], timeout=delay)
+        except BaseException:
+            # 기다리다 취소됨: 자리를 잡기 전이므로 대기열에서만 빼고 다음 요청을 깨움
+            with self._cond:
+                self._async_waiters.pop(entry, None)
+                self._leave_locked(entry)
+                self._notify_locked()
+            raise
+        waited = time.monotonic() - start
+        self.stats.add_wait(priority, waited)
+        return waited
+
+    async def acall(self, fn, prompt, priority=BATCH):
+        """ call의 asyncio 버전. fn은 코루틴 함수 """
+        tokens = estimate_tokens(prompt)
+        for attempt in range(self.retry.max_retries + 1):
+            await self._aacquire(tokens, priority)
+            try:
+                result = await fn()
+            except Exception as e:
+                if not is_rate_limited(e):
+                    self.release()
+                    raise
+                backoff = self._rate_limit_backoff(attempt, priority)
+                self.release(rate_limited=True, backoff=backoff or 0.0)
+                if backoff is None:
+                    raise
+                continue
+            except BaseException:
+                # 호출부가 기다리다 취소한 경우 (asyncio.CancelledError)
+                self.release()
+                raise
+            self.release()
+            return result
+
+    def stream(self, fn, prompt, priority=BATCH):
+        """ fn()이 돌려주는 조각 이터레이터를 한도 안에서 흘려보냅니다. 첫 조각 전에 난 429만 재시도 """
+        tokens = estimate_tokens(prompt)
+        for attempt in range(self.retry.max_retries + 1):
+            self.acquire(tokens, priority)
+            started = False
+            try:
+                for chunk in fn():
+                    started = True
+                    yield chunk
+            except Exception as e:
+                if started or not is_rate_limited(e):
+                    self.release()
+                    raise
+                backoff = self._rate_limit_backoff(attempt, priority)
+                self.release(rate_limited=True, backoff=backoff or 0.0)
+                if backoff is None:
+                    raise
+                continue
+            except BaseException:
+                # 소비자가 스트림을 중간에 닫은 경우 (GeneratorExit)
+                self.release()
+                raise
+            self.release()
+            return
+
+    async def astream(self, fn, prompt, priority=BATCH):
+        """ stream의 asyncio 버전. fn()은 조각 async 이터레이터, 자리 대기는 _aacquire로 (이벤트 루프를 막지 않음) """
+        tokens = estimate_tokens(prompt)
+        for attempt in range(self.retry.max_retries + 1):
+            await self._aacquire(tokens, priority)
+            started = False
+            try:
+                async for chunk in fn():
+                    started = True
+                    yield chunk
+            except Exception as e:
+                if started or not is_rate_limited(e):
+                    self.release()
+                    raise
+                backoff = self._rate_limit_backoff(attempt, priority)
+                self.release(rate_limited=True, backoff=backoff or 0.0)
+                if backoff is None:
+                    raise
+                continue
+            except BaseException:
+                # 소비자가 스트림을 중간에 닫았거나 취소한 경우 (GeneratorExit, asyncio.CancelledError)
+                self.release()
+                raise
+            self.release()
+            return
+
+    def snapshot(self):
+        with self._cond:
+            state = {
+                "active": self._active,
+                "queued": len(self._queue),
+                "paused_for": round(max(0.0, self._paused_until - time.monotonic()), 3),
+                "rpm": round(self.requests.rate * 60, 1),
+                "tpm": round(self.tokens.rate * 60),
+            }
+        return {**state, **self.stats.snapshot()}
+
+
+_shared_scheduler = None
+_shared_lock = threading.Lock()
+
+
+def get_llm_scheduler():
+    """ 프로세스 전역 공용 LLMScheduler """
+    global _shared_scheduler
+    if _shared_scheduler is None:
+        with _shared_lock:
+            if _shared_scheduler is None:
+                _shared_scheduler = LLMScheduler()
+    return _shared_scheduler
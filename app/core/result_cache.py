@@ -0,0 +1,140 @@
+import asyncio
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+from app.core.http_client import HttpStats
+
+
+class ResultCacheStats(HttpStats):
+    """ hit/miss, 진행 중인 계산에 합류한 요청(coalesced), 만료/밀려난 항목 수 """
+    def snapshot(self):
+        with self._lock:
+            counts = dict(self._counts)
+        lookups = counts.get("hit", 0) + counts.get("miss", 0) + counts.get("coalesced", 0)
+        shared = counts.get("hit", 0) + counts.get("coalesced", 0)
+        counts["hit_ratio"] = round(counts.get("hit", 0) / lookups, 3) if lookups else 0.0
+        counts["shared_ratio"] = round(shared / lookups, 3) if lookups else 0.0
+        return counts
+
+
+class _Call:
+    """ 동기 single-flight: 먼저 온 요청이 계산하는 동안 같은 키의 요청들이 기다림 """
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class ResultCache:
+    """
+    짧은 TTL + 개수 제한 LRU 메모리 캐시와 single-flight
+    - 같은 키로 동시에 들어온 요청은 하나의 계산을 함께 기다림 (동기: 스레드, 비동기: asyncio 태스크)
+    - cacheable(result)가 참인 결과만 TTL 동안 저장 (실패/부분 결과는 합류한 요청끼리만 공유)
+    - 꺼낼 때마다 복사본을 돌려줘서 호출부가 수정해도 캐시 항목은 그대로
+    ttl이 0이면 저장하지 않고 single-flight만 합니다.
+    """
+    def __init__(self, ttl, max_entries, cacheable=None):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.cacheable = cacheable or (lambda result: True)
+        self.stats = ResultCacheStats()
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()   # key -> (저장 시각, 결과)
+        self._calls = {}                # key -> _Call (동기)
+        self._tasks = {}                # key -> asyncio.Task (비동기)
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] >= self.ttl:
+                del self._entries[key]
+                self.stats.incr("expired")
+                entry = None
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+        return copy.deepcopy(entry[1])
+
+    def put(self, key, result):
+        if self.ttl <= 0 or not self.cacheable(result):
+            self.stats.incr("not_stored")
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic(), copy.deepcopy(result))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats.incr("evicted")
+
+    def invalidate(self, key=None):
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def get_or_compute(self, key, fn):
+        """ 캐시에 있으면 복사본, 없으면 fn() (같은 키로 계산 중이면 그 결과를 기다림) """
+        found = self.get(key)
+        if found is not None:
+            self.stats.incr("hit")
+            return found
+
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+        if not leader:
+            self.stats.incr("coalesced")
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+
+        self.stats.incr("miss")
+        try:
+            call.result = fn()
+            self.put(key, call.result)
+            return copy.deepcopy(call.result)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    async def aget_or_compute(self, key, fn):
+        """
+        get_or_compute의 asyncio 버전. fn은 코루틴 함수
+        계산은 별도 태스크로 돌리므로, 먼저 온 요청이 취소돼도 합류한 요청들의 계산은 계속됩니다.
+        """
+        found = self.get(key)
+        if found is not None:
+            self.stats.incr("hit")
+            return found
+
+        task = self._tasks.get(key)
+        if task is None:
+            self.stats.incr("miss")
+            task = self._tasks[key] = asyncio.ensure_future(fn())
+            task.add_done_callback(lambda t: self._finish(key, t))
+        else:
+            self.stats.incr("coalesced")
+        return copy.deepcopy(await asyncio.shield(task))
+
+    def _finish(self, key, task):
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        if not task.cancelled() and task.exception() is None:
+            self.put(key, task.result())
+
+    def snapshot(self):
+        with self._lock:
+            size = len(self._entries)
+            in_flight = len(self._calls) + len(self._tasks)
+        return {"entries": size, "in_flight": in_flight, "ttl": self.ttl,
+                "max_entries": self.max_entries, **self.stats.snapshot()}
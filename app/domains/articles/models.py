@@ -1,5 +1,5 @@
-from sqlalchemy import Column, Integer, String, Text, Float, DateTime, ForeignKey, func, JSON
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, BigInteger, String, Text, Float, DateTime, ForeignKey, func, JSON
+from sqlalchemy.orm import relationship, backref
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from app.core.database import Base
 
@@ -49,3 +49,35 @@ class ArticleBody(Base):
 
     # 관계 설정
     article = relationship("Article", back_populates="body")
+
+class ArticleFingerprint(Base):
+    """
+    기사 본문 SimHash(64bit) 지문 테이블
+    - 실행이 달라도 URL만 다른 같은 기사(통신사 전재 등)를 본문을 다시 읽지 않고 찾기 위한 인덱스입니다.
+    - 지문을 16bit씩 4개 밴드로 나눠 각각 인덱스: 해밍 거리 3 이하면 적어도 한 밴드가 같음
+    """
+    __tablename__ = "article_fingerprints"
+
+    article_id = Column(Integer, ForeignKey("articles.id"), primary_key=True)
+    simhash = Column(BigInteger, nullable=False) # 64bit 지문 (부호 있는 정수로 저장)
+    band0 = Column(Integer, nullable=False, index=True)
+    band1 = Column(Integer, nullable=False, index=True)
+    band2 = Column(Integer, nullable=False, index=True)
+    band3 = Column(Integer, nullable=False, index=True)
+    duplicate_of_id = Column(Integer, ForeignKey("articles.id"), nullable=True) # 근중복으로 연결된 원본 기사
+    created_at = Column(DateTime, default=func.now())
+
+    article = relationship("Article", foreign_keys=[article_id], backref=backref("fingerprint", uselist=False))
+
+class ArticleTokens(Base):
+    """
+    기사 명사 토큰 저장소
+    - 분석 텍스트(제목 + 본문)의 해시로 찾으므로 본문이 바뀌면 해시가 달라져 다시 토큰화됩니다.
+    - 같은 본문(전재 기사 등)은 한 행을 같이 씁니다.
+    """
+    __tablename__ = "article_tokens"
+
+    content_hash = Column(String(64), primary_key=True) # sha256(토크나이저 버전 + 분석 텍스트)
+    tokenizer_version = Column(String, nullable=False)
+    nouns = Column(JSON, nullable=False) # 문서 순서대로 추출한 명사 리스트 (불용어 제외)
+    created_at = Column(DateTime, default=func.now())
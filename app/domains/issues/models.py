@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, func, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Float, LargeBinary, func, ForeignKey
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import ARRAY
 from app.core.database import Base
@@ -19,3 +19,38 @@ class IssueLabel(Base):
     created_at = Column(DateTime, default=func.now()) # 생성 일시
 
     articles = relationship("Article", back_populates="issue_label")
+
+
+class ClusteringRun(Base):
+    """
+    클러스터링 실행 기록
+    - full: analyze_weekly_top10 전체 재학습 / online: 새 기사를 기존 이슈 중심에 배정
+    - 전체 재학습 이후 online 실행들의 아웃라이어 비율과 유사도 변화로 재학습 필요 여부를 판단합니다.
+    """
+    __tablename__ = "clustering_runs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    kind = Column(String, nullable=False) # full / online
+    embedding_key = Column(String) # 임베딩 저장소 키 (모델@백엔드). 다르면 중심과 비교할 수 없음
+    n_articles = Column(Integer, default=0) # 처리한 기사 수
+    n_assigned = Column(Integer, default=0) # 이슈에 배정한 기사 수
+    n_outliers = Column(Integer, default=0) # 어느 이슈에도 가깝지 않은 기사 수
+    mean_similarity = Column(Float) # 배정된 기사와 이슈 중심의 평균 코사인 유사도
+    cursor = Column(String) # 수집 실행별 마지막으로 처리한 행 JSON {crawl_run: crawl_seq}
+    created_at = Column(DateTime, default=func.now())
+
+
+class IssueCentroid(Base):
+    """
+    이슈 임베딩 중심 테이블
+    - 전체 재학습 때 이슈에 속한 기사 임베딩의 정규화 평균을 저장하고, 주중에 들어온 기사를 가장 가까운 중심에 배정합니다.
+    """
+    __tablename__ = "issue_centroids"
+
+    issue_label_id = Column(Integer, ForeignKey("issue_labels.id"), primary_key=True)
+    run_id = Column(Integer, ForeignKey("clustering_runs.id"), nullable=False, index=True)
+    centroid = Column(LargeBinary, nullable=False) # float32 벡터 bytes
+    threshold = Column(Float, nullable=False) # 이 유사도 이상이어야 배정
+    n_articles = Column(Integer, default=0) # 중심을 만든 기사 수
+
+    issue_label = relationship("IssueLabel")
@@ -1,19 +1,21 @@
 from fastapi import APIRouter
 from fastapi.responses import StreamingResponse
-import google.generativeai as genai
 import time
 import json
+from app.core.llm_client import get_llm_client
+from app.core.llm_scheduler import INTERACTIVE
 
 router = APIRouter()
 
-model = genai.GenerativeModel('gemini-2.0-flash-exp')
+# 같은 프롬프트는 캐시에 저장한 조각을 그대로 다시 흘려보냄
+model = get_llm_client('gemini-2.0-flash-exp', priority=INTERACTIVE)
 
 async def stream_generator(prompt: str):
     # stream=True 옵션이 핵심! (한 번에 안 기다리고 줄 때마다 받음)
-    response = model.generate_content(prompt, stream=True)
+    # 동기 stream()은 스케줄러 대기를 이벤트 루프에서 하므로 async 버전 사용
+    response = model.astream(prompt)
     
-    for chunk in response:
-        text_chunk = chunk.text
+    async for text_chunk in response:
         
         data = json.dumps({"text": text_chunk}, ensure_ascii=False)
         yield f"data: {data}\n\n"
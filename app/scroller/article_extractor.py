@@ -0,0 +1,127 @@
+"""
+기사 상세 페이지 고속 추출기 (lxml)
+
+ranking_scroller.parse_article_detail(BeautifulSoup + html.parser)와 같은 결과를 돌려주되,
+- C로 구현된 lxml 파서를 쓰고
+- HTML을 조각(chunk) 단위로 흘려 넣다가 article:section 메타를 만나 '정치'가 아니면 즉시 중단합니다.
+  (랭킹 기사 대부분은 비정치라 본문까지 파싱할 필요가 없음)
+"""
+from lxml import etree
+
+TARGET_SECTION = "정치"
+FEED_CHUNK = 16 * 1024
+
+REMOVE_CLASSES = {"img_desc", "end_photo_org", "media_end_summary", "byline_s"}
+# BeautifulSoup get_text()가 무시하는 문자열 컨테이너 (script/style/template/ruby 주석)
+SKIP_TEXT_TAGS = {"script", "style", "template", "rt", "rp"}
+
+
+def _classes(el):
+    return (el.get("class") or "").split()
+
+
+def _collect_text(el, parts, remove_classes):
+    """ BeautifulSoup의 get_text(strip=True)와 같은 규칙으로 el 하위 텍스트를 모읍니다. """
+    if el.text:
+        text = el.text.strip()
+        if text: parts.append(text)
+    for child in el:
+        # 주석/처리명령은 tag가 문자열이 아님: 자기 텍스트는 버리고 tail만 사용
+        if isinstance(child.tag, str) and child.tag not in SKIP_TEXT_TAGS:
+            if not (remove_classes and remove_classes.intersection(_classes(child))):
+                _collect_text(child, parts, remove_classes)
+        if child.tail:
+            text = child.tail.strip()
+            if text: parts.append(text)
+    return parts
+
+
+def get_text_strip(el, remove_classes=None):
+    return "".join(_collect_text(el, [], remove_classes))
+
+
+class _Fallback(Exception):
+    """ 고속 경로가 확신할 수 없는 입력: 기준 구현(BeautifulSoup)으로 처리 """
+
+
+def _find_first(root):
+    """ 한 번의 순회로 필요한 요소들의 '문서 순서상 첫 번째'를 찾습니다. """
+    found = {}
+    for el in root.iter(tag=etree.Element):
+        tag = el.tag
+        if tag == "meta":
+            if el.get("property") == "og:image":
+                found.setdefault("og_image", el)
+        el_id = el.get("id")
+        if el_id == "dic_area":
+            found.setdefault("dic_area", el)
+        elif el_id == "newsct_article":
+            found.setdefault("newsct_article", el)
+        if "class" in el.attrib:
+            classes = _classes(el)
+            if "media_end_categorize_item" in classes:
+                found.setdefault("categorize", el)
+            if "media_end_head_info_datestamp" in classes and "date_span" not in found:
+                for span in el.iter("span"):
+                    if span is not el:
+                        found["date_span"] = span
+                        break
+    return found
+
+
+def extract_article_detail(html):
+    """
+    parse_article_detail과 같은 dict(section/content/image_url/pub_date) 또는 None.
+    확신할 수 없는 입력이면 _Fallback을 던집니다.
+    """
+    parser = etree.HTMLPullParser(events=("start",))
+    section = None
+    fed = 0
+    while fed < len(html) and section is None:
+        parser.feed(html[fed:fed + FEED_CHUNK])
+        fed += FEED_CHUNK
+        for _, el in parser.read_events():
+            if el.tag == "meta" and el.get("property") == "article:section":
+                if "content" not in el.attrib:
+                    return None # 기준 구현에서는 KeyError -> None
+                section = el.get("content")
+                break
+
+    # 🔥 비정치 기사는 여기서 끝: 나머지 HTML은 파싱하지 않음
+    if section is not None and section != TARGET_SECTION:
+        return None
+
+    if fed < len(html):
+        parser.feed(html[fed:])
+    root = parser.close()
+    if root is None:
+        raise _Fallback("empty document")
+    found = _find_first(root)
+
+    if section is None:
+        cat_tag = found.get("categorize")
+        section = get_text_strip(cat_tag) if cat_tag is not None else ""
+        if section != TARGET_SECTION:
+            return None
+
+    content_area = found.get("dic_area")
+    if content_area is None:
+        content_area = found.get("newsct_article")
+    content = get_text_strip(content_area, REMOVE_CLASSES) if content_area is not None else ""
+
+    img_tag = found.get("og_image")
+    if img_tag is not None and "content" not in img_tag.attrib:
+        return None
+    image_url = img_tag.get("content") if img_tag is not None else ""
+
+    date_tag = found.get("date_span")
+    if date_tag is not None and "data-date-time" not in date_tag.attrib:
+        return None
+    pub_date = date_tag.get("data-date-time") if date_tag is not None else ""
+
+    return {
+        "section": section,
+        "content": content,
+        "image_url": image_url,
+        "pub_date": pub_date
+    }
@@ -0,0 +1,84 @@
+import os
+from datetime import datetime
+
+import pandas as pd
+
+from app.scroller.fingerprint import simhash64, find_near_duplicate, make_fingerprint
+
+# ==========================================
+# [설정] 근중복 기사 처리
+# ==========================================
+# 이전에 저장한 기사와 본문 SimHash가 거의 같은 기사의 처리 (저장 단계 기본값)
+# - reject: 저장하지 않음 / link: 본문 없이 원본 기사에 연결해 저장 / 빈 값: 검사하지 않음 (기본, 모두 저장)
+# 지문은 검사 여부와 관계없이 저장하므로 나중에 켜도 이전 기사와 비교됩니다.
+NEAR_DUPLICATE_MODE = os.getenv("NEAR_DUPLICATE_MODE") or None
+
+# save_article 결과
+SAVED = "saved"
+LINKED = "linked"                  # 근중복: 본문 없이 원본 기사에 연결해 저장
+EXISTS = "exists"                  # 같은 URL이 이미 있음
+NEAR_DUPLICATE = "near_duplicate"  # 근중복이라 저장하지 않음 (reject)
+
+
+def get_or_create_publisher(db, press_name):
+    from app.domains.publishers.models import Publisher
+
+    publisher = db.query(Publisher).filter(Publisher.name == press_name).first()
+    if not publisher:
+        publisher = Publisher(name=press_name, code=press_name) # code가 없으면 name 사용
+        db.add(publisher)
+        db.flush()
+    return publisher
+
+
+def save_article(db, row_art, issue_label_id, near_duplicate=NEAR_DUPLICATE_MODE, **article_fields):
+    """
+    수집한 기사 행 하나를 이슈에 연결해 저장합니다. (기사 + 지문 + 본문, commit은 호출부에서)
+    - URL이 이미 있으면 건너뜀
+    - near_duplicate: "reject"면 이전 기사와 본문이 거의 같은 기사는 저장하지 않고, "link"면 본문 없이 원본에 연결
+      (None이면 검사하지 않음)
+    반환: (결과, Article 또는 None)
+    """
+    from app.domains.articles.models import Article, ArticleBody
+
+    publisher = get_or_create_publisher(db, row_art['press'])
+
+    # 1. 기사(Article) 중복 확인 (URL 기준)
+    if db.query(Article.id).filter(Article.url == row_art['link']).first():
+        return EXISTS, None
+
+    # 2. URL이 달라도 본문이 거의 같은 기사(통신사 전재 등) 확인: 지문 밴드 인덱스 조회만 함
+    fingerprint = simhash64(row_art['content'])
+    duplicate_of = None
+    if near_duplicate and fingerprint is not None:
+        found = find_near_duplicate(db, fingerprint)
+        if found is not None:
+            if near_duplicate == "reject":
+                return NEAR_DUPLICATE, None
+            duplicate_of = found[0]
+
+    article = Article(
+        issue_label_id=issue_label_id,
+        publisher_id=publisher.id,
+        title=row_art['title'],
+        url=row_art['link'],
+        image_urls=[row_art['image_url']] if row_art.get('image_url') else [],
+        published_at=pd.to_datetime(row_art['pub_date']),
+        analyzed_at=datetime.now(),
+        **article_fields
+    )
+    db.add(article)
+    db.flush()
+
+    if fingerprint is not None:
+        db.add(make_fingerprint(article.id, fingerprint, duplicate_of))
+        db.flush() # 같은 실행의 다음 기사 조회에도 잡히도록
+
+    # 연결된 사본은 본문을 원본과 공유하므로 저장하지 않음
+    if duplicate_of is not None:
+        return LINKED, article
+
+    # 3. 본문(ArticleBody) 저장
+    # content가 너무 길면 자르거나 처리 (Postgres TEXT는 1GB까지 가능하므로 괜찮음)
+    db.add(ArticleBody(article_id=article.id, raw_content=row_art['content']))
+    return SAVED, article
@@ -0,0 +1,200 @@
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime
+from urllib.parse import urlsplit
+
+import pandas as pd
+
+from app.core.http_client import AsyncHttpClient
+from app.core.html_cache import get_html_cache
+
+from app.scroller.crawl_index import DEFAULT_INDEX_PATH
+from app.scroller.section_filter import SectionPrefilter, REJECT, DEFAULT_VERIFY_RATE
+from app.scroller.ranking_scroller import (
+    TARGET_PRESS_DICT, DAYS_TO_CRAWL, NAVER_NEWS_BASE, HEADERS,
+    ranking_page_url, parse_ranking_items, parse_article_detail, is_settled, PoliticsNewsCollector,
+    iter_crawl_shards, open_crawl_index, ranking_cache_class
+)
+
+# ==========================================
+# [설정] 동시성
+# ==========================================
+# 전체 동시 요청 수
+DEFAULT_CONCURRENCY = 16
+# 호스트(news.naver.com, n.news.naver.com ...)별 동시 요청 수
+DEFAULT_PER_HOST = 8
+# 지금 처리 중인 기사 뒤로 미리 받아둘 상세 페이지 수
+DEFAULT_PREFETCH = 16
+
+
+class HostLimiter:
+    """ 전체 동시성 + 호스트별 동시성을 함께 제한하는 세마포어 묶음 """
+    def __init__(self, concurrency=DEFAULT_CONCURRENCY, per_host=DEFAULT_PER_HOST):
+        self._global = asyncio.Semaphore(concurrency)
+        self._per_host = per_host
+        self._hosts = {}
+
+    @asynccontextmanager
+    async def slot(self, url):
+        host = urlsplit(url).netloc
+        host_sem = self._hosts.setdefault(host, asyncio.Semaphore(self._per_host))
+        async with host_sem:
+            async with self._global:
+                yield
+
+
+async def fetch_text(client, limiter, url, cache=None, url_class=None):
+    async with limiter.slot(url):
+        if cache is not None:
+            res = await cache.afetch(url, url_class, client)
+        else:
+            res = await client.get(url)
+        return res.text
+
+
+async def fetch_article_detail(client, limiter, url, cache=None):
+    """ ranking_scroller.fetch_article_detail의 비동기 버전. 반환: (상세 또는 None, 확정 여부) """
+    try:
+        async with limiter.slot(url):
+            if cache is not None:
+                res = await cache.afetch(url, "article", client)
+            else:
+                res = await client.get(url)
+        html = res.text
+    except Exception:
+        return None, False
+    if res.status_code != 200:
+        return None, False
+    # 파싱은 CPU 작업이라 이벤트 루프를 막지 않도록 스레드에서 처리
+    detail = await asyncio.to_thread(parse_article_detail, html)
+    return detail, is_settled(res.status_code, html, detail)
+
+
+async def fetch_ranking_items(client, limiter, url, base_url, cache=None, url_class=None):
+    html = await fetch_text(client, limiter, url, cache, url_class)
+    return await asyncio.to_thread(parse_ranking_items, html, base_url)
+
+
+async def crawl_unique_politics_news_async(days=DAYS_TO_CRAWL, press_dict=TARGET_PRESS_DICT, today=None,
+                                           base_url=NAVER_NEWS_BASE, concurrency=DEFAULT_CONCURRENCY,
+                                           per_host=DEFAULT_PER_HOST, prefetch=DEFAULT_PREFETCH,
+                                           incremental=False, index_path=DEFAULT_INDEX_PATH, seed_db=False,
+                                           use_cache=False, prefilter=True, verify_rate=DEFAULT_VERIFY_RATE,
+                                           sink=None):
+    """
+    crawl_unique_politics_news와 같은 DataFrame을 돌려주는 asyncio 크롤러.
+    - 랭킹 페이지는 모두 동시에 요청합니다.
+    - 상세 페이지는 '원래 순서'대로 소비하되, 앞으로 필요할 것들을 prefetch개까지 미리 요청합니다.
+      그래서 중복 제거/언론사별 10개 제한 결과가 순차 크롤러와 정확히 같습니다.
+    - incremental / use_cache / prefilter / sink 옵션은 순차 크롤러와 같습니다.
+    """
+    today = today or datetime.now()
+    cache = get_html_cache() if use_cache else None
+    section_filter = SectionPrefilter(prefilter, verify_rate)
+    limiter = HostLimiter(concurrency, per_host)
+    index = None
+    collector = PoliticsNewsCollector(sink=sink)
+    if incremental:
+        index, done, rows = open_crawl_index(days, press_dict, today, index_path, seed_db)
+        collector = PoliticsNewsCollector(index=index, sink=sink)
+        collector.resume(done, rows)
+
+    shards = [
+        shard for shard in iter_crawl_shards(days, press_dict, today)
+        if not collector.is_done(shard[1].strftime("%Y-%m-%d"), shard[2])
+    ]
+
+    print(f"🚀 정치 뉴스 비동기 수집 시작 (동시 {concurrency}, 호스트별 {per_host})...\n")
+
+    client = AsyncHttpClient(headers=HEADERS, max_connections=concurrency)
+    try:
+        ranking_tasks = []
+        for _, target_date, _, oid in shards:
+            date_str = target_date.strftime("%Y%m%d")
+            ranking_tasks.append(asyncio.create_task(fetch_ranking_items(
+                client, limiter, ranking_page_url(oid, date_str, base_url), base_url,
+                cache, ranking_cache_class(date_str))))
+        detail_tasks = {}
+
+        def schedule(link):
+            if link not in detail_tasks:
+                detail_tasks[link] = asyncio.create_task(fetch_article_detail(client, limiter, link, cache))
+
+        def prefetch_from(shard_idx, pos):
+            """ 현재 위치부터 앞으로 소비될 후보들을 prefetch개까지 예약 (랭킹이 도착한 언론사까지만) """
+            budget = prefetch
+            for idx in range(shard_idx, len(shards)):
+                task = ranking_tasks[idx]
+                if not task.done(): return
+                if task.cancelled() or task.exception(): continue
+                start = pos if idx == shard_idx else 0
+                for item in task.result()[start:]:
+                    if budget <= 0: return
+                    if not collector.is_new(item['article_id']): continue
+                    # 사전 필터에 걸릴 기사는 미리 받지 않음 (검증 샘플 제외)
+                    if not section_filter.wants_detail(item): continue
+                    schedule(item['link'])
+                    budget -= 1
+
+        try:
+            for shard_idx, (day_offset, target_date, press_name, oid) in enumerate(shards):
+                display_date = target_date.strftime("%Y-%m-%d")
+                if shard_idx == 0 or shards[shard_idx - 1][0] != day_offset:
+                    print(f"📅 [Day {day_offset+1}/{days}] {display_date} 탐색 중...")
+
+                try:
+                    list_items = await ranking_tasks[shard_idx]
+                except Exception as e:
+                    print(f"   ⚠️ {press_name} 에러: {e}")
+                    collector.failed_shards += 1
+                    continue
+
+                collector.start_shard()
+                if not list_items:
+                    collector.finish_shard(display_date, press_name)
+                    continue
+
+                for pos, item in enumerate(list_items):
+                    if collector.is_full(): break
+                    if not collector.claim(item['article_id']):
+                        continue
+
+                    if section_filter.classify(item) == REJECT:
+                        collector.mark_seen(item['article_id'])
+                        if section_filter.should_verify(item):
+                            schedule(item['link'])
+                            section_filter.record_verification(*(await detail_tasks.pop(item['link'])))
+                        continue
+
+                    schedule(item['link'])
+                    prefetch_from(shard_idx, pos + 1)
+                    detail, settled = await detail_tasks.pop(item['link'])
+                    collector.accept(display_date, press_name, item, detail)
+                    if settled:
+                        collector.mark_seen(item['article_id'])
+
+                new_count = collector.finish_shard(display_date, press_name)
+                print(f"   ✅ {press_name}: 신규 {new_count}개 저장")
+        finally:
+            # 소비되지 않은 선요청은 정리
+            for task in list(detail_tasks.values()) + ranking_tasks:
+                task.cancel()
+            await asyncio.gather(*detail_tasks.values(), *ranking_tasks, return_exceptions=True)
+    finally:
+        await client.aclose()
+
+    if sink is not None:
+        sink.flush()
+        print(f"\n📦 {sink.root}: {sink.rows_written}건, 파일 {sink.files_written}개")
+    if index is not None:
+        # 실패한 구간이 있으면 실행을 열어두고 다음 실행에서 그 구간만 다시 수집
+        if collector.failed_shards == 0:
+            index.finish_run()
+        index.close()
+        print(f"\n⏭️ 인덱스로 건너뛴 상세 페이지: {collector.skipped_known}건")
+    if section_filter.enabled:
+        print(f"\n🧹 섹션 사전 필터: {section_filter.snapshot()}")
+    print(f"\n🔌 HTTP 통계: {client.stats.snapshot()}")
+    if cache is not None:
+        print(f"🗄️ HTML 캐시 통계: {cache.stats.snapshot()}")
+    return pd.DataFrame(collector.rows)
@@ -9,97 +9,86 @@ load_dotenv(os.path.join(BASE_DIR, ".env"))
 
 import pandas as pd
 import numpy as np
-from bertopic import BERTopic
-from sklearn.feature_extraction.text import CountVectorizer, TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-from hdbscan import HDBSCAN
-from umap import UMAP
-import google.generativeai as genai
-import time
+from sklearn.feature_extraction.text import CountVectorizer
 import re
 import json
-from itertools import combinations
-from collections import Counter
-from konlpy.tag import Okt
-from datetime import datetime
+from datetime import datetime, timedelta
+from app.scroller.crawl_sink import read_crawl_dataset, DEFAULT_SINK_DIR, ORDER_COLUMNS
+from app.scroller.dedup import remove_duplicates
+from app.scroller.fingerprint import simhash64, find_near_duplicate
+from app.scroller.article_writer import save_article, NEAR_DUPLICATE, LINKED, NEAR_DUPLICATE_MODE
+from app.scroller.tokenizer import tokenize, tokenize_batch
+from app.scroller.token_store import tokenize_with_store
+from app.scroller.embedding_store import EmbeddingStore
+from app.scroller.embedding import get_backend, store_key, topic_document
+from app.scroller.issue_labeler import generate_title, label_topics
+from app.scroller.topic_engine import build_topic_model, best_topic_prob, CLUSTER_MODE
+from app.scroller.issue_assign import compute_centroids, format_cursor, record_full_run
+from app.scroller.cooccurrence import count_cooccurrence, count_cooccurrence_reference, weighted_cooccurrence
 from app.core.database import SessionLocal, Base, engine
 from app.domains.issues.models import IssueLabel
-from app.domains.articles.models import Article, ArticleBody
+from app.domains.articles.models import Article, ArticleBody, ArticleTokens
 from app.domains.topics.models import Topic
 from app.domains.publishers.models import Publisher
 from app.domains.keywordrelation.models import KeywordRelation
 
-GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY") # .env 파일에서 로드
-genai.configure(api_key=GOOGLE_API_KEY)
+# 키워드 네트워크용 명사 추출 프로세스 수 (1 이하면 현재 프로세스에서, 0이면 CPU 수만큼)
+TOKENIZER_WORKERS = int(os.getenv("TOKENIZER_WORKERS", "1"))
+# 이슈 키워드 추출 방식
+# - "tokens": 이슈 기사 제목+본문 전체를 Okt로 명사 추출 (기본)
+# - "ctfidf": BERTopic 학습 때 만든 c-TF-IDF 가중치와 문서-단어 행렬을 그대로 사용 (재토큰화 없음)
+KEYWORD_MODE = os.getenv("KEYWORD_MODE", "tokens")
+# 임베딩 캐시를 쓰지 않으려면 0 (백엔드/스레드 수는 EMBEDDING_BACKEND, EMBEDDING_THREADS)
+USE_EMBEDDING_STORE = os.getenv("USE_EMBEDDING_STORE", "1") == "1"
+
+# 분석/저장에 쓰는 컬럼만 읽음 (section, collection_date 등은 읽지 않음)
+ANALYSIS_COLUMNS = ["press", "title", "content", "image_url", "pub_date", "link"]
 
 
 def remove_duplicates_fast(df, threshold=0.90):
-    if df.empty: return df
-    df = df.reset_index(drop=True)
-    
-    print(f"🧹 중복 제거 전: {len(df)}개")
-    tfidf = TfidfVectorizer(max_features=1000).fit_transform(
-        df['content'].str[:300].fillna('')
-    )
-    duplicates = set()
-    batch_size = 500
-    num_docs = len(df)
-    
-    for i in range(0, num_docs, batch_size):
-        batch_end = min(i + batch_size, num_docs)
-        similarities = cosine_similarity(tfidf[i:batch_end], tfidf)
-        for local_idx in range(batch_end - i):
-            global_idx = i + local_idx
-            if global_idx in duplicates: continue
-            target_indices = np.where(similarities[local_idx, global_idx+1:] > threshold)[0]
-            duplicates.update(target_indices + (global_idx + 1))
-            
-    df_clean = df.drop(index=list(duplicates)).reset_index(drop=True)
-    print(f"✨ 중복 제거 완료: {len(df_clean)}개")
-    return df_clean
+    """ 앞에서부터 코사인 유사도 threshold 초과인 뒤 기사를 제거 (LSH 후보 + 정확 검증, dedup 참고) """
+    return remove_duplicates(df, threshold)
 
 def simple_tokenizer(text):
     """ 
     Okt 형태소 분석기를 사용하여 '명사'만 추출합니다. 
     '단식을' -> '단식', '대표는' -> '대표' 로 깔끔하게 변환됩니다.
+    (공용 Okt 인스턴스와 불용어 집합을 쓰는 tokenizer 엔진에 위임)
     """
-    okt = Okt()
-    
-    # 1. 불용어 리스트 (계속 추가해서 관리하면 좋습니다)
-    stopwords = [
-        '뉴스', '종합', '속보', '기자', '특파원', '위해', '밝혔다', '대해', '관련', 
-        '오늘', '오후', '오전', '것으로', '따르면', '있는', '했다', '말했다',
-        '민주당', '국민의힘', '의원', '대통령', '대표', '무단전재', '배포', '금지',
-        '이날', '어제', '내일', '이번', '지난', '가장', '통해', '때문', '경우', 
-        '정도', '사실', '내용', '모두', '우리', '자신', '문제', '생각', '사람',
-        '그', '이', '저', '수', '것', '등', '안', '전', '후', '약', '중'
-    ]
-    
-    nouns = okt.nouns(str(text))
-    filtered_nouns = [n for n in nouns if n not in stopwords and len(n) >= 2]
-    
-    return filtered_nouns
+    return tokenize(text)
 
 
-def extract_issue_network(texts, top_n_nodes=20, top_n_edges=30):
+def extract_issue_network(texts, top_n_nodes=20, top_n_edges=30, tokenized=None, engine="sparse"):
     """
     특정 이슈에 속한 기사 텍스트들을 받아 '키워드 네트워크 JSON'을 생성합니다.
+    tokenized: texts를 미리 토큰화한 결과 (없으면 여기서 한 번에 배치 토큰화)
+    engine: "sparse" (기본, 희소 행렬) 또는 "reference" (기존 쌍 튜플 Counter 구현)
     """
-    edges = []
-    node_counter = Counter()
+    if tokenized is None:
+        tokenized = tokenize_batch(texts, workers=TOKENIZER_WORKERS)
 
-    for text in texts:
-        
-        tokens = list(set(simple_tokenizer(text)))
-        node_counter.update(tokens)
-        
-        for pair in combinations(tokens, 2):
-            edges.append(tuple(sorted(pair)))
+    if engine == "reference":
+        top_nodes, node_counter, edge_counts = count_cooccurrence_reference(tokenized, top_n_nodes, top_n_edges)
+    else:
+        top_nodes, node_counter, edge_counts = count_cooccurrence(tokenized, top_n_nodes, top_n_edges)
+    return _network_result(top_nodes, node_counter, edge_counts)
 
-    top_nodes = [node for node, count in node_counter.most_common(top_n_nodes)]
-    
-    edge_counts = Counter(edges).most_common(top_n_edges)
-    
+
+def extract_topic_network(topic_model, doc_term, topic_id, top_n_nodes=20, top_n_edges=30):
+    """
+    BERTopic이 학습 중에 계산한 토픽별 c-TF-IDF 가중치와 (같은 vectorizer로 만든) 이슈 문서-단어 행렬로
+    키워드 네트워크를 생성합니다. extract_issue_network와 같은 (graph_json, keyword_list, edge_counts)를 돌려줍니다.
+    doc_term: 해당 이슈 문서들의 행만 모은 문서 x 단어 행렬
+    """
+    vocab = topic_model.vectorizer_model.get_feature_names_out().tolist()
+    # c_tf_idf_ 행은 -1(아웃라이어) 토픽이 있으면 한 칸 밀려 있음
+    outliers = 1 if -1 in topic_model.get_topics() else 0
+    weights = topic_model.c_tf_idf_[topic_id + outliers].toarray().ravel()
+    top_nodes, node_counter, edge_counts = weighted_cooccurrence(weights, doc_term, vocab, top_n_nodes, top_n_edges)
+    return _network_result(top_nodes, node_counter, edge_counts)
+
+
+def _network_result(top_nodes, node_counter, edge_counts):
     network_data = {
         "nodes": [{"id": node, "count": node_counter[node]} for node in top_nodes],
         "links": [{"source": u, "target": v, "weight": w} 
@@ -112,30 +101,19 @@ def extract_issue_network(texts, top_n_nodes=20, top_n_edges=30):
     return json.dumps(network_data, ensure_ascii=False), keyword_list, edge_counts
 
 def generate_title_with_gemini(titles):
-    try:
-        model = genai.GenerativeModel('gemini-2.0-flash')
-        prompt = f"""
-        다음은 동일한 뉴스 사건에 대한 기사 제목들입니다:
-        {titles[:10]} (총 {len(titles)}건)
-
-        이 뉴스들을 모두 포괄하는 **하나의 간결하고 중립적인 이슈 제목**을 작성해주세요.
-        
-        [작성 규칙]
-        1. 15자 이내로 짧게 작성할 것.
-        2. 주관적이거나 자극적인 표현을 배제할 것 (중립적 어조).
-        3. '~논란', '~발표', '~개최' 등 명사형으로 끝맺을 것.
-        4. 따옴표나 설명 없이 오직 제목 텍스트만 출력할 것.
-        """
-        response = model.generate_content(prompt)
-        return response.text.strip().replace('"', '').replace("'", "")
-    except Exception as e:
-        print(f"   ⚠️ Gemini 호출 실패: {e}")
-        return titles[0]
+    """ 이슈 하나의 제목 생성 (실패하면 첫 기사 제목). 여러 이슈는 issue_labeler.label_topics로 한 번에 """
+    return generate_title(titles)
 
-def save_to_db(df_articles, top_topics, keyword_data_map):
+def save_to_db(df_articles, top_topics, keyword_data_map, near_duplicate=NEAR_DUPLICATE_MODE,
+               centroid_map=None, embedding_key=None, cursor=None):
     """
     분석된 이슈, 기사, 키워드 관계를 DB에 저장합니다.
     keyword_data_map: topic_id -> (graph_json, keyword_list, edge_counts) 매핑
+    centroid_map: topic_id -> 이슈 중심 (issue_assign.compute_centroids). 주면 전체 학습 실행으로 기록해
+      주중 새 기사를 재학습 없이 배정할 수 있게 함 (embedding_key: 중심을 만든 임베딩, cursor: 마지막 수집 위치)
+    near_duplicate: 이전 실행에서 저장한 기사와 본문 SimHash가 거의 같은 기사의 처리
+      - "reject": 저장하지 않음 / "link": 본문 없이 원본 기사에 연결해 저장 / None: 검사하지 않음
+      기본은 NEAR_DUPLICATE_MODE 환경변수 (없으면 None, 기존처럼 모두 저장)
     """
     print("\n💾 데이터베이스 저장 시작...")
     
@@ -143,6 +121,8 @@ def save_to_db(df_articles, top_topics, keyword_data_map):
     
     db = SessionLocal()
     saved_issue_count = 0
+    near_dup_count = 0
+    issue_centroids = {}
     
     try:
         
@@ -170,6 +150,8 @@ def save_to_db(df_articles, top_topics, keyword_data_map):
             )
             db.add(issue)
             db.flush() 
+            if centroid_map and topic_id in centroid_map:
+                issue_centroids[issue.id] = centroid_map[topic_id]
             
             today = datetime.now().date()
             for (u, v), w in edge_counts:
@@ -187,44 +169,23 @@ def save_to_db(df_articles, top_topics, keyword_data_map):
             topic_articles = df_articles.loc[topic_indices]
             topic_articles = topic_articles.sort_values(by='prob', ascending=False)
             
+            rejected = 0
             for rank, (_, row_art) in enumerate(topic_articles.iterrows(), 1):
-                press_name = row_art['press']
-                publisher = db.query(Publisher).filter(Publisher.name == press_name).first()
-                if not publisher:
-                    publisher = Publisher(name=press_name, code=press_name) # code가 없으면 name 사용
-                    db.add(publisher)
-                    db.flush()
-                
-                # 2. 기사(Article) 중복 확인 (URL 기준)
-                existing_article = db.query(Article).filter(Article.url == row_art['link']).first()
-                if existing_article:
-                    continue # 이미 있으면 스킵
-                
-                article = Article(
-                    topic_id=topic.id,
-                    issue_label_id=issue.id,
-                    publisher_id=publisher.id,
-                    title=row_art['title'],
-                    url=row_art['link'],
-                    image_urls=[row_art['image_url']] if row_art.get('image_url') else [],
-                    published_at=pd.to_datetime(row_art['pub_date']),
-                    analyzed_at=datetime.now()
-                )
-                db.add(article)
-                db.flush()
-                
-                # 3. 본문(ArticleBody) 저장
-                # content가 너무 길면 자르거나 처리 (Postgres TEXT는 1GB까지 가능하므로 괜찮음)
-                body = ArticleBody(
-                    article_id=article.id,
-                    raw_content=row_art['content']
-                )
-                db.add(body)
+                result, _ = save_article(db, row_art, issue.id, near_duplicate, topic_id=topic.id)
+                if result in (NEAR_DUPLICATE, LINKED):
+                    near_dup_count += 1
+                rejected += result == NEAR_DUPLICATE
+            # 이슈 기사 수는 클러스터 크기. 근중복으로 저장하지 않은(reject) 기사만 뺌
+            issue.total_count = int(count) - rejected
                 
             saved_issue_count += 1
             
+        if centroid_map is not None:
+            record_full_run(db, embedding_key, issue_centroids, cursor)
         db.commit()
         print(f"🎉 DB 저장 완료! 총 {saved_issue_count}개의 이슈가 저장되었습니다.")
+        if near_dup_count:
+            print(f"   🧬 이전 기사와 본문이 거의 같은 기사 {near_dup_count}건 ({near_duplicate})")
         
     except Exception as e:
         db.rollback()
@@ -236,13 +197,75 @@ def save_to_db(df_articles, top_topics, keyword_data_map):
         db.close()
 
 
-def analyze_weekly_top10(csv_path):
+def tokenize_analysis_texts(texts):
+    """ 저장된 토큰을 재사용하고 새 기사만 토큰화합니다. DB를 쓸 수 없으면 전부 토큰화 """
+    db = SessionLocal()
+    try:
+        # 처음 실행하는 DB면 article_tokens 테이블부터 만듦 (save_to_db보다 먼저 실행되므로)
+        Base.metadata.create_all(bind=engine, tables=[ArticleTokens.__table__])
+        tokens, (tokenized, reused) = tokenize_with_store(db, texts, workers=TOKENIZER_WORKERS)
+        print(f"🔤 토큰화 {tokenized}건, 저장된 토큰 재사용 {reused}건")
+        return tokens
+    except Exception as e:
+        db.rollback()
+        print(f"⚠️ 토큰 저장소를 쓸 수 없어 전부 토큰화합니다: {e}")
+        return tokenize_batch(texts, workers=TOKENIZER_WORKERS)
+    finally:
+        db.close()
+
+
+def embed_documents(docs, backend):
+    """ 이전 실행에서 인코딩한 문서는 저장소에서 읽고, 새 문서만 인코딩합니다. (모델은 필요할 때만 올림) """
+    if not USE_EMBEDDING_STORE:
+        return backend.encode(docs)
+    with EmbeddingStore(store_key(backend)) as store:
+        embeddings = store.embed(docs, backend.encode)
+        stats = store.stats()
+    print(f"🧠 임베딩 캐시 hit {stats['hits']}건, 새로 인코딩 {stats['misses']}건 (저장소 {stats['rows']}건)")
+    return embeddings
+
+
+def load_articles(source, start_date=None, end_date=None):
+    """
+    source가 crawl_sink 데이터셋 디렉터리면 필요한 컬럼과 날짜 범위만 읽고,
+    CSV 파일이면 기존처럼 전체를 읽습니다.
+    """
+    if os.path.isdir(source):
+        # 수집 순서 컬럼은 전체 학습 이후의 새 기사를 찾는 위치(cursor) 기록용
+        return read_crawl_dataset(source, columns=ANALYSIS_COLUMNS + ORDER_COLUMNS,
+                                  start_date=start_date, end_date=end_date)
+    return pd.read_csv(source)
+
+
+def drop_stored_duplicates(df):
+    """ 이전 실행에서 이미 저장한 기사와 본문 지문이 거의 같은 행을 뺍니다. (DB 지문 인덱스만 조회) """
+    db = SessionLocal()
+    try:
+        stored = [
+            fp is not None and find_near_duplicate(db, fp) is not None
+            for fp in (simhash64(c) for c in df['content'])
+        ]
+    finally:
+        db.close()
+    print(f"🧬 이미 저장된 기사와 겹치는 {sum(stored)}건 제외")
+    return df[[not s for s in stored]].reset_index(drop=True)
+
+
+def analyze_weekly_top10(source, start_date=None, end_date=None, skip_stored_duplicates=False, cluster_mode=None):
+    """
+    cluster_mode: "full" (UMAP + HDBSCAN, 기본) 또는 "fast" (PCA/랜덤 투영 + MiniBatchKMeans, 대용량용)
+    없으면 CLUSTER_MODE 환경변수
+    """
+    cluster_mode = cluster_mode or CLUSTER_MODE
     print("데이터 로딩 중")
-    df = pd.read_csv(csv_path)
+    df = load_articles(source, start_date, end_date)
+    cursor = format_cursor(df)
     
     df_clean = remove_duplicates_fast(df)
+    if skip_stored_duplicates:
+        df_clean = drop_stored_duplicates(df_clean)
     
-    print("BERTopic 학습 시작")
+    print(f"BERTopic 학습 시작 ({cluster_mode})")
     
     korean_stopwords = [
         "뉴스", "종합", "속보", "기자", "특파원", "위해", "밝혔다", "대해", "관련", 
@@ -251,28 +274,18 @@ def analyze_weekly_top10(csv_path):
     ]
     vectorizer = CountVectorizer(stop_words=korean_stopwords)
     
-    hdbscan_model = HDBSCAN(min_cluster_size=7, min_samples=3, prediction_data=True)
-    
-    topic_model = BERTopic(
-        embedding_model="snunlp/KR-SBERT-V40K-klueNLI-augSTS",
-        vectorizer_model=vectorizer,
-        hdbscan_model=hdbscan_model,   
-        nr_topics="auto",
-        min_topic_size=7,
-        calculate_probabilities=True,
-        verbose=True
-    )
-    
-    docs = [str(t) + " " + str(t) + " " + str(t) + " " + str(c)[:100] 
-            for t, c in zip(df_clean['title'], df_clean['content'])]
+    docs = [topic_document(t, c) for t, c in zip(df_clean['title'], df_clean['content'])]
+    embedding_backend = get_backend()
+    embeddings = embed_documents(docs, embedding_backend)
+
+    # 임베딩을 넘기므로 모델은 인코딩에 쓰이지 않음 (전부 캐시 hit이면 모델을 올리지 않음)
+    topic_model = build_topic_model(cluster_mode, vectorizer, embedding_backend.sentence_transformer, verbose=True)
             
-    topics, probs = topic_model.fit_transform(docs)
+    topics, probs = topic_model.fit_transform(docs, embeddings=embeddings)
     
     df_clean['topic_id'] = topics
-    if probs is not None and len(probs.shape) > 1:
-        df_clean['prob'] = np.max(probs, axis=1)
-    else:
-        df_clean['prob'] = 1.0
+    # full은 문서 x 토픽 확률 행렬, fast는 최선 토픽 확률만 돌려줌
+    df_clean['prob'] = best_topic_prob(probs, len(df_clean))
 
     print("\n이슈 분석 및 키워드 추출 중...")
     
@@ -280,8 +293,29 @@ def analyze_weekly_top10(csv_path):
     top_topics = topic_info[topic_info['Topic'] != -1].head(15).copy() # 복사본 사용
     
     keyword_data_map = {} 
+
+    topic_texts = {}
+    topic_tokens = {}
+    if KEYWORD_MODE == "ctfidf":
+        # 학습에 쓴 vectorizer 어휘로 문서-단어 행렬만 만듦 (본문 전체를 다시 읽지 않음)
+        doc_term = topic_model.vectorizer_model.transform(docs).tocsr()
+    else:
+        # 상위 이슈들의 분석 텍스트를 한 번에 배치 토큰화 (이슈마다 따로 하지 않고, 이전 실행에서 토큰화한 기사는 재사용)
+        for idx, row in top_topics.iterrows():
+            if row['Count'] < 7: continue
+            topic_articles = df_clean[df_clean['topic_id'] == row['Topic']]
+            topic_texts[row['Topic']] = (topic_articles['title'] + " " + topic_articles['content'].fillna('')).tolist()
+        flat_tokens = iter(tokenize_analysis_texts([t for texts in topic_texts.values() for t in texts]))
+        topic_tokens = {topic_id: [next(flat_tokens) for _ in texts] for topic_id, texts in topic_texts.items()}
     
     print(f"\n최종 이슈 리스트 추론 중:")
+
+    # 1) Gemini 제목 생성: 상위 이슈 전체를 한 번에 요청 (LABEL_MODE=single이면 이슈마다)
+    topic_titles = {
+        row['Topic']: df_clean.loc[df_clean['topic_id'] == row['Topic'], 'title'].tolist()
+        for _, row in top_topics.iterrows() if row['Count'] >= 7
+    }
+    ai_labels, _ = label_topics(topic_titles)
     
     for idx, row in top_topics.iterrows():
         topic_id = row['Topic']
@@ -291,26 +325,34 @@ def analyze_weekly_top10(csv_path):
 
         # 해당 이슈의 기사들 추출
         topic_indices = df_clean[df_clean['topic_id'] == topic_id].index
-        topic_articles = df_clean.loc[topic_indices]
-        topic_titles = topic_articles['title'].tolist()
         
-        # 1) Gemini 제목 생성
-        time.sleep(1.0) 
-        ai_label = generate_title_with_gemini(topic_titles)
+        ai_label = ai_labels[topic_id]
         top_topics.at[idx, 'ai_label'] = ai_label # DataFrame에 저장
         
         # 2) [NEW] 키워드 네트워크 데이터 생성 (JSON)
         # 제목과 본문을 합쳐서 분석 텍스트 준비
-        analysis_texts = (topic_articles['title'] + " " + topic_articles['content'].fillna('')).tolist()
-        graph_json, keyword_list, edge_counts = extract_issue_network(analysis_texts)
+        if KEYWORD_MODE == "ctfidf":
+            graph_json, keyword_list, edge_counts = extract_topic_network(
+                topic_model, doc_term[df_clean.index.get_indexer(topic_indices)], topic_id)
+        else:
+            analysis_texts = topic_texts[topic_id]
+            graph_json, keyword_list, edge_counts = extract_issue_network(analysis_texts, tokenized=topic_tokens[topic_id])
         
         keyword_data_map[topic_id] = (graph_json, keyword_list, edge_counts)
             
         print(f"   [{idx+1}위] {ai_label} (기사 {count}건)")
         print(f"       ㄴ 핵심 키워드: {', '.join(keyword_list[:5])}...")
         
+    # 주중 새 기사 배정용 이슈 중심 (issue_assign.py)
+    centroid_map = compute_centroids(embeddings, topics, list(keyword_data_map))
+
     # DB 저장 호출
-    save_to_db(df_clean, top_topics, keyword_data_map)
+    save_to_db(df_clean, top_topics, keyword_data_map,
+               centroid_map=centroid_map, embedding_key=store_key(embedding_backend), cursor=cursor)
 
 if __name__ == "__main__":
-    analyze_weekly_top10("weekly_politics_news_clean.csv")
\ No newline at end of file
+    if os.path.isdir(DEFAULT_SINK_DIR):
+        week_start = (datetime.now() - timedelta(days=6)).strftime("%Y-%m-%d")
+        analyze_weekly_top10(DEFAULT_SINK_DIR, start_date=week_start)
+    else:
+        analyze_weekly_top10("weekly_politics_news_clean.csv")
\ No newline at end of file
@@ -0,0 +1,183 @@
+from itertools import combinations
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+# ==========================================
+# [설정] 키워드 동시 출현
+# ==========================================
+# 처음에 동시 출현을 세어볼 후보 노드 수 (문서 빈도 상위). 모자라면 4배씩 늘림
+INITIAL_CANDIDATES = 128
+CANDIDATE_GROWTH = 4
+# c-TF-IDF 모드에서 엣지를 세어볼 단어 수 (토픽 가중치 상위)
+CTFIDF_CANDIDATES = 200
+
+
+def count_cooccurrence_reference(tokenized, top_n_nodes=20, top_n_edges=30):
+    """ 기준 구현: 문서마다 모든 명사 쌍 튜플을 만들어 Counter로 셉니다. O(문서당 명사 수^2) """
+    edges = []
+    node_counter = Counter()
+
+    for doc_tokens in tokenized:
+        tokens = list(set(doc_tokens))
+        node_counter.update(tokens)
+
+        for pair in combinations(tokens, 2):
+            edges.append(tuple(sorted(pair)))
+
+    top_nodes = [node for node, count in node_counter.most_common(top_n_nodes)]
+    edge_counts = Counter(edges).most_common(top_n_edges)
+    return top_nodes, dict(node_counter), edge_counts
+
+
+def _doc_term_matrix(tokenized):
+    """
+    문서 x 명사 이진 행렬(CSR)과 어휘. 어휘 번호는 처음 등장한 순서(= 기준 구현 Counter의 삽입 순서)이고,
+    각 행 안의 열 순서는 기준 구현과 같은 list(set(tokens)) 순서입니다.
+    """
+    doc_terms = [list(set(doc_tokens)) for doc_tokens in tokenized]
+    lengths = np.fromiter((len(t) for t in doc_terms), dtype=np.int64, count=len(doc_terms))
+    flat = [token for terms in doc_terms for token in terms]
+    if flat:
+        codes, vocab = pd.factorize(pd.Series(flat, dtype=object), sort=False)
+    else:
+        codes, vocab = np.empty(0, dtype=np.int64), pd.Index([], dtype=object)
+    indptr = np.r_[0, np.cumsum(lengths)]
+    matrix = sparse.csr_matrix((np.ones(len(codes), dtype=np.int32), codes, indptr),
+                               shape=(len(doc_terms), len(vocab)))
+    return matrix, list(vocab)
+
+
+def _top_by_count(counts, n):
+    """ 개수 내림차순 상위 n개 번호 (같은 개수는 번호 순 = most_common과 같은 순서) """
+    order = np.argsort(-counts, kind="stable")
+    return order[:n]
+
+
+def _candidate_pairs(matrix, node_order, doc_freq, top_n_edges):
+    """
+    문서 빈도 상위 후보 노드끼리의 쌍 개수를 희소 행렬 곱 한 번으로 셉니다.
+    후보 밖 노드가 낀 쌍의 개수는 후보 밖 최대 문서 빈도 이하이므로, 후보 안 top_n_edges번째 개수가
+    그보다 크면 전체 상위 쌍은 모두 후보 안에 있습니다. 아니면 후보를 늘립니다.
+    반환: (노드 번호 lo, hi, 개수) lo < hi
+    """
+    n_nodes = len(node_order)
+    k = min(INITIAL_CANDIDATES, n_nodes)
+    while True:
+        nodes = np.sort(node_order[:k])
+        sub = matrix[:, nodes]
+        co = sparse.triu(sub.T @ sub, k=1).tocoo()
+        lo, hi, counts = nodes[co.row], nodes[co.col], co.data.astype(np.int64)
+        if k == n_nodes:
+            return lo, hi, counts
+        outside = doc_freq[node_order[k]]
+        if len(counts) >= top_n_edges and np.partition(counts, -top_n_edges)[-top_n_edges] > outside:
+            return lo, hi, counts
+        k = min(k * CANDIDATE_GROWTH, n_nodes)
+
+
+def _first_occurrence(matrix, lo, hi, must_find, wanted_ties):
+    """
+    기준 구현이 쌍을 처음 만나는 순서(문서 순 -> 문서 안 combinations 순)로 쌍 번호를 돌려줍니다.
+    must_find 개(앞쪽 쌍)는 모두 찾고, 나머지(동점 후보)는 처음 만난 wanted_ties 개까지만 찾습니다.
+    """
+    n_vocab = matrix.shape[1]
+    a, b = np.minimum(lo, hi), np.maximum(lo, hi)
+    codes = a * n_vocab + b
+    lookup = np.argsort(codes)
+    sorted_codes = codes[lookup]
+    in_pairs = np.zeros(n_vocab, dtype=bool)
+    in_pairs[lo] = True
+    in_pairs[hi] = True
+
+    seen = np.zeros(len(codes), dtype=bool)
+    order = []
+    found_required = found_ties = 0
+    for d in range(matrix.shape[0]):
+        if found_required == must_find and found_ties >= wanted_ties:
+            break
+        terms = matrix.indices[matrix.indptr[d]:matrix.indptr[d + 1]]
+        terms = terms[in_pairs[terms]]
+        if len(terms) < 2:
+            continue
+        i, j = np.triu_indices(len(terms), k=1)
+        x, y = terms[i], terms[j]
+        doc_codes = np.minimum(x, y) * n_vocab + np.maximum(x, y)
+        pos = np.searchsorted(sorted_codes, doc_codes)
+        pos[pos >= len(sorted_codes)] = 0
+        hit = sorted_codes[pos] == doc_codes
+        for p in lookup[pos[hit]]:
+            if seen[p]:
+                continue
+            seen[p] = True
+            order.append(p)
+            if p < must_find:
+                found_required += 1
+            else:
+                found_ties += 1
+    return order
+
+
+def count_cooccurrence(tokenized, top_n_nodes=20, top_n_edges=30):
+    """
+    count_cooccurrence_reference와 같은 결과(동점 순서 포함)를 희소 행렬로 계산합니다.
+    - 문서 x 명사 이진 행렬을 만들고, 문서 빈도 상위 후보 노드로 제한한 뒤 X^T X 한 번으로 쌍 개수를 셉니다.
+    - 동점 순서는 기준 구현처럼 처음 등장한 순서로 정합니다.
+    """
+    matrix, vocab = _doc_term_matrix(tokenized)
+    doc_freq = np.asarray(matrix.sum(axis=0)).ravel().astype(np.int64)
+    node_counts = dict(zip(vocab, doc_freq.tolist()))
+    top_nodes = [vocab[i] for i in _top_by_count(doc_freq, top_n_nodes)]
+    if top_n_edges <= 0 or len(vocab) < 2:
+        return top_nodes, node_counts, []
+
+    node_order = np.argsort(-doc_freq, kind="stable")
+    lo, hi, counts = _candidate_pairs(matrix, node_order, doc_freq, top_n_edges)
+    if not len(counts):
+        return top_nodes, node_counts, []
+
+    # 상위 top_n_edges의 경계 개수: 그보다 큰 쌍은 모두 포함, 같은 쌍은 처음 등장한 순서로 채움
+    cutoff = np.partition(counts, -top_n_edges)[-top_n_edges] if len(counts) >= top_n_edges else counts.min()
+    above = np.flatnonzero(counts > cutoff)
+    ties = np.flatnonzero(counts == cutoff)
+    wanted_ties = min(top_n_edges - len(above), len(ties))
+    selected = np.r_[above, ties]
+    order = _first_occurrence(matrix, lo[selected], hi[selected], len(above), wanted_ties)
+
+    first_seen = {p: rank for rank, p in enumerate(order)}
+    chosen = list(range(len(above))) + [p for p in order if p >= len(above)][:wanted_ties]
+    chosen.sort(key=lambda p: (-counts[selected[p]], first_seen[p]))
+
+    edge_counts = []
+    for p in chosen:
+        u, v = sorted((vocab[lo[selected[p]]], vocab[hi[selected[p]]]))
+        edge_counts.append(((u, v), int(counts[selected[p]])))
+    return top_nodes, node_counts, edge_counts
+
+
+def weighted_cooccurrence(term_weights, doc_term, vocab, top_n_nodes=20, top_n_edges=30,
+                          candidates=CTFIDF_CANDIDATES):
+    """
+    이미 계산된 단어 가중치(BERTopic c-TF-IDF 한 행)와 문서 x 단어 행렬로 키워드 네트워크를 만듭니다. (재토큰화 없음)
+    - 노드: 가중치 상위 top_n_nodes (개수는 이슈 안 문서 빈도)
+    - 엣지: 가중치 상위 candidates개 단어끼리 X^T X로 센 동시 출현 (같은 개수면 두 단어 가중치 합이 큰 순)
+    """
+    term_weights = np.asarray(term_weights, dtype=np.float64).ravel()
+    ranked = np.argsort(-term_weights, kind="stable")
+    ranked = ranked[term_weights[ranked] > 0]
+    binary = (sparse.csr_matrix(doc_term) > 0).astype(np.int32)
+    doc_freq = np.asarray(binary.sum(axis=0)).ravel()
+
+    top = ranked[:top_n_nodes]
+    top_nodes = [vocab[i] for i in top]
+    node_counts = {vocab[i]: int(doc_freq[i]) for i in top}
+
+    cand = np.sort(ranked[:max(candidates, top_n_nodes)])
+    sub = binary[:, cand]
+    co = sparse.triu(sub.T @ sub, k=1).tocoo()
+    lo, hi, counts = cand[co.row], cand[co.col], co.data.astype(np.int64)
+    order = np.lexsort((-(term_weights[lo] + term_weights[hi]), -counts))[:top_n_edges]
+    edge_counts = [(tuple(sorted((vocab[lo[k]], vocab[hi[k]]))), int(counts[k])) for k in order]
+    return top_nodes, node_counts, edge_counts
@@ -0,0 +1,185 @@
+import os
+import json
+import sqlite3
+from datetime import datetime
+from urllib.parse import urlsplit, parse_qs
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEFAULT_INDEX_PATH = os.path.join(BASE_DIR, "data", "crawl_index.sqlite3")
+
+# lookup 결과
+SEEN_ONLY = "seen"            # 예전에 상세 페이지까지 봤지만 수집하지 않은 기사 (비정치 등)
+COLLECTED = "collected"       # 예전에 수집했거나 DB에 이미 있는 기사
+
+
+def naver_article_id(link):
+    """
+    네이버 기사 URL을 'oid/aid' 형태로 정규화합니다. 인식할 수 없으면 None
+    - https://n.news.naver.com/article/028/0002674384?sid=100 -> '028/0002674384'
+    - https://news.naver.com/main/ranking/read.naver?...&oid=028&aid=0002787755 -> '028/0002787755'
+    """
+    if not link:
+        return None
+    if "/article/" in link:
+        parts = link.split("/article/")[1].split("?")[0].split("/")
+        if len(parts) >= 2 and parts[0] and parts[1]:
+            return f"{parts[0]}/{parts[1]}"
+    qs = parse_qs(urlsplit(link).query)
+    if "oid" in qs and "aid" in qs:
+        return f"{qs['oid'][0]}/{qs['aid'][0]}"
+    return None
+
+
+class CrawlIndex:
+    """
+    증분/재개 크롤링용 영구 인덱스 (SQLite)
+    - seen_articles: 한 번이라도 상세 페이지를 본 기사 id와 수집 여부
+    - crawl_runs / crawl_cursor / crawl_rows: 실행 단위 체크포인트. (날짜, 언론사) 단위로 커밋되며,
+      중단된 실행은 마지막으로 끝난 조합 다음부터 이어서 수집합니다.
+    """
+    def __init__(self, path=DEFAULT_INDEX_PATH):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS seen_articles (
+                article_id TEXT PRIMARY KEY,
+                collected INTEGER NOT NULL,
+                run_id INTEGER,
+                first_seen TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS crawl_runs (
+                run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                run_key TEXT NOT NULL,
+                started_at TEXT NOT NULL,
+                finished_at TEXT
+            );
+            CREATE TABLE IF NOT EXISTS crawl_cursor (
+                run_id INTEGER NOT NULL,
+                collection_date TEXT NOT NULL,
+                press TEXT NOT NULL,
+                completed_at TEXT NOT NULL,
+                PRIMARY KEY (run_id, collection_date, press)
+            );
+            CREATE TABLE IF NOT EXISTS crawl_rows (
+                run_id INTEGER NOT NULL,
+                seq INTEGER NOT NULL,
+                payload TEXT NOT NULL,
+                PRIMARY KEY (run_id, seq)
+            );
+            CREATE TABLE IF NOT EXISTS index_meta (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            );
+        """)
+        self.conn.commit()
+        self.run_id = None
+
+    # ------------------------------------------
+    # 기사 id 인덱스
+    # ------------------------------------------
+    def lookup(self, article_id):
+        """ (상태, 기록한 run_id) 또는 None """
+        row = self.conn.execute(
+            "SELECT collected, run_id FROM seen_articles WHERE article_id = ?", (article_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        return (COLLECTED if row[0] else SEEN_ONLY), row[1]
+
+    def add_articles(self, article_ids, collected, run_id=None):
+        now = datetime.now().isoformat(timespec="seconds")
+        # 수집 여부는 한 번 True가 되면 유지
+        self.conn.executemany(
+            """INSERT INTO seen_articles (article_id, collected, run_id, first_seen) VALUES (?, ?, ?, ?)
+               ON CONFLICT(article_id) DO UPDATE SET collected = MAX(collected, excluded.collected)""",
+            [(aid, int(collected), run_id, now) for aid in article_ids]
+        )
+
+    def seed_from_db(self):
+        """ articles 테이블에 이미 저장된 기사들을 '수집됨'으로 등록합니다. (마지막으로 본 id 이후만) """
+        from app.core.database import SessionLocal
+        from app.domains.articles.models import Article
+        from app.domains.issues.models import IssueLabel  # noqa: F401 (관계 매핑 등록용)
+        from app.domains.publishers.models import Publisher  # noqa: F401
+
+        row = self.conn.execute("SELECT value FROM index_meta WHERE key = 'db_seeded_max_id'").fetchone()
+        last_id = int(row[0]) if row else 0
+
+        db = SessionLocal()
+        try:
+            rows = db.query(Article.id, Article.url).filter(Article.id > last_id).all()
+        finally:
+            db.close()
+
+        ids = [aid for aid in (naver_article_id(url) for _, url in rows) if aid]
+        self.add_articles(ids, collected=True)
+        if rows:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO index_meta (key, value) VALUES ('db_seeded_max_id', ?)",
+                (str(max(article_id for article_id, _ in rows)),)
+            )
+        self.conn.commit()
+        return len(ids)
+
+    # ------------------------------------------
+    # 실행 체크포인트
+    # ------------------------------------------
+    def start_or_resume(self, run_key):
+        """
+        같은 run_key로 끝나지 않은 실행이 있으면 이어서, 없으면 새로 시작합니다.
+        반환: (완료된 (날짜, 언론사) 집합, 이미 수집된 행 목록)
+        """
+        row = self.conn.execute(
+            "SELECT run_id FROM crawl_runs WHERE run_key = ? AND finished_at IS NULL ORDER BY run_id DESC LIMIT 1",
+            (run_key,)
+        ).fetchone()
+        if row is None:
+            cur = self.conn.execute(
+                "INSERT INTO crawl_runs (run_key, started_at) VALUES (?, ?)",
+                (run_key, datetime.now().isoformat(timespec="seconds"))
+            )
+            self.conn.commit()
+            self.run_id = cur.lastrowid
+            return set(), []
+
+        self.run_id = row[0]
+        done = {
+            (d, p) for d, p in self.conn.execute(
+                "SELECT collection_date, press FROM crawl_cursor WHERE run_id = ?", (self.run_id,))
+        }
+        rows = [
+            json.loads(payload) for (payload,) in self.conn.execute(
+                "SELECT payload FROM crawl_rows WHERE run_id = ? ORDER BY seq", (self.run_id,))
+        ]
+        return done, rows
+
+    def complete_shard(self, collection_date, press, rows, seen_ids, collected_ids):
+        """ 한 (날짜, 언론사)의 결과와 본 기사 id를 한 트랜잭션으로 커밋합니다. """
+        with self.conn:
+            seq = self.conn.execute(
+                "SELECT COALESCE(MAX(seq), -1) + 1 FROM crawl_rows WHERE run_id = ?", (self.run_id,)
+            ).fetchone()[0]
+            self.conn.executemany(
+                "INSERT INTO crawl_rows (run_id, seq, payload) VALUES (?, ?, ?)",
+                [(self.run_id, seq + i, json.dumps(r, ensure_ascii=False)) for i, r in enumerate(rows)]
+            )
+            self.add_articles([a for a in seen_ids if a not in collected_ids], collected=False, run_id=self.run_id)
+            self.add_articles(collected_ids, collected=True, run_id=self.run_id)
+            self.conn.execute(
+                "INSERT OR REPLACE INTO crawl_cursor (run_id, collection_date, press, completed_at) VALUES (?, ?, ?, ?)",
+                (self.run_id, collection_date, press, datetime.now().isoformat(timespec="seconds"))
+            )
+
+    def finish_run(self):
+        with self.conn:
+            self.conn.execute(
+                "UPDATE crawl_runs SET finished_at = ? WHERE run_id = ?",
+                (datetime.now().isoformat(timespec="seconds"), self.run_id)
+            )
+            # 끝난 실행의 행은 결과로 반환됐으니 정리
+            self.conn.execute("DELETE FROM crawl_rows WHERE run_id = ?", (self.run_id,))
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,351 @@
+import sys
+import os
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(BASE_DIR)
+
+import json
+import time
+import socket
+import sqlite3
+import argparse
+import multiprocessing
+from datetime import datetime
+
+import pandas as pd
+
+from app.core.http_client import get_http_client
+from app.core.html_cache import get_html_cache
+from app.scroller.section_filter import SectionPrefilter, DEFAULT_VERIFY_RATE
+from app.scroller.ranking_scroller import (
+    TARGET_PRESS_DICT, DAYS_TO_CRAWL, NAVER_NEWS_BASE, REQUEST_DELAY, MAX_PER_PRESS,
+    PoliticsNewsCollector, iter_crawl_shards, crawl_run_key, fetch_ranking_page, collect_shard
+)
+
+DEFAULT_QUEUE_PATH = os.path.join(BASE_DIR, "data", "crawl_queue.sqlite3")
+# 워커가 이 시간 안에 끝내지 못하면(죽었거나 멈춤) 다른 워커가 그 구간을 다시 가져감
+DEFAULT_LEASE_SECONDS = 300
+# 구간별 최대 시도 횟수. 넘으면 failed로 남김
+MAX_ATTEMPTS = 3
+# 가져갈 구간이 없을 때 다시 확인하는 간격 (초)
+IDLE_POLL = 0.2
+
+PENDING, LEASED, DONE, FAILED = "pending", "leased", "done", "failed"
+
+
+class ShardQueue:
+    """
+    (날짜, 언론사) 구간을 담는 SQLite 기반 작업 큐 (lease 방식)
+    - 워커는 구간을 lease_seconds 동안 빌려가고, 끝나면 결과 행과 함께 done으로 커밋합니다.
+    - 워커가 죽어 lease가 만료되면 다른 워커가 다시 가져갑니다. (최대 MAX_ATTEMPTS번)
+    - 구간 간 중복 기사는 claims 테이블로 조정: 먼저 claim한 구간이 가져감
+    여러 호스트에서 같은 파일을 쓰려면 SQLite 잠금이 제대로 동작하는 파일 시스템이어야 합니다.
+    """
+    def __init__(self, path=DEFAULT_QUEUE_PATH):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        # 트랜잭션은 직접 관리 (lease는 BEGIN IMMEDIATE로 쓰기 잠금을 먼저 잡아야 함)
+        self.conn = sqlite3.connect(path, timeout=30, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        # claim은 기사마다 커밋되므로 fsync를 체크포인트 때만 (WAL에서는 전원 장애 시에도 DB는 일관됨)
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS queue_runs (
+                run_key TEXT PRIMARY KEY,
+                base_url TEXT NOT NULL,
+                created_at TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS shards (
+                shard_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                run_key TEXT NOT NULL,
+                day_offset INTEGER NOT NULL,
+                collection_date TEXT NOT NULL,
+                press TEXT NOT NULL,
+                oid TEXT NOT NULL,
+                state TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                lease_owner TEXT,
+                lease_expires REAL,
+                last_error TEXT,
+                updated_at TEXT NOT NULL,
+                UNIQUE (run_key, collection_date, press)
+            );
+            CREATE INDEX IF NOT EXISTS idx_shards_state ON shards(run_key, state);
+            CREATE TABLE IF NOT EXISTS shard_rows (
+                shard_id INTEGER NOT NULL,
+                seq INTEGER NOT NULL,
+                payload TEXT NOT NULL,
+                PRIMARY KEY (shard_id, seq)
+            );
+            CREATE TABLE IF NOT EXISTS claims (
+                run_key TEXT NOT NULL,
+                article_id TEXT NOT NULL,
+                shard_id INTEGER NOT NULL,
+                PRIMARY KEY (run_key, article_id)
+            );
+            CREATE INDEX IF NOT EXISTS idx_claims_shard ON claims(shard_id);
+        """)
+
+    def _now(self):
+        return datetime.now().isoformat(timespec="seconds")
+
+    # ------------------------------------------
+    # 코디네이터
+    # ------------------------------------------
+    def enqueue(self, run_key, base_url, shards):
+        """ shards: iter_crawl_shards 결과. 이미 들어간 구간은 건너뜀 (여러 번 호출해도 안전) """
+        now = self._now()
+        with self.conn:
+            self.conn.execute("BEGIN IMMEDIATE")
+            self.conn.execute("INSERT OR IGNORE INTO queue_runs (run_key, base_url, created_at) VALUES (?, ?, ?)",
+                              (run_key, base_url, now))
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO shards (run_key, day_offset, collection_date, press, oid, state, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(run_key, day_offset, target_date.strftime("%Y-%m-%d"), press_name, oid, PENDING, now)
+                 for day_offset, target_date, press_name, oid in shards]
+            )
+
+    def progress(self, run_key):
+        counts = dict(self.conn.execute(
+            "SELECT state, COUNT(*) FROM shards WHERE run_key = ? GROUP BY state", (run_key,)))
+        # lease가 만료된 구간은 다시 가져갈 수 있으므로 pending으로 셈
+        expired = self.conn.execute(
+            "SELECT COUNT(*) FROM shards WHERE run_key = ? AND state = ? AND lease_expires < ? AND attempts < ?",
+            (run_key, LEASED, time.time(), MAX_ATTEMPTS)
+        ).fetchone()[0]
+        if expired:
+            counts[LEASED] -= expired
+            counts[PENDING] = counts.get(PENDING, 0) + expired
+        return {state: counts.get(state, 0) for state in (PENDING, LEASED, DONE, FAILED)}
+
+    def is_finished(self, run_key):
+        progress = self.progress(run_key)
+        return progress[PENDING] == 0 and progress[LEASED] == 0
+
+    def collect_rows(self, run_key):
+        """ 끝난 구간의 결과를 원래 수집 순서(날짜, 언론사 순)대로 돌려줍니다. """
+        return [
+            json.loads(payload) for (payload,) in self.conn.execute(
+                "SELECT r.payload FROM shard_rows r JOIN shards s ON s.shard_id = r.shard_id "
+                "WHERE s.run_key = ? AND s.state = ? ORDER BY s.shard_id, r.seq", (run_key, DONE))
+        ]
+
+    def base_url(self, run_key):
+        row = self.conn.execute("SELECT base_url FROM queue_runs WHERE run_key = ?", (run_key,)).fetchone()
+        return row[0] if row else NAVER_NEWS_BASE
+
+    # ------------------------------------------
+    # 워커
+    # ------------------------------------------
+    def lease(self, run_key, worker_id, lease_seconds=DEFAULT_LEASE_SECONDS):
+        """ 대기 중이거나 lease가 만료된 구간 하나를 빌립니다. 없으면 None """
+        now = time.time()
+        with self.conn:
+            self.conn.execute("BEGIN IMMEDIATE")
+            row = self.conn.execute(
+                "SELECT shard_id, day_offset, collection_date, press, oid, attempts FROM shards "
+                "WHERE run_key = ? AND attempts < ? AND (state = ? OR (state = ? AND lease_expires < ?)) "
+                "ORDER BY shard_id LIMIT 1",
+                (run_key, MAX_ATTEMPTS, PENDING, LEASED, now)
+            ).fetchone()
+            if row is None:
+                # 시도 횟수를 다 쓰고도 lease가 만료된 구간은 실패로 정리
+                failed = [shard_id for (shard_id,) in self.conn.execute(
+                    "SELECT shard_id FROM shards WHERE run_key = ? AND state = ? AND lease_expires < ? AND attempts >= ?",
+                    (run_key, LEASED, now, MAX_ATTEMPTS)
+                )]
+                self.conn.executemany("UPDATE shards SET state = ?, updated_at = ? WHERE shard_id = ?",
+                                      [(FAILED, self._now(), shard_id) for shard_id in failed])
+                self._release_claims(failed)
+                return None
+            self.conn.execute(
+                "UPDATE shards SET state = ?, attempts = attempts + 1, lease_owner = ?, lease_expires = ?, "
+                "updated_at = ? WHERE shard_id = ?",
+                (LEASED, worker_id, now + lease_seconds, self._now(), row[0])
+            )
+        keys = ("shard_id", "day_offset", "collection_date", "press", "oid", "attempts")
+        return {**dict(zip(keys, row)), "attempts": row[5] + 1}
+
+    def claim(self, run_key, article_id, shard_id):
+        """ 이 구간이 기사를 처음 가져가면 True. 같은 구간의 이전 시도가 남긴 claim은 다시 인정합니다. """
+        with self.conn:
+            self.conn.execute("INSERT OR IGNORE INTO claims (run_key, article_id, shard_id) VALUES (?, ?, ?)",
+                              (run_key, article_id, shard_id))
+            owner = self.conn.execute(
+                "SELECT shard_id FROM claims WHERE run_key = ? AND article_id = ?", (run_key, article_id)
+            ).fetchone()[0]
+        return owner == shard_id
+
+    def complete(self, shard_id, worker_id, rows):
+        """ 결과 행과 완료 표시를 한 트랜잭션으로 커밋. lease를 잃었으면(만료 후 재할당) False """
+        with self.conn:
+            self.conn.execute("BEGIN IMMEDIATE")
+            updated = self.conn.execute(
+                "UPDATE shards SET state = ?, lease_expires = NULL, updated_at = ? "
+                "WHERE shard_id = ? AND state = ? AND lease_owner = ?",
+                (DONE, self._now(), shard_id, LEASED, worker_id)
+            ).rowcount
+            if not updated:
+                return False
+            self.conn.execute("DELETE FROM shard_rows WHERE shard_id = ?", (shard_id,))
+            self.conn.executemany(
+                "INSERT INTO shard_rows (shard_id, seq, payload) VALUES (?, ?, ?)",
+                [(shard_id, i, json.dumps(r, ensure_ascii=False)) for i, r in enumerate(rows)]
+            )
+        return True
+
+    def fail(self, shard_id, worker_id, error):
+        """ 워커가 직접 실패를 보고: 시도 횟수가 남았으면 바로 다시 대기열로 """
+        with self.conn:
+            self.conn.execute("BEGIN IMMEDIATE")
+            self.conn.execute(
+                "UPDATE shards SET state = CASE WHEN attempts < ? THEN ? ELSE ? END, "
+                "lease_owner = NULL, lease_expires = NULL, last_error = ?, updated_at = ? "
+                "WHERE shard_id = ? AND lease_owner = ?",
+                (MAX_ATTEMPTS, PENDING, FAILED, str(error)[:500], self._now(), shard_id, worker_id)
+            )
+            if self.conn.execute("SELECT state FROM shards WHERE shard_id = ?", (shard_id,)).fetchone()[0] == FAILED:
+                self._release_claims([shard_id])
+
+    def _release_claims(self, shard_ids):
+        """ 실패로 끝난 구간의 claim을 지워, 겹치는 기사를 다른 구간이 가져갈 수 있게 함 (트랜잭션 안에서 호출) """
+        self.conn.executemany("DELETE FROM claims WHERE shard_id = ?", [(shard_id,) for shard_id in shard_ids])
+
+    def close(self):
+        self.conn.close()
+
+
+class SharedClaimCollector(PoliticsNewsCollector):
+    """ 중복 검사를 큐의 claims 테이블로 하는 collector (다른 워커가 가져간 기사는 건너뜀) """
+    def __init__(self, queue, run_key, shard_id, per_press_limit=MAX_PER_PRESS):
+        super().__init__(per_press_limit)
+        self.queue = queue
+        self.run_key = run_key
+        self.shard_id = shard_id
+
+    def is_new(self, article_id):
+        return article_id not in self.seen_articles
+
+    def claim(self, article_id):
+        if article_id in self.seen_articles:
+            return False
+        self.seen_articles.add(article_id)
+        return self.queue.claim(self.run_key, article_id, self.shard_id)
+
+
+def run_worker(run_key, queue_path=DEFAULT_QUEUE_PATH, worker_id=None, lease_seconds=DEFAULT_LEASE_SECONDS,
+               delay=REQUEST_DELAY, use_cache=False, prefilter=True, verify_rate=DEFAULT_VERIFY_RATE,
+               exit_when_idle=True):
+    """ 큐가 빌 때까지 구간을 빌려 수집하고 결과를 커밋합니다. 처리한 구간 수를 돌려줍니다. """
+    worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+    queue = ShardQueue(queue_path)
+    base_url = queue.base_url(run_key)
+    http = get_http_client()
+    cache = get_html_cache() if use_cache else None
+    section_filter = SectionPrefilter(prefilter, verify_rate)
+    processed = 0
+    try:
+        while True:
+            shard = queue.lease(run_key, worker_id, lease_seconds)
+            if shard is None:
+                if exit_when_idle and queue.is_finished(run_key):
+                    break
+                # 다른 워커가 잡고 있는 구간이 만료될 수 있으니 잠시 뒤 다시 확인
+                time.sleep(IDLE_POLL)
+                continue
+
+            date_str = shard["collection_date"].replace("-", "")
+            try:
+                list_items = fetch_ranking_page(http, cache, shard["oid"], date_str, base_url)
+                collector = SharedClaimCollector(queue, run_key, shard["shard_id"])
+                new_count = collect_shard(collector, section_filter, list_items,
+                                          shard["collection_date"], shard["press"], cache, delay)
+                if queue.complete(shard["shard_id"], worker_id, collector.rows):
+                    processed += 1
+                    print(f"   ✅ [{worker_id}] {shard['collection_date']} {shard['press']}: 신규 {new_count}개 저장")
+                else:
+                    print(f"   ⌛ [{worker_id}] {shard['collection_date']} {shard['press']}: lease 만료, 결과 폐기")
+            except Exception as e:
+                print(f"   ⚠️ [{worker_id}] {shard['press']} 에러 (시도 {shard['attempts']}): {e}")
+                queue.fail(shard["shard_id"], worker_id, e)
+    finally:
+        queue.close()
+    return processed
+
+
+def _worker_main(run_key, queue_path, worker_no, options):
+    run_worker(run_key, queue_path, worker_id=f"{socket.gethostname()}:{os.getpid()}#{worker_no}", **options)
+
+
+def crawl_distributed(days=DAYS_TO_CRAWL, press_dict=TARGET_PRESS_DICT, today=None, base_url=NAVER_NEWS_BASE,
+                      workers=4, queue_path=DEFAULT_QUEUE_PATH, **worker_options):
+    """
+    코디네이터: 구간을 큐에 넣고 로컬 워커 프로세스 workers개를 띄운 뒤, 모두 끝나면 결과를 모읍니다.
+    다른 호스트의 워커는 `crawl_queue.py worker --run-key ...`로 같은 큐에 붙을 수 있습니다.
+    구간을 병렬로 처리하므로 구간 간 중복 기사는 먼저 claim한 구간이 가져갑니다. (순차 모드와 배정이 다를 수 있음)
+    """
+    today = today or datetime.now()
+    run_key = crawl_run_key(days, press_dict, today)
+    queue = ShardQueue(queue_path)
+    queue.enqueue(run_key, base_url, iter_crawl_shards(days, press_dict, today))
+    print(f"🚀 분산 수집 시작: {run_key} (워커 {workers}개) {queue.progress(run_key)}")
+
+    procs = [multiprocessing.Process(target=_worker_main, args=(run_key, queue_path, i, worker_options))
+             for i in range(workers)]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join()
+
+    progress = queue.progress(run_key)
+    print(f"\n📊 구간 상태: {progress}")
+    rows = queue.collect_rows(run_key)
+    queue.close()
+    return pd.DataFrame(rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="(날짜, 언론사) 구간 큐 기반 분산 수집")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run_p = sub.add_parser("run", help="큐에 넣고 로컬 워커 N개로 수집 후 CSV 저장")
+    run_p.add_argument("--workers", type=int, default=4)
+    run_p.add_argument("--days", type=int, default=DAYS_TO_CRAWL)
+    run_p.add_argument("--output", default="weekly_politics_news_clean.csv")
+
+    enqueue_p = sub.add_parser("enqueue", help="구간만 큐에 넣고 run_key 출력")
+    enqueue_p.add_argument("--days", type=int, default=DAYS_TO_CRAWL)
+
+    worker_p = sub.add_parser("worker", help="큐의 구간을 수집하는 워커 (다른 호스트에서도 실행 가능)")
+    worker_p.add_argument("--run-key", required=True)
+    worker_p.add_argument("--lease", type=int, default=DEFAULT_LEASE_SECONDS)
+
+    collect_p = sub.add_parser("collect", help="끝난 구간의 결과를 CSV로 저장")
+    collect_p.add_argument("--run-key", required=True)
+    collect_p.add_argument("--output", default="weekly_politics_news_clean.csv")
+
+    for p in (run_p, enqueue_p, worker_p, collect_p):
+        p.add_argument("--queue", default=DEFAULT_QUEUE_PATH, help="큐 SQLite 경로")
+    for p in (run_p, worker_p):
+        p.add_argument("--cache", action="store_true", help="디스크 HTML 캐시 사용")
+    args = parser.parse_args()
+
+    if args.command == "enqueue":
+        run_key = crawl_run_key(args.days, TARGET_PRESS_DICT, datetime.now())
+        q = ShardQueue(args.queue)
+        q.enqueue(run_key, NAVER_NEWS_BASE, iter_crawl_shards(args.days, TARGET_PRESS_DICT))
+        print(run_key)
+    elif args.command == "worker":
+        n = run_worker(args.run_key, args.queue, lease_seconds=args.lease, use_cache=args.cache)
+        print(f"🏁 워커 종료: {n}개 구간 처리")
+    else:
+        if args.command == "run":
+            df = crawl_distributed(days=args.days, workers=args.workers, queue_path=args.queue,
+                                   use_cache=args.cache)
+        else:
+            q = ShardQueue(args.queue)
+            print(f"📊 구간 상태: {q.progress(args.run_key)}")
+            df = pd.DataFrame(q.collect_rows(args.run_key))
+        df.to_csv(args.output, index=False, encoding="utf-8-sig")
+        print(f"📁 '{args.output}'에 {len(df)}건 저장되었습니다.")
@@ -0,0 +1,186 @@
+import os
+import abc
+import glob
+import json
+import threading
+from datetime import datetime
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError: # pyarrow가 없으면 JSONL로 저장
+    pa = None
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEFAULT_SINK_DIR = os.path.join(BASE_DIR, "data", "politics_news")
+# 이 개수만큼 쌓이면 파일로 내보냄
+DEFAULT_BATCH_ROWS = 200
+
+PARTITION_COLUMNS = ["collection_date", "press"]
+ROW_COLUMNS = ["title", "section", "content", "image_url", "pub_date", "link"]
+# 수집 순서 복원용 (파티션 디렉터리 순서는 수집 순서와 다름)
+ORDER_COLUMNS = ["crawl_run", "crawl_seq"]
+
+
+def _partition_dir(root, collection_date, press):
+    return os.path.join(root, f"collection_date={collection_date}", f"press={press}")
+
+
+class CrawlSink(abc.ABC):
+    """
+    수집한 기사 행을 메모리에 모아두지 않고 배치 단위로 파일에 흘려 쓰는 저장소.
+    root/collection_date=YYYY-MM-DD/press=언론사/part-<실행>-<번호>.<확장자> 형태(hive 파티션)로 씁니다.
+    한 번 쓴 파일은 다시 열지 않으므로 실행이 중간에 죽어도 이미 내보낸 배치는 남습니다.
+    """
+    extension = None
+
+    def __init__(self, root=DEFAULT_SINK_DIR, batch_rows=DEFAULT_BATCH_ROWS):
+        self.root = root
+        self.batch_rows = batch_rows
+        self.run = f"{datetime.now():%Y%m%dT%H%M%S}-{os.getpid()}"
+        self.rows_written = 0
+        self.files_written = 0
+        self._buffer = []
+        self._seq = 0
+        self._part = 0
+        self._lock = threading.Lock()
+
+    def write(self, rows):
+        with self._lock:
+            for row in rows:
+                self._buffer.append({**row, "crawl_run": self.run, "crawl_seq": self._seq})
+                self._seq += 1
+            if len(self._buffer) >= self.batch_rows:
+                self._flush_locked()
+
+    def flush(self):
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        if not self._buffer:
+            return
+        partitions = {}
+        for row in self._buffer:
+            partitions.setdefault((row["collection_date"], row["press"]), []).append(row)
+        for (collection_date, press), rows in partitions.items():
+            directory = _partition_dir(self.root, collection_date, press)
+            os.makedirs(directory, exist_ok=True)
+            path = os.path.join(directory, f"part-{self.run}-{self._part:05d}.{self.extension}")
+            # 쓰는 도중에 죽어도 반쯤 쓴 파일이 읽히지 않도록 임시 파일 -> rename
+            tmp = path + ".tmp"
+            self._write_file(tmp, [{c: r.get(c) for c in ROW_COLUMNS + ORDER_COLUMNS} for r in rows])
+            os.replace(tmp, path)
+            self._part += 1
+            self.files_written += 1
+        self.rows_written += len(self._buffer)
+        self._buffer = []
+
+    @abc.abstractmethod
+    def _write_file(self, path, rows):
+        """ rows를 path 하나에 씀 (형식별 하위 클래스에서 구현) """
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class ParquetSink(CrawlSink):
+    extension = "parquet"
+
+    def _write_file(self, path, rows):
+        table = pa.Table.from_pylist(rows, schema=_parquet_schema())
+        pq.write_table(table, path, compression="zstd")
+
+
+class JsonlSink(CrawlSink):
+    extension = "jsonl"
+
+    def _write_file(self, path, rows):
+        with open(path, "w", encoding="utf-8") as f:
+            for row in rows:
+                f.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+
+def _parquet_schema():
+    return pa.schema([(c, pa.string()) for c in ROW_COLUMNS] +
+                     [("crawl_run", pa.string()), ("crawl_seq", pa.int64())])
+
+
+def open_sink(root=DEFAULT_SINK_DIR, fmt="auto", batch_rows=DEFAULT_BATCH_ROWS):
+    """ fmt: "parquet" / "jsonl" / "auto" (pyarrow가 있으면 parquet) """
+    if fmt == "auto":
+        fmt = "parquet" if pa is not None else "jsonl"
+    if fmt == "parquet":
+        if pa is None:
+            raise ImportError("parquet 저장에는 pyarrow가 필요합니다.")
+        return ParquetSink(root, batch_rows)
+    return JsonlSink(root, batch_rows)
+
+
+# ==========================================
+# 읽기
+# ==========================================
+def _date_in_range(collection_date, start_date, end_date):
+    return (start_date is None or collection_date >= start_date) and \
+           (end_date is None or collection_date <= end_date)
+
+
+def _read_parquet(files, root, columns, start_date, end_date):
+    partitioning = ds.partitioning(
+        pa.schema([("collection_date", pa.string()), ("press", pa.string())]), flavor="hive")
+    dataset = ds.dataset(files, format="parquet", partitioning=partitioning, partition_base_dir=root)
+    condition = None
+    if start_date is not None:
+        condition = ds.field("collection_date") >= start_date
+    if end_date is not None:
+        upper = ds.field("collection_date") <= end_date
+        condition = upper if condition is None else condition & upper
+    # 파티션 필터는 파일을 열기 전에 적용되고, 필요한 컬럼만 읽음
+    return dataset.to_table(columns=columns, filter=condition).to_pandas()
+
+
+def _read_jsonl(root, columns, start_date, end_date):
+    records = []
+    for path in glob.glob(os.path.join(root, "collection_date=*", "press=*", "*.jsonl")):
+        press_dir = os.path.dirname(path)
+        collection_date = os.path.basename(os.path.dirname(press_dir)).split("=", 1)[1]
+        if not _date_in_range(collection_date, start_date, end_date):
+            continue
+        press = os.path.basename(press_dir).split("=", 1)[1]
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                row = {**json.loads(line), "collection_date": collection_date, "press": press}
+                records.append({c: row.get(c) for c in columns})
+    return pd.DataFrame(records, columns=columns)
+
+
+def read_crawl_dataset(root=DEFAULT_SINK_DIR, columns=None, start_date=None, end_date=None):
+    """
+    CrawlSink로 쓴 데이터셋을 읽습니다.
+    - columns: 필요한 컬럼만 읽음 (None이면 전체)
+    - start_date / end_date: 'YYYY-MM-DD' 포함 범위. 파티션 단위로 걸러서 범위 밖 파일은 열지 않습니다.
+    수집 순서대로 정렬하고, 재개된 실행 등으로 같은 기사가 두 번 쓰였으면 먼저 쓴 행만 남깁니다.
+    """
+    wanted = columns or PARTITION_COLUMNS + ROW_COLUMNS
+    read_columns = list(dict.fromkeys(wanted + ORDER_COLUMNS + ["link"]))
+
+    # pyarrow 없이 돈 실행(fmt="auto")은 같은 데이터셋에 JSONL로 쓰므로 두 형식을 모두 읽음
+    df = _read_jsonl(root, read_columns, start_date, end_date)
+    parquet_files = sorted(glob.glob(os.path.join(root, "collection_date=*", "press=*", "*.parquet")))
+    if parquet_files:
+        if pa is None:
+            raise ImportError("parquet 데이터셋을 읽으려면 pyarrow가 필요합니다.")
+        parquet_df = _read_parquet(parquet_files, root, read_columns, start_date, end_date)
+        df = pd.concat([parquet_df, df], ignore_index=True) if len(df) else parquet_df
+
+    df = df.sort_values(ORDER_COLUMNS, kind="stable").drop_duplicates(subset="link", keep="first")
+    return df[wanted].reset_index(drop=True)
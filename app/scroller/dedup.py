@@ -0,0 +1,211 @@
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.metrics.pairwise import cosine_similarity
+
+# ==========================================
+# [설정] LSH 중복 제거
+# ==========================================
+# random hyperplane LSH: 밴드 하나 = BAND_BITS개의 부호 비트. 한 밴드라도 같으면 후보
+# 코사인 0.9인 쌍이 후보에서 빠질 확률 ~ (1 - 0.857^16)^128 ~ 1e-5
+N_BANDS = 128
+BAND_BITS = 16
+# 투영은 이 행 수만큼씩 나눠서 계산 (메모리: 청크 x 비트수 float32)
+PROJECTION_CHUNK = 4096
+# 후보 쌍은 밴드 이만큼씩 모아 중복을 빼고 검증
+BANDS_PER_BLOCK = 16
+# 해밍 거리 거르기 여유 (표준편차 배수). 6이면 실제로 유사한 쌍을 잘못 거를 확률 ~1e-9
+HAMMING_SIGMAS = 6.0
+# 1차 해밍 거르기에 쓰는 서명 앞부분 (uint64 워드 수)
+PREFILTER_WORDS = 4
+# 후보 쌍 코사인 검증 청크
+VERIFY_CHUNK = 200_000
+LSH_SEED = 42
+
+
+def dedup_tfidf(df, max_features=1000):
+    """ 기존 remove_duplicates_fast와 같은 입력: 본문 앞 300자 TF-IDF (행 단위 L2 정규화) """
+    return TfidfVectorizer(max_features=max_features).fit_transform(df['content'].str[:300].fillna(''))
+
+
+def bruteforce_duplicate_indices(tfidf, threshold=0.90, batch_size=500):
+    """ 기준 구현: 500행씩 전체와 코사인 유사도를 구해 훑습니다. O(n^2) """
+    duplicates = set()
+    num_docs = tfidf.shape[0]
+
+    for i in range(0, num_docs, batch_size):
+        batch_end = min(i + batch_size, num_docs)
+        similarities = cosine_similarity(tfidf[i:batch_end], tfidf)
+        for local_idx in range(batch_end - i):
+            global_idx = i + local_idx
+            if global_idx in duplicates: continue
+            target_indices = np.where(similarities[local_idx, global_idx+1:] > threshold)[0]
+            duplicates.update(target_indices + (global_idx + 1))
+    return duplicates
+
+
+def _signatures(tfidf, n_bands, band_bits, seed):
+    """
+    행마다 (밴드별 해시 키 n x n_bands uint64, 전체 부호 비트를 packbits한 서명 n x bytes)
+    두 서명의 해밍 거리 / 비트 수 ~ 두 벡터 사이 각도 / pi
+    """
+    rng = np.random.default_rng(seed)
+    planes = rng.standard_normal((tfidf.shape[1], n_bands * band_bits)).astype(np.float32)
+    weights = (np.uint64(1) << np.arange(band_bits, dtype=np.uint64))
+    keys = np.empty((tfidf.shape[0], n_bands), dtype=np.uint64)
+    # 서명은 uint64 단위로 보관 (비트 수를 64의 배수로 맞춤)
+    n_words = (n_bands * band_bits + 63) // 64
+    packed = np.zeros((tfidf.shape[0], n_words * 8), dtype=np.uint8)
+    tfidf = tfidf.astype(np.float32)
+    for start in range(0, tfidf.shape[0], PROJECTION_CHUNK):
+        end = min(start + PROJECTION_CHUNK, tfidf.shape[0])
+        bits = np.asarray(tfidf[start:end] @ planes) > 0
+        packed[start:end, :(bits.shape[1] + 7) // 8] = np.packbits(bits, axis=1)
+        bits = bits.reshape(end - start, n_bands, band_bits).astype(np.uint64)
+        keys[start:end] = (bits * weights).sum(axis=2)
+    return keys, packed.view(np.uint64)
+
+
+def max_hamming(threshold, n_bits, sigmas=HAMMING_SIGMAS):
+    """ 코사인이 threshold인 쌍의 해밍 거리 기대값 + sigmas 표준편차. 이보다 멀면 검증하지 않음 """
+    q = np.arccos(np.clip(threshold, -1.0, 1.0)) / np.pi
+    return int(np.ceil(n_bits * q + sigmas * np.sqrt(n_bits * q * (1 - q))))
+
+
+# numpy 2.0 미만에는 np.bitwise_count가 없어 바이트 단위 표 조회로 셈
+_POPCOUNT8 = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def _row_popcount(words):
+    """ uint64 행렬의 행별 1 비트 수 """
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(words).sum(axis=1, dtype=np.int64)
+    return _POPCOUNT8[np.ascontiguousarray(words).view(np.uint8)].sum(axis=1, dtype=np.int64)
+
+
+def _hamming(signatures, left, right):
+    dist = np.empty(len(left), dtype=np.int64)
+    for start in range(0, len(left), VERIFY_CHUNK):
+        end = start + VERIFY_CHUNK
+        xor = np.bitwise_xor(signatures[left[start:end]], signatures[right[start:end]])
+        dist[start:end] = _row_popcount(xor)
+    return dist
+
+
+def _hamming_filter(prefix, signatures, codes, n, threshold):
+    """ 서명 앞부분(prefix)으로 먼저 거르고, 남은 쌍만 전체 서명으로 거릅니다. """
+    for part in (prefix, signatures):
+        codes = codes[_hamming(part, codes // n, codes % n) <= max_hamming(threshold, part.shape[1] * 64)]
+    return codes
+
+
+def _band_pairs(band_keys, rows, n):
+    """
+    한 밴드에서 같은 키를 가진 (i, j), i < j 쌍을 i * n + j 코드로 돌려줍니다. rows: 후보 행 번호 (오름차순)
+    정렬 후 같은 키 구간 안에서 간격 d를 늘려가며 쌍을 만듭니다. (구간이 끝난 위치는 다음 d에서 제외)
+    """
+    order = np.argsort(band_keys, kind="stable")
+    sorted_keys = band_keys[order]
+    sorted_rows = rows[order]
+    found = []
+    active = np.flatnonzero(sorted_keys[:-1] == sorted_keys[1:])
+    d = 1
+    while active.size:
+        # 같은 키 안에서는 행 번호 순으로 정렬돼 있음 (stable) -> left < right
+        found.append(sorted_rows[active].astype(np.int64) * n + sorted_rows[active + d])
+        d += 1
+        active = active[active + d < len(sorted_keys)]
+        active = active[sorted_keys[active] == sorted_keys[active + d]]
+    return np.concatenate(found) if found else np.empty(0, dtype=np.int64)
+
+
+def _sorted_unique(codes):
+    """ 정렬 기반 unique (int64 코드에서는 np.unique의 해시 경로보다 빠름) """
+    codes.sort()
+    return codes[np.r_[True, codes[1:] != codes[:-1]]] if codes.size else codes
+
+
+def _similar_pairs(tfidf, keys, packed, rows, threshold):
+    """
+    LSH 후보 쌍 중 실제 코사인이 threshold를 넘는 쌍 (left, right).
+    후보는 밴드 묶음 단위로 모아 서명 해밍 거리로 한 번 거른 뒤(우연히 한 밴드만 겹친 쌍 제거)
+    남은 쌍만 정확한 코사인으로 검증합니다.
+    """
+    n = keys.shape[0]
+    prefix = np.ascontiguousarray(packed[:, :PREFILTER_WORDS])
+    hits = []
+    for start in range(0, keys.shape[1], BANDS_PER_BLOCK):
+        block = [_band_pairs(keys[rows, band], rows, n)
+                 for band in range(start, min(start + BANDS_PER_BLOCK, keys.shape[1]))]
+        codes = _sorted_unique(np.concatenate(block))
+        codes = _hamming_filter(prefix, packed, codes, n, threshold)
+        if not codes.size:
+            continue
+        sims = _pair_cosine(tfidf, codes // n, codes % n)
+        hits.append(codes[sims > threshold])
+    codes = _sorted_unique(np.concatenate(hits)) if hits else np.empty(0, dtype=np.int64)
+    return codes // n, codes % n
+
+
+def _pair_cosine(tfidf, left, right):
+    """ 정규화된 TF-IDF 행끼리의 코사인 (= 내적) """
+    sims = np.empty(len(left), dtype=np.float64)
+    for start in range(0, len(left), VERIFY_CHUNK):
+        end = start + VERIFY_CHUNK
+        sims[start:end] = np.asarray(
+            tfidf[left[start:end]].multiply(tfidf[right[start:end]]).sum(axis=1)).ravel()
+    return sims
+
+
+def lsh_duplicate_indices(tfidf, threshold=0.90, n_bands=N_BANDS, band_bits=BAND_BITS, seed=LSH_SEED):
+    """
+    bruteforce_duplicate_indices와 같은 규칙(앞에서부터 살아남은 문서가 뒤의 유사 문서를 제거)을
+    random hyperplane LSH 후보 + 정확한 코사인 검증으로 거의 선형 시간에 계산합니다.
+    """
+    tfidf = tfidf.tocsr()
+    row_norms = np.sqrt(np.asarray(tfidf.multiply(tfidf).sum(axis=1)).ravel())
+    # 빈 벡터는 누구와도 유사도 0 -> 후보에서 제외
+    rows = np.flatnonzero(row_norms > 0)
+
+    duplicates = set()
+    if threshold < 1.0:
+        # 완전히 같은 벡터의 두 번째 이후 등장은 항상 중복 (앞선 것이 살아남든, 다른 문서에 지워졌든)
+        first_seen = {}
+        unique_rows = []
+        indptr, indices, data = tfidf.indptr, tfidf.indices, tfidf.data
+        for r in rows:
+            lo, hi = indptr[r], indptr[r + 1]
+            signature = (indices[lo:hi].tobytes(), data[lo:hi].tobytes())
+            if signature in first_seen:
+                duplicates.add(int(r))
+            else:
+                first_seen[signature] = r
+                unique_rows.append(r)
+        rows = np.asarray(unique_rows, dtype=np.int64)
+
+    keys, packed = _signatures(tfidf, n_bands, band_bits, seed)
+    # (left, right)는 left 오름차순 -> 쌍을 앞 문서 순으로 훑으며 keep-first 적용 (이미 지워진 문서는 다른 문서를 지우지 않음)
+    left, right = _similar_pairs(tfidf, keys, packed, rows, threshold)
+    starts = np.flatnonzero(np.r_[True, left[1:] != left[:-1]]) if len(left) else []
+    bounds = list(starts) + [len(left)]
+    for k in range(len(bounds) - 1):
+        i = int(left[bounds[k]])
+        if i in duplicates: continue
+        duplicates.update(int(j) for j in right[bounds[k]:bounds[k + 1]])
+    return duplicates
+
+
+def remove_duplicates(df, threshold=0.90, engine="lsh"):
+    """ engine: "lsh" (기본) 또는 "bruteforce" (기존 O(n^2) 구현) """
+    if df.empty: return df
+    df = df.reset_index(drop=True)
+
+    print(f"🧹 중복 제거 전: {len(df)}개")
+    tfidf = dedup_tfidf(df)
+    if engine == "bruteforce":
+        duplicates = bruteforce_duplicate_indices(tfidf, threshold)
+    else:
+        duplicates = lsh_duplicate_indices(tfidf, threshold)
+
+    df_clean = df.drop(index=list(duplicates)).reset_index(drop=True)
+    print(f"✨ 중복 제거 완료: {len(df_clean)}개")
+    return df_clean
@@ -0,0 +1,199 @@
+import os
+import threading
+
+import numpy as np
+
+# ==========================================
+# [설정] 임베딩 백엔드
+# ==========================================
+EMBEDDING_MODEL = "snunlp/KR-SBERT-V40K-klueNLI-augSTS"
+# fp32: sentence-transformers 기본 (PyTorch float32)
+# int8: Linear 층을 int8로 동적 양자화한 PyTorch 모델 (CPU)
+# onnx: ONNX Runtime으로 export한 모델 (CPU)
+# worker: 모델을 올려둔 임베딩 워커(embedding_worker.py)에 요청 (프로세스마다 모델을 올리지 않음)
+EMBEDDING_BACKEND = os.getenv("EMBEDDING_BACKEND", "fp32")
+# 추론 스레드 수 (0이면 라이브러리 기본값)
+EMBEDDING_THREADS = int(os.getenv("EMBEDDING_THREADS", "0"))
+# 배치 하나에 들어가는 최대 문서 수 / 최대 글자 수 (배치 안 최장 문서 길이 x 문서 수)
+MAX_BATCH_DOCS = 64
+MAX_BATCH_CHARS = 64 * 256
+
+BACKENDS = {}
+
+
+def register_backend(name):
+    def wrap(cls):
+        BACKENDS[name] = cls
+        cls.name = name
+        return cls
+    return wrap
+
+
+def topic_document(title, content):
+    """ 토픽 분석용 문서: 제목에 가중치(3번 반복) + 본문 앞 100자 """
+    title = str(title)
+    return title + " " + title + " " + title + " " + str(content)[:100]
+
+
+def length_buckets(texts, max_docs=MAX_BATCH_DOCS, max_chars=MAX_BATCH_CHARS):
+    """
+    길이 순으로 정렬해 비슷한 길이끼리 배치를 만듭니다. (패딩 낭비를 줄임)
+    짧은 문서는 한 배치에 더 많이, 긴 문서는 더 적게 담습니다. 반환: 원래 인덱스 배열의 리스트
+    """
+    lengths = np.fromiter((len(t) for t in texts), dtype=np.int64, count=len(texts))
+    order = np.argsort(-lengths, kind="stable")
+    batches = []
+    start = 0
+    while start < len(order):
+        # 길이 내림차순이라 배치의 첫 문서가 가장 김
+        longest = max(int(lengths[order[start]]), 1)
+        size = max(1, min(max_docs, max_chars // longest))
+        batches.append(order[start:start + size])
+        start += size
+    return batches
+
+
+class EmbeddingBackend:
+    """
+    문서 리스트 -> (n x dim) float32 임베딩
+    하위 클래스는 _load()에서 모델을 올리고 _encode_batch()로 배치 하나를 인코딩합니다.
+    """
+    name = None
+
+    def __init__(self, model_name=EMBEDDING_MODEL, threads=EMBEDDING_THREADS,
+                 max_docs=MAX_BATCH_DOCS, max_chars=MAX_BATCH_CHARS):
+        self.model_name = model_name
+        self.threads = threads
+        self.max_docs = max_docs
+        self.max_chars = max_chars
+        self.model = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        raise NotImplementedError
+
+    def _encode_batch(self, texts):
+        raise NotImplementedError
+
+    def load(self):
+        with self._lock:
+            if self.model is None:
+                self.model = self._load()
+        return self.model
+
+    def encode(self, texts):
+        texts = [str(t) for t in texts]
+        self.load()
+        if not texts:
+            return np.empty((0, self.dimension()), dtype=np.float32)
+        result = None
+        for batch in length_buckets(texts, self.max_docs, self.max_chars):
+            vectors = np.asarray(self._encode_batch([texts[i] for i in batch]), dtype=np.float32)
+            if result is None:
+                result = np.empty((len(texts), vectors.shape[1]), dtype=np.float32)
+            result[batch] = vectors
+        return result
+
+    def dimension(self):
+        return self.load().get_sentence_embedding_dimension()
+
+    def variant(self):
+        """ 벡터를 만든 실제 백엔드 이름 (저장소 키에 사용) """
+        return self.name
+
+    @property
+    def sentence_transformer(self):
+        """ BERTopic에 넘길 로컬 SentenceTransformer (아직 안 올렸거나 원격이면 None) """
+        return self.model
+
+    def __call__(self, texts):
+        return self.encode(texts)
+
+
+@register_backend("fp32")
+class SentenceTransformerBackend(EmbeddingBackend):
+    def _set_threads(self):
+        if self.threads:
+            import torch
+            torch.set_num_threads(self.threads)
+
+    def _load(self):
+        from sentence_transformers import SentenceTransformer
+        self._set_threads()
+        return SentenceTransformer(self.model_name, device="cpu")
+
+    def _encode_batch(self, texts):
+        return self.model.encode(texts, batch_size=len(texts), show_progress_bar=False, convert_to_numpy=True)
+
+
+@register_backend("int8")
+class QuantizedBackend(SentenceTransformerBackend):
+    """ Linear 층만 int8 동적 양자화 (가중치 int8, 활성값은 실행 중 양자화). 모델 크기 ~1/4 """
+    def _load(self):
+        import torch
+        model = super()._load()
+        return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+
+@register_backend("onnx")
+class OnnxBackend(SentenceTransformerBackend):
+    """ sentence-transformers의 ONNX 백엔드 (처음 한 번 export, 이후 캐시된 모델 사용) """
+    def _load(self):
+        import onnxruntime as ort
+        from sentence_transformers import SentenceTransformer
+
+        options = ort.SessionOptions()
+        if self.threads:
+            options.intra_op_num_threads = self.threads
+        return SentenceTransformer(self.model_name, device="cpu", backend="onnx",
+                                   model_kwargs={"provider": "CPUExecutionProvider", "session_options": options})
+
+
+@register_backend("worker")
+class WorkerBackend(EmbeddingBackend):
+    """ 임베딩 워커 클라이언트. 배치 구성은 워커가 여러 소비자의 요청을 모아서 합니다. """
+    def _load(self):
+        from app.scroller.embedding_worker import EmbeddingClient
+        client = EmbeddingClient()
+        self._info = client.info()
+        if self._info["model"] != self.model_name:
+            raise ValueError(f"워커 모델({self._info['model']})이 요청한 모델({self.model_name})과 다릅니다.")
+        return client
+
+    def encode(self, texts):
+        return self.load().encode(texts)
+
+    def dimension(self):
+        self.load()
+        return self._info["dimension"]
+
+    def variant(self):
+        self.load()
+        return self._info["backend"]
+
+    @property
+    def sentence_transformer(self):
+        return None
+
+
+_backends = {}
+_backends_lock = threading.Lock()
+
+
+def get_backend(name=None, model_name=EMBEDDING_MODEL, threads=None):
+    """ 프로세스당 (백엔드, 모델, 스레드)별 하나. 모델은 처음 encode할 때 올림 """
+    name = name or EMBEDDING_BACKEND
+    threads = EMBEDDING_THREADS if threads is None else threads
+    if name not in BACKENDS:
+        raise ValueError(f"알 수 없는 임베딩 백엔드: {name} (가능: {', '.join(BACKENDS)})")
+    key = (name, model_name, threads)
+    with _backends_lock:
+        if key not in _backends:
+            _backends[key] = BACKENDS[name](model_name, threads=threads)
+        return _backends[key]
+
+
+def store_key(backend):
+    """ 임베딩 저장소 키: 백엔드마다 벡터가 조금씩 달라서 fp32 외에는 따로 저장 """
+    variant = backend.variant()
+    return backend.model_name if variant == "fp32" else f"{backend.model_name}@{variant}"
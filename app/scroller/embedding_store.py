@@ -0,0 +1,309 @@
+import os
+import time
+import sqlite3
+import hashlib
+import threading
+from contextlib import contextmanager
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: 프로세스 간 잠금 없이 스레드 잠금만
+    fcntl = None
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEFAULT_STORE_DIR = os.getenv("EMBEDDING_STORE_DIR", os.path.join(BASE_DIR, "data", "embeddings"))
+
+# ==========================================
+# [설정] 임베딩 저장소
+# ==========================================
+# 이 행 수를 넘거나 MAX_AGE_DAYS 동안 쓰이지 않은 벡터는 압축(compact) 때 버림 (최근 사용 순으로 남김)
+MAX_ROWS = 200_000
+MAX_AGE_DAYS = 30
+# 행 수가 MAX_ROWS * COMPACT_SLACK를 넘으면 embed() 끝에 자동 압축
+COMPACT_SLACK = 1.25
+# 캐시에 없는 문서는 이만큼씩 인코딩
+ENCODE_BATCH = 256
+# 벡터 파일은 이 행 수 단위로 늘림
+GROW_ROWS = 4096
+LOOKUP_CHUNK = 500
+
+
+def doc_digest(model_name, doc):
+    """ 모델 이름 + 문서 문자열 그대로의 sha256 (문서가 한 글자라도 다르면 다른 키) """
+    return hashlib.sha256(f"{model_name}\n{doc}".encode("utf-8")).hexdigest()
+
+
+def _model_dir(root, model_name):
+    return os.path.join(root, model_name.replace("/", "__"))
+
+
+class EmbeddingStore:
+    """
+    문서 임베딩 영구 캐시
+    - vectors*.f32: float32 행렬 (memmap, 행 = 문서)
+    - index.sqlite3: 문서 해시 -> 행 번호, 마지막 사용 시각
+    같은 문서 문자열은 다시 인코딩하지 않고, 오래 안 쓴 벡터는 compact()로 정리합니다.
+    여러 프로세스(주간 클러스터링, issue_assign 등)가 같은 저장소를 열 수 있으므로
+    store.lock 파일 잠금(fcntl.flock) 아래에서 읽고(공유) 쓰며(배타), 잠글 때마다 행 수/파일 세대를 다시 읽습니다.
+    """
+    def __init__(self, model_name, root=DEFAULT_STORE_DIR, max_rows=MAX_ROWS, max_age_days=MAX_AGE_DAYS):
+        self.model_name = model_name
+        self.dir = _model_dir(root, model_name)
+        self.max_rows = max_rows
+        self.max_age_days = max_age_days
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.RLock()
+        os.makedirs(self.dir, exist_ok=True)
+        self._lock_file = open(os.path.join(self.dir, "store.lock"), "a+")
+        self._lock_depth = 0
+        self._lock_exclusive = False
+        self.conn = sqlite3.connect(os.path.join(self.dir, "index.sqlite3"), check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS entries (
+                digest TEXT PRIMARY KEY,
+                row INTEGER NOT NULL UNIQUE,
+                last_used REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_entries_used ON entries(last_used);
+            CREATE TABLE IF NOT EXISTS store_meta (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            );
+        """)
+        self.conn.commit()
+        self.dim = None
+        self.generation = None
+        self.vectors_path = None
+        self.n_rows = 0
+        self._vectors = None
+        self._capacity = 0
+        with self._locked(exclusive=False):
+            pass
+
+    @contextmanager
+    def _locked(self, exclusive=True):
+        """
+        스레드 + 프로세스 간 잠금. 가장 바깥에서 잠글 때 다른 프로세스가 바꾼 상태를 다시 읽습니다.
+        (공유 잠금 안에서 배타 잠금을 다시 잡는 중첩은 허용하지 않음)
+        """
+        with self._lock:
+            if self._lock_depth == 0:
+                if fcntl is not None:
+                    fcntl.flock(self._lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+                self._lock_exclusive = exclusive
+            elif exclusive and not self._lock_exclusive:
+                raise RuntimeError("공유 잠금 안에서 배타 잠금을 잡을 수 없습니다.")
+            self._lock_depth += 1
+            try:
+                if self._lock_depth == 1:
+                    self._refresh()
+                yield
+            finally:
+                self._lock_depth -= 1
+                if self._lock_depth == 0 and fcntl is not None:
+                    fcntl.flock(self._lock_file, fcntl.LOCK_UN)
+
+    def _refresh(self):
+        """ 다른 프로세스가 이어 쓴 행 수, 압축으로 바뀐 벡터 파일(세대)을 반영 """
+        self.dim = self._meta("dim", int)
+        generation = self._meta("generation", int) or 0
+        if generation != self.generation:
+            # 압축할 때마다 새 파일에 쓰고, 인덱스와 같은 트랜잭션에서 파일 이름을 바꿔 가리킴
+            self._close_vectors()
+            self.vectors_path = os.path.join(self.dir, self._meta("vectors_file", str) or "vectors.f32")
+            self.generation = generation
+        self.n_rows = self.conn.execute("SELECT COALESCE(MAX(row), -1) + 1 FROM entries").fetchone()[0]
+
+    def _meta(self, key, cast):
+        row = self.conn.execute("SELECT value FROM store_meta WHERE key = ?", (key,)).fetchone()
+        return cast(row[0]) if row else None
+
+    # ------------------------------------------
+    # 벡터 파일
+    # ------------------------------------------
+    def _open_vectors(self, min_rows=0):
+        """ 적어도 min_rows 행이 들어가는 memmap (파일은 GROW_ROWS 단위로 늘림) """
+        if self.dim is None:
+            return None
+        if self._vectors is not None and self._capacity >= min_rows:
+            return self._vectors
+        row_bytes = self.dim * 4
+        size = os.path.getsize(self.vectors_path) if os.path.exists(self.vectors_path) else 0
+        capacity = size // row_bytes
+        if capacity < min_rows:
+            capacity = max(min_rows, capacity * 2, GROW_ROWS)
+            self._close_vectors()
+            with open(self.vectors_path, "ab") as f:
+                f.truncate(capacity * row_bytes)
+        if capacity == 0:
+            return None
+        self._close_vectors()
+        self._vectors = np.memmap(self.vectors_path, dtype=np.float32, mode="r+", shape=(capacity, self.dim))
+        self._capacity = capacity
+        return self._vectors
+
+    def _close_vectors(self):
+        if self._vectors is not None:
+            self._vectors.flush()
+            self._vectors = None
+            self._capacity = 0
+
+    # ------------------------------------------
+    # 조회 / 저장
+    # ------------------------------------------
+    def lookup(self, digests):
+        """ {해시: 행 번호} (있는 것만) """
+        digests = list(set(digests))
+        found = {}
+        for start in range(0, len(digests), LOOKUP_CHUNK):
+            chunk = digests[start:start + LOOKUP_CHUNK]
+            found.update(self.conn.execute(
+                f"SELECT digest, row FROM entries WHERE digest IN ({','.join('?' * len(chunk))})", chunk))
+        return found
+
+    def put(self, digests, vectors):
+        """
+        새 벡터를 파일 끝에 이어 쓰고 인덱스에 등록합니다. (배타 잠금 안에서 끝 행 번호를 다시 읽음)
+        그 사이 다른 프로세스가 먼저 등록한 문서는 건너뜁니다.
+        """
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if not len(digests):
+            return
+        with self._locked():
+            existing = self.lookup(digests)
+            if existing:
+                keep = [i for i, d in enumerate(digests) if d not in existing]
+                digests = [digests[i] for i in keep]
+                vectors = vectors[keep]
+                if not digests:
+                    return
+            if self.dim is None:
+                self.dim = int(vectors.shape[1])
+                self.conn.execute("INSERT OR REPLACE INTO store_meta (key, value) VALUES ('dim', ?)", (str(self.dim),))
+                self.conn.execute("INSERT OR REPLACE INTO store_meta (key, value) VALUES ('model', ?)",
+                                  (self.model_name,))
+            elif vectors.shape[1] != self.dim:
+                raise ValueError(f"임베딩 차원이 다릅니다: 저장소 {self.dim}, 입력 {vectors.shape[1]}")
+            start = self.n_rows
+            mm = self._open_vectors(start + len(digests))
+            mm[start:start + len(digests)] = vectors
+            mm.flush()
+            now = time.time()
+            with self.conn:
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO entries (digest, row, last_used) VALUES (?, ?, ?)",
+                    [(d, start + i, now) for i, d in enumerate(digests)])
+            self.n_rows = start + len(digests)
+
+    def embed(self, docs, encode, batch_size=ENCODE_BATCH):
+        """
+        docs의 임베딩 (len(docs) x dim float32, 입력 순서).
+        저장소에 있는 문서는 읽기만 하고, 없는 문서만 encode(문서 리스트) -> 배열로 batch_size씩 인코딩합니다.
+        """
+        digests = [doc_digest(self.model_name, d) for d in docs]
+        with self._locked(exclusive=False):
+            rows = self.lookup(digests)
+
+        missing = {}
+        for digest, doc in zip(digests, docs):
+            if digest not in rows:
+                missing.setdefault(digest, doc)
+        with self._lock:
+            self.hits += len(docs) - sum(1 for d in digests if d not in rows)
+            self.misses += len(missing)
+
+        # 인코딩은 잠그지 않고, 배치마다 배타 잠금으로 저장
+        pending = list(missing.items())
+        for start in range(0, len(pending), batch_size):
+            batch = pending[start:start + batch_size]
+            self.put([d for d, _ in batch], encode([doc for _, doc in batch]))
+
+        if not docs:
+            return np.empty((0, self.dim or 0), dtype=np.float32)
+
+        # 행 번호 조회와 벡터 읽기는 같은 잠금 안에서 (그 사이 압축으로 행 번호가 바뀌지 않도록)
+        with self._locked():
+            rows = self.lookup(digests)
+            lost = {d: doc for d, doc in zip(digests, docs) if d not in rows}
+            if lost:
+                # 인코딩하는 동안 다른 프로세스의 압축으로 빠진 문서 (드묾): 잠근 채로 다시 인코딩
+                self.put(list(lost), encode(list(lost.values())))
+                rows = self.lookup(digests)
+            used = sorted(set(rows.values()))
+            with self.conn:
+                now = time.time()
+                for start in range(0, len(used), LOOKUP_CHUNK):
+                    chunk = used[start:start + LOOKUP_CHUNK]
+                    self.conn.execute(
+                        f"UPDATE entries SET last_used = ? WHERE row IN ({','.join('?' * len(chunk))})",
+                        [now] + chunk)
+            result = np.array(self._open_vectors(self.n_rows)[[rows[d] for d in digests]], dtype=np.float32)
+
+        if self.n_rows > self.max_rows * COMPACT_SLACK:
+            self.compact()
+        return result
+
+    # ------------------------------------------
+    # 정리
+    # ------------------------------------------
+    def compact(self):
+        """
+        최근 사용 순으로 max_rows개, max_age_days 안에 쓰인 벡터만 남기고 파일을 새로 씁니다.
+        남은 행 수를 돌려줍니다. 다른 프로세스는 다음에 잠글 때 세대가 바뀐 것을 보고 새 파일을 엽니다.
+        """
+        with self._locked():
+            cutoff = time.time() - self.max_age_days * 24 * 3600
+            keep = self.conn.execute(
+                "SELECT digest, row, last_used FROM entries WHERE last_used >= ? ORDER BY last_used DESC LIMIT ?",
+                (cutoff, self.max_rows)).fetchall()
+            keep.sort(key=lambda r: r[1])
+
+            old = self._open_vectors(self.n_rows)
+            generation = (self._meta("generation", int) or 0) + 1
+            new_file = f"vectors-{generation}.f32"
+            new_path = os.path.join(self.dir, new_file)
+            if keep:
+                new = np.memmap(new_path, dtype=np.float32, mode="w+", shape=(len(keep), self.dim))
+                for start in range(0, len(keep), GROW_ROWS):
+                    chunk = keep[start:start + GROW_ROWS]
+                    new[start:start + len(chunk)] = old[[r[1] for r in chunk]]
+                new.flush()
+                del new
+            else:
+                open(new_path, "wb").close()
+            self._close_vectors()
+            del old
+            with self.conn:
+                self.conn.execute("DELETE FROM entries")
+                self.conn.executemany("INSERT INTO entries (digest, row, last_used) VALUES (?, ?, ?)",
+                                      [(digest, i, last_used) for i, (digest, _, last_used) in enumerate(keep)])
+                self.conn.execute("INSERT OR REPLACE INTO store_meta (key, value) VALUES ('vectors_file', ?)",
+                                  (new_file,))
+                self.conn.execute("INSERT OR REPLACE INTO store_meta (key, value) VALUES ('generation', ?)",
+                                  (str(generation),))
+            if os.path.exists(self.vectors_path):
+                os.remove(self.vectors_path)
+            self.vectors_path = new_path
+            self.n_rows = len(keep)
+            return self.n_rows
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "rows": self.n_rows,
+                "hit_ratio": round(self.hits / lookups, 3) if lookups else 0.0}
+
+    def close(self):
+        with self._lock:
+            self._close_vectors()
+            self.conn.close()
+            self._lock_file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
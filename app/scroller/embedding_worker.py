@@ -0,0 +1,364 @@
+import sys
+import os
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(BASE_DIR)
+
+import json
+import time
+import queue
+import argparse
+import threading
+from bisect import bisect_left
+from multiprocessing.connection import Listener, Client
+
+import numpy as np
+
+from app.scroller.embedding import get_backend, EMBEDDING_BACKEND, EMBEDDING_THREADS
+
+# ==========================================
+# [설정] 임베딩 워커
+# ==========================================
+# 같은 호스트의 소비자(클러스터링, API)가 접속하는 주소 "host:port"
+WORKER_ADDRESS = os.getenv("EMBEDDING_WORKER_ADDRESS", "127.0.0.1:6010")
+# 연결은 pickle로 주고받으므로 키를 아는 쪽만 붙을 수 있어야 함 (기본값 없음, 워커/소비자 모두 필수)
+WORKER_AUTHKEY = os.getenv("EMBEDDING_WORKER_AUTHKEY", "").encode("utf-8") or None
+# 동시에 들어온 요청을 이 문서 수까지 한 배치로 묶음
+MAX_BATCH_DOCS = 64
+# 첫 요청이 들어온 뒤 다른 요청을 기다리는 최대 시간 (ms). 혼자 온 요청은 이만큼만 늦어짐
+MAX_WAIT_MS = 10
+# 배치 스레드가 죽는 등 응답이 오지 않을 때 요청을 포기하는 시간 (초)
+REQUEST_TIMEOUT = float(os.getenv("EMBEDDING_WORKER_TIMEOUT", "300"))
+# 히스토그램 구간 상한 (마지막은 그 이상 전부)
+BATCH_SIZE_BUCKETS = [1, 2, 4, 8, 16, 32, 64, 128]
+LATENCY_BUCKETS_MS = [5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000]
+
+
+def parse_address(address):
+    host, port = address.rsplit(":", 1)
+    return host, int(port)
+
+
+def require_authkey(authkey):
+    """ 인증 키 없이 pickle 연결을 열면 주소에 닿는 누구나 워커에서 코드를 실행할 수 있으므로 거부합니다. """
+    if not authkey:
+        raise RuntimeError("EMBEDDING_WORKER_AUTHKEY 환경 변수를 설정해야 임베딩 워커를 쓸 수 있습니다.")
+    return authkey
+
+
+class Histogram:
+    """ 고정 구간 히스토그램 (le_<상한>: 개수, 마지막 구간은 inf) """
+    def __init__(self, bounds):
+        self.bounds = list(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.total = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.total += 1
+        self.sum += value
+
+    def snapshot(self):
+        labels = [f"le_{b}" for b in self.bounds] + ["inf"]
+        return {"buckets": dict(zip(labels, self.counts)), "count": self.total,
+                "mean": round(self.sum / self.total, 2) if self.total else 0.0}
+
+
+class WorkerStats:
+    """ 요청/배치 카운터, 큐 깊이, 배치 크기/지연 시간 히스토그램 (스레드 안전) """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.docs = 0
+        self.batches = 0
+        self.errors = 0
+        self.skipped_docs = 0
+        self.max_queue_depth = 0
+        self.batch_docs = Histogram(BATCH_SIZE_BUCKETS)
+        self.batch_requests = Histogram(BATCH_SIZE_BUCKETS)
+        self.queue_wait_ms = Histogram(LATENCY_BUCKETS_MS)
+        self.encode_ms = Histogram(LATENCY_BUCKETS_MS)
+        self.request_ms = Histogram(LATENCY_BUCKETS_MS)
+
+    def record_request(self, n_docs):
+        with self._lock:
+            self.requests += 1
+            self.docs += n_docs
+
+    def record_depth(self, depth):
+        with self._lock:
+            self.max_queue_depth = max(self.max_queue_depth, depth)
+
+    def record_batch(self, n_docs, n_requests, wait_ms, encode_ms):
+        with self._lock:
+            self.batches += 1
+            self.batch_docs.observe(n_docs)
+            self.batch_requests.observe(n_requests)
+            self.queue_wait_ms.observe(wait_ms)
+            self.encode_ms.observe(encode_ms)
+
+    def record_skipped(self, n_docs):
+        """ 포기된 요청이라 인코딩하지 않은 문서 수 """
+        with self._lock:
+            self.skipped_docs += n_docs
+
+    def record_done(self, latency_ms, failed=False):
+        with self._lock:
+            self.request_ms.observe(latency_ms)
+            self.errors += int(failed)
+
+    def snapshot(self, queue_depth):
+        with self._lock:
+            return {
+                "requests": self.requests, "docs": self.docs, "batches": self.batches, "errors": self.errors,
+                "skipped_docs": self.skipped_docs,
+                "queue_depth": queue_depth, "max_queue_depth": self.max_queue_depth,
+                "batch_docs": self.batch_docs.snapshot(), "batch_requests": self.batch_requests.snapshot(),
+                "queue_wait_ms": self.queue_wait_ms.snapshot(), "encode_ms": self.encode_ms.snapshot(),
+                "request_ms": self.request_ms.snapshot(),
+            }
+
+
+class _Request:
+    """ 소비자 요청 하나. 큰 요청은 MAX_BATCH_DOCS 단위 조각으로 나뉘어 다른 요청과 섞여 처리됩니다. """
+    def __init__(self, n_docs, n_parts):
+        self.vectors = [None] * n_docs
+        self.remaining = n_parts
+        self.error = None
+        self.started = time.monotonic()
+        self.done = threading.Event()
+        # 응답을 기다리던 연결이 시간 초과로 포기함: 남은 조각은 인코딩하지 않음
+        self.abandoned = False
+        self._lock = threading.Lock()
+
+    def finish_part(self, offset, vectors=None, error=None):
+        with self._lock:
+            if error is not None:
+                self.error = error
+            else:
+                self.vectors[offset:offset + len(vectors)] = list(vectors)
+            self.remaining -= 1
+            if self.remaining == 0:
+                self.done.set()
+
+
+class EmbeddingWorker:
+    """
+    모델을 한 번만 올리고 로컬 소켓으로 인코딩 요청을 받는 워커.
+    여러 연결에서 동시에 들어온 요청을 MAX_WAIT_MS 안에서 최대 MAX_BATCH_DOCS 문서 배치로 묶어 인코딩합니다.
+    """
+    def __init__(self, backend_name=EMBEDDING_BACKEND, threads=EMBEDDING_THREADS, address=WORKER_ADDRESS,
+                 authkey=WORKER_AUTHKEY, max_batch_docs=MAX_BATCH_DOCS, max_wait_ms=MAX_WAIT_MS):
+        if backend_name == "worker":
+            raise ValueError("워커는 로컬 백엔드(fp32/int8/onnx)로 실행해야 합니다.")
+        self.backend = get_backend(backend_name, threads=threads)
+        self.address = parse_address(address)
+        self.authkey = require_authkey(authkey)
+        self.max_batch_docs = max_batch_docs
+        self.max_wait = max_wait_ms / 1000
+        self.stats = WorkerStats()
+        self._queue = queue.Queue()
+        self._listener = None
+        self._stopped = threading.Event()
+
+    # ------------------------------------------
+    # 배치 처리
+    # ------------------------------------------
+    def submit(self, texts):
+        """ 요청을 조각내 큐에 넣고 _Request를 돌려줍니다. (done 이벤트로 완료 대기) """
+        texts = [str(t) for t in texts]
+        parts = [(offset, texts[offset:offset + self.max_batch_docs])
+                 for offset in range(0, len(texts), self.max_batch_docs)]
+        request = _Request(len(texts), len(parts))
+        self.stats.record_request(len(texts))
+        if not parts:
+            request.done.set()
+        for offset, chunk in parts:
+            self._queue.put((request, offset, chunk, time.monotonic()))
+        self.stats.record_depth(self._queue.qsize())
+        return request
+
+    def _next_batch(self):
+        """
+        첫 조각을 기다렸다가, 마감(첫 조각 + max_wait)까지 들어온 조각을 배치 한도까지 모읍니다.
+        반환: (조각 목록, 종료 신호를 받았는지) - 종료 신호 앞에 모인 조각은 마저 처리합니다.
+        """
+        batch = []
+        n_docs = 0
+        deadline = None
+        while n_docs < self.max_batch_docs:
+            if deadline is None:
+                part = self._queue.get()
+                deadline = time.monotonic() + self.max_wait
+            else:
+                remaining = deadline - time.monotonic()
+                try:
+                    part = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            if part[0] is None: # 종료 신호
+                return batch, True
+            if part[0].abandoned:
+                self.stats.record_skipped(len(part[2]))
+                continue
+            batch.append(part)
+            n_docs += len(part[2])
+        return batch, False
+
+    def _batch_loop(self):
+        while not self._stopped.is_set():
+            batch, stopping = self._next_batch()
+            # 모으는 동안 포기된 요청도 빼고 인코딩
+            skipped = [part for part in batch if part[0].abandoned]
+            if skipped:
+                self.stats.record_skipped(sum(len(chunk) for _, _, chunk, _ in skipped))
+                batch = [part for part in batch if not part[0].abandoned]
+            if batch:
+                self._encode_batch(batch)
+            if stopping:
+                break
+
+    def _encode_batch(self, batch):
+        texts = [t for _, _, chunk, _ in batch for t in chunk]
+        started = time.monotonic()
+        wait_ms = (started - min(enqueued for _, _, _, enqueued in batch)) * 1000
+        try:
+            vectors = self.backend.encode(texts)
+            error = None
+        except Exception as e:
+            vectors, error = None, f"{type(e).__name__}: {e}"
+        encode_ms = (time.monotonic() - started) * 1000
+        self.stats.record_batch(len(texts), len({id(r) for r, _, _, _ in batch}), wait_ms, encode_ms)
+
+        position = 0
+        for request, offset, chunk, _ in batch:
+            if error is None:
+                request.finish_part(offset, vectors[position:position + len(chunk)])
+            else:
+                request.finish_part(offset, error=error)
+            position += len(chunk)
+
+    # ------------------------------------------
+    # 연결 처리
+    # ------------------------------------------
+    def _handle(self, conn):
+        try:
+            while True:
+                try:
+                    message = conn.recv()
+                except (EOFError, OSError):
+                    break
+                op = message[0]
+                if op == "encode":
+                    request = self.submit(message[1])
+                    if request.done.wait(REQUEST_TIMEOUT):
+                        error = request.error
+                    else:
+                        request.abandoned = True
+                        error = f"{REQUEST_TIMEOUT:.0f}초 안에 인코딩 응답이 없습니다."
+                    self.stats.record_done((time.monotonic() - request.started) * 1000, error is not None)
+                    if error is not None:
+                        conn.send(("error", error))
+                    else:
+                        dim = self.backend.dimension()
+                        conn.send(("ok", np.asarray(request.vectors, dtype=np.float32).reshape(-1, dim)))
+                elif op == "stats":
+                    conn.send(("ok", self.stats.snapshot(self._queue.qsize())))
+                elif op == "info":
+                    conn.send(("ok", {"backend": self.backend.name, "model": self.backend.model_name,
+                                      "dimension": self.backend.dimension()}))
+                else:
+                    conn.send(("error", f"알 수 없는 요청: {op}"))
+        finally:
+            conn.close()
+
+    def serve_forever(self):
+        print(f"🧠 임베딩 모델 로딩 중 ({self.backend.name}: {self.backend.model_name})")
+        self.backend.load()
+        threading.Thread(target=self._batch_loop, name="embedding-batcher", daemon=True).start()
+        # 기본 backlog(1)면 동시에 붙는 소비자가 accept 대기열에서 밀려 수 초씩 멈춤
+        self._listener = Listener(self.address, backlog=64, authkey=self.authkey)
+        print(f"🚀 임베딩 워커 대기 중: {self.address[0]}:{self.address[1]} "
+              f"(배치 최대 {self.max_batch_docs}건, 대기 최대 {self.max_wait * 1000:.0f}ms)")
+        try:
+            while not self._stopped.is_set():
+                try:
+                    conn = self._listener.accept()
+                except OSError:
+                    break
+                except Exception as e: # 인증 실패 등은 그 연결만 버림
+                    print(f"⚠️ 연결 거부: {e}")
+                    continue
+                threading.Thread(target=self._handle, args=(conn,), daemon=True).start()
+        finally:
+            self._listener.close()
+
+    def stop(self):
+        self._stopped.set()
+        self._queue.put((None, 0, [], time.monotonic()))
+        if self._listener is not None:
+            self._listener.close()
+
+
+class EmbeddingClient:
+    """ 임베딩 워커 클라이언트 (연결 하나를 스레드들이 번갈아 사용) """
+    def __init__(self, address=WORKER_ADDRESS, authkey=WORKER_AUTHKEY):
+        self.address = parse_address(address)
+        self.authkey = require_authkey(authkey)
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def _call(self, *message):
+        with self._lock:
+            if self._conn is None:
+                self._conn = Client(self.address, authkey=self.authkey)
+            try:
+                self._conn.send(message)
+                status, payload = self._conn.recv()
+            except (EOFError, OSError):
+                # 워커가 재시작됐으면 다음 호출에서 다시 연결
+                self._conn = None
+                raise
+        if status != "ok":
+            raise RuntimeError(f"임베딩 워커 오류: {payload}")
+        return payload
+
+    def encode(self, texts):
+        return self._call("encode", [str(t) for t in texts])
+
+    def stats(self):
+        return self._call("stats")
+
+    def info(self):
+        return self._call("info")
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="KR-SBERT 임베딩 워커 (모델을 한 번만 올려 여러 소비자가 공유)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    serve_p = sub.add_parser("serve", help="워커 실행")
+    serve_p.add_argument("--backend", default=EMBEDDING_BACKEND)
+    serve_p.add_argument("--threads", type=int, default=EMBEDDING_THREADS)
+    serve_p.add_argument("--address", default=WORKER_ADDRESS)
+    serve_p.add_argument("--max-batch", type=int, default=MAX_BATCH_DOCS)
+    serve_p.add_argument("--max-wait-ms", type=float, default=MAX_WAIT_MS)
+
+    stats_p = sub.add_parser("stats", help="실행 중인 워커의 큐 깊이/배치 크기/지연 시간 출력")
+    stats_p.add_argument("--address", default=WORKER_ADDRESS)
+
+    args = parser.parse_args()
+    if args.command == "serve":
+        EmbeddingWorker(args.backend, args.threads, args.address, max_batch_docs=args.max_batch,
+                        max_wait_ms=args.max_wait_ms).serve_forever()
+    else:
+        client = EmbeddingClient(args.address)
+        print(json.dumps(client.stats(), indent=2, ensure_ascii=False))
+        client.close()
@@ -0,0 +1,153 @@
+import sys
+import os
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(BASE_DIR)
+
+import re
+import hashlib
+from collections import Counter
+
+import numpy as np
+
+# ==========================================
+# [설정] SimHash 지문
+# ==========================================
+# 공백을 정리한 본문의 글자 n-gram을 특징으로 사용 (한국어는 어절 단위보다 조사 변화에 강함)
+SHINGLE_SIZE = 4
+# 이 해밍 거리 이하면 근중복. 4개 밴드(16bit)이므로 3 이하는 밴드 조회만으로 빠짐없이 찾음
+MAX_DISTANCE = 3
+N_BANDS = 4
+BAND_BITS = 16
+# 본문이 이보다 짧으면 지문을 만들지 않음 (짧은 글은 우연히 겹치기 쉬움)
+MIN_TEXT_LENGTH = 50
+# 저작권 꼬리말은 본문 끝 이 글자 수 안에서 시작하는 것만 지움 (본문 중간의 '저작권'/'ⓒ' 이후를 통째로 지우지 않도록)
+FOOTER_CHARS = 100
+
+_BIT_SHIFTS = np.arange(64, dtype=np.uint64)
+# 전재본마다 달라지는 머리말/꼬리말 (지문에서 제외)
+_BOILERPLATE = [
+    re.compile(r"\([^()]{0,20}=[^()]{0,20}\)"),          # (서울=연합뉴스)
+    re.compile(r"\S{2,4}\s*기자\s*="),                   # 홍길동 기자 =
+    re.compile(r"[\w.+-]+@[\w-]+\.[\w.]+"),              # 이메일
+]
+# 크롤러 본문은 줄바꿈 없이 이어붙어 있어 줄 단위가 아니라 끝 FOOTER_CHARS자로 한정
+_FOOTER = re.compile(r"(저작권자|무단\s*전재|Copyright|ⓒ).{0,%d}$" % FOOTER_CHARS, re.S)
+
+
+def normalize_text(text):
+    text = _FOOTER.sub(" ", str(text))
+    for pattern in _BOILERPLATE:
+        text = pattern.sub(" ", text)
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def _shingles(text):
+    return Counter(text[i:i + SHINGLE_SIZE] for i in range(max(len(text) - SHINGLE_SIZE + 1, 0)))
+
+
+def simhash64(text):
+    """ 본문의 64bit SimHash (부호 없는 정수). 너무 짧으면 None """
+    if text is None or len(str(text).strip()) < MIN_TEXT_LENGTH:
+        return None
+    counts = _shingles(normalize_text(text))
+    if not counts:
+        return None
+    hashes = np.fromiter(
+        (int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "big") for s in counts),
+        dtype=np.uint64, count=len(counts))
+    weights = np.fromiter(counts.values(), dtype=np.int64, count=len(counts))
+    bits = ((hashes[:, None] >> _BIT_SHIFTS) & np.uint64(1)).astype(np.int64)
+    votes = (weights[:, None] * (2 * bits - 1)).sum(axis=0)
+    return sum(1 << int(i) for i in np.flatnonzero(votes > 0))
+
+
+def bands(fp):
+    mask = (1 << BAND_BITS) - 1
+    return [(fp >> (BAND_BITS * i)) & mask for i in range(N_BANDS)]
+
+
+def hamming(a, b):
+    return bin(a ^ b).count("1")
+
+
+def to_signed(fp):
+    """ DB(BIGINT)에 넣을 수 있도록 부호 있는 64bit로 """
+    return fp - (1 << 64) if fp >= (1 << 63) else fp
+
+
+def to_unsigned(value):
+    return value + (1 << 64) if value < 0 else value
+
+
+# ==========================================
+# DB 조회 / 등록
+# ==========================================
+def find_near_duplicate(db, fp, max_distance=MAX_DISTANCE):
+    """
+    이미 저장된 기사 중 지문 해밍 거리가 max_distance 이하인 기사 (article_id, 거리). 없으면 None
+    밴드 4개 인덱스 조회만 하므로 기존 본문을 읽지 않습니다.
+    """
+    from sqlalchemy import or_
+    from app.domains.articles.models import ArticleFingerprint
+
+    b = bands(fp)
+    rows = db.query(ArticleFingerprint.article_id, ArticleFingerprint.simhash,
+                    ArticleFingerprint.duplicate_of_id).filter(or_(
+        ArticleFingerprint.band0 == b[0], ArticleFingerprint.band1 == b[1],
+        ArticleFingerprint.band2 == b[2], ArticleFingerprint.band3 == b[3],
+    )).all()
+
+    best = None
+    for article_id, stored, duplicate_of_id in rows:
+        distance = hamming(fp, to_unsigned(stored))
+        if distance <= max_distance and (best is None or distance < best[1]):
+            # 연결된 사본과 겹치면 원본을 가리킴
+            best = (duplicate_of_id or article_id, distance)
+    return best
+
+
+def make_fingerprint(article_id, fp, duplicate_of_id=None):
+    from app.domains.articles.models import ArticleFingerprint
+
+    b = bands(fp)
+    return ArticleFingerprint(article_id=article_id, simhash=to_signed(fp),
+                              band0=b[0], band1=b[1], band2=b[2], band3=b[3],
+                              duplicate_of_id=duplicate_of_id)
+
+
+def backfill_fingerprints(db, batch_size=500):
+    """ 지문이 없는 기존 기사의 지문을 만듭니다. (최초 1회, 본문을 한 번만 읽음) 만든 개수를 돌려줍니다. """
+    from app.domains.articles.models import ArticleBody, ArticleFingerprint
+
+    created = 0
+    last_id = 0
+    while True:
+        rows = (db.query(ArticleBody.article_id, ArticleBody.raw_content)
+                .outerjoin(ArticleFingerprint, ArticleFingerprint.article_id == ArticleBody.article_id)
+                .filter(ArticleFingerprint.article_id.is_(None), ArticleBody.article_id > last_id)
+                .order_by(ArticleBody.article_id).limit(batch_size).all())
+        if not rows:
+            break
+        for article_id, content in rows:
+            fp = simhash64(content)
+            if fp is not None:
+                db.add(make_fingerprint(article_id, fp))
+                created += 1
+        last_id = rows[-1][0]
+        db.commit()
+    return created
+
+
+if __name__ == "__main__":
+    # 기존 기사 지문 채우기: python app/scroller/fingerprint.py
+    from app.core.database import SessionLocal, Base, engine
+    from app.domains.issues.models import IssueLabel  # noqa: F401 (관계 매핑 등록용)
+    from app.domains.publishers.models import Publisher  # noqa: F401
+
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        print(f"🧬 지문 {backfill_fingerprints(db)}건을 만들었습니다.")
+    finally:
+        db.close()
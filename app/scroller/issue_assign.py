@@ -0,0 +1,260 @@
+import sys
+import os
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(BASE_DIR)
+
+import json
+import argparse
+from datetime import timedelta
+
+import numpy as np
+
+from app.scroller.crawl_sink import read_crawl_dataset, DEFAULT_SINK_DIR, ORDER_COLUMNS
+from app.scroller.embedding import get_backend, store_key, topic_document
+from app.scroller.embedding_store import EmbeddingStore
+from app.scroller.article_writer import save_article, SAVED, LINKED, NEAR_DUPLICATE_MODE
+
+# ==========================================
+# [설정] 온라인 이슈 배정
+# ==========================================
+# 이슈 기사들과 중심의 유사도 하위 이 분위수를 배정 기준으로 사용 (너무 낮으면 ASSIGN_MIN_SIMILARITY)
+MEMBER_QUANTILE = 0.05
+ASSIGN_MIN_SIMILARITY = 0.5
+# 전체 재학습 이후 처리한 기사 중 아웃라이어 비율이 이보다 크거나,
+# 배정된 기사의 평균 유사도가 전체 학습 때보다 DRIFT_LIMIT 이상 떨어지면 재학습 필요
+OUTLIER_SHARE_LIMIT = 0.4
+DRIFT_LIMIT = 0.05
+# 이만큼은 처리해야 재학습 여부를 판단
+MIN_ARTICLES_FOR_DECISION = 50
+ASSIGN_COLUMNS = ["press", "title", "content", "image_url", "pub_date", "link"]
+
+
+def _normalize(vectors):
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
+
+
+def compute_centroids(embeddings, topic_ids, topics):
+    """
+    이슈별 (정규화된 평균 벡터, 배정 기준 유사도, 기사 수, 기사-중심 평균 유사도)
+    topic_ids: 문서별 토픽 번호, topics: 중심을 만들 토픽 번호들
+    """
+    embeddings = _normalize(embeddings)
+    topic_ids = np.asarray(topic_ids)
+    centroids = {}
+    for topic in topics:
+        members = embeddings[topic_ids == topic]
+        if not len(members):
+            continue
+        centroid = _normalize(members.mean(axis=0))
+        sims = members @ centroid
+        threshold = max(float(np.quantile(sims, MEMBER_QUANTILE)), ASSIGN_MIN_SIMILARITY)
+        centroids[topic] = (centroid, threshold, len(members), float(sims.mean()))
+    return centroids
+
+
+def nearest_centroid(embeddings, matrix, thresholds):
+    """ 문서별 (가장 가까운 중심 번호 또는 -1, 그 유사도) """
+    if not len(matrix):
+        return np.full(len(embeddings), -1), np.zeros(len(embeddings), dtype=np.float32)
+    sims = _normalize(embeddings) @ matrix.T
+    best = sims.argmax(axis=1)
+    best_sims = sims[np.arange(len(best)), best]
+    return np.where(best_sims >= thresholds[best], best, -1), best_sims
+
+
+def format_cursor(df):
+    """
+    데이터셋 행들의 수집 실행별 마지막 위치 {"crawl_run": crawl_seq} JSON (없으면 None)
+    실행들이 동시에/늦게 써도 실행마다 따로 기억해야 먼저 시작한 실행이 나중에 쓴 행을 건너뛰지 않습니다.
+    """
+    if df.empty or not set(ORDER_COLUMNS) <= set(df.columns):
+        return None
+    last = df.groupby('crawl_run')['crawl_seq'].max()
+    return json.dumps({run: int(seq) for run, seq in last.items()}, sort_keys=True)
+
+
+def _after_cursor(df, cursor):
+    if cursor is None or df.empty:
+        return df
+    if not cursor.startswith("{"):
+        # 이전 형식 "crawl_run|crawl_seq" (실행 하나의 위치만 기억)
+        run, seq = cursor.rsplit("|", 1)
+        later = (df['crawl_run'] > run) | ((df['crawl_run'] == run) & (df['crawl_seq'] > int(seq)))
+        return df[later]
+    seen = json.loads(cursor)
+    # 처음 보는 실행은 전부 새 행
+    last_seq = df['crawl_run'].map(seen).fillna(-1)
+    return df[df['crawl_seq'] > last_seq]
+
+
+# ==========================================
+# DB 기록
+# ==========================================
+def record_full_run(db, embedding_key, centroids_by_issue, cursor=None):
+    """
+    전체 재학습 결과의 이슈 중심을 저장합니다. (commit은 호출부에서)
+    centroids_by_issue: issue_label_id -> compute_centroids의 값
+    """
+    from app.domains.issues.models import ClusteringRun, IssueCentroid
+
+    values = list(centroids_by_issue.values())
+    n_articles = sum(v[2] for v in values)
+    run = ClusteringRun(
+        kind="full", embedding_key=embedding_key, n_articles=n_articles, n_assigned=n_articles, n_outliers=0,
+        mean_similarity=(sum(v[3] * v[2] for v in values) / n_articles) if n_articles else None,
+        cursor=cursor,
+    )
+    db.add(run)
+    db.flush()
+    for issue_id, (centroid, threshold, n, _) in centroids_by_issue.items():
+        db.add(IssueCentroid(issue_label_id=issue_id, run_id=run.id, centroid=centroid.astype(np.float32).tobytes(),
+                             threshold=threshold, n_articles=n))
+    return run
+
+
+def latest_full_run(db):
+    from app.domains.issues.models import ClusteringRun
+    return db.query(ClusteringRun).filter(ClusteringRun.kind == "full").order_by(ClusteringRun.id.desc()).first()
+
+
+def load_centroids(db, run):
+    """ (issue_label_id 배열, 중심 행렬, 배정 기준 배열) """
+    from app.domains.issues.models import IssueCentroid
+
+    rows = db.query(IssueCentroid).filter(IssueCentroid.run_id == run.id).order_by(IssueCentroid.issue_label_id).all()
+    if not rows:
+        return np.empty(0, dtype=np.int64), np.empty((0, 0), dtype=np.float32), np.empty(0, dtype=np.float32)
+    return (np.array([r.issue_label_id for r in rows]),
+            np.stack([np.frombuffer(r.centroid, dtype=np.float32) for r in rows]),
+            np.array([r.threshold for r in rows], dtype=np.float32))
+
+
+def _online_runs(db, full_run):
+    from app.domains.issues.models import ClusteringRun
+    return (db.query(ClusteringRun).filter(ClusteringRun.kind == "online", ClusteringRun.id > full_run.id)
+            .order_by(ClusteringRun.id).all())
+
+
+def recluster_status(db):
+    """
+    마지막 전체 재학습 이후의 온라인 배정 결과로 재학습이 필요한지 판단합니다.
+    반환: (필요 여부, 이유)
+    """
+    full_run = latest_full_run(db)
+    if full_run is None:
+        return True, "전체 학습 기록이 없음"
+    runs = _online_runs(db, full_run)
+    total = sum(r.n_articles for r in runs)
+    if total < MIN_ARTICLES_FOR_DECISION:
+        return False, f"새 기사 {total}건 (판단 기준 {MIN_ARTICLES_FOR_DECISION}건 미만)"
+    outliers = sum(r.n_outliers for r in runs)
+    share = outliers / total
+    if share > OUTLIER_SHARE_LIMIT:
+        return True, f"아웃라이어 비율 {share:.0%} > {OUTLIER_SHARE_LIMIT:.0%}"
+    assigned = sum(r.n_assigned for r in runs)
+    if assigned and full_run.mean_similarity is not None:
+        mean_sim = sum((r.mean_similarity or 0.0) * r.n_assigned for r in runs) / assigned
+        if full_run.mean_similarity - mean_sim > DRIFT_LIMIT:
+            return True, f"평균 유사도 {full_run.mean_similarity:.3f} -> {mean_sim:.3f}"
+    return False, f"아웃라이어 비율 {share:.0%}, 새 기사 {total}건"
+
+
+# ==========================================
+# 온라인 배정
+# ==========================================
+def assign_new_articles(source=DEFAULT_SINK_DIR, backend=None, near_duplicate=NEAR_DUPLICATE_MODE):
+    """
+    마지막 실행 이후 수집된 기사를 마지막 전체 학습의 이슈 중심에 배정해 저장하고 이슈 기사 수를 늘립니다.
+    어느 이슈에도 가깝지 않은 기사는 저장하지 않고 아웃라이어로만 셉니다. (다음 전체 재학습에서 다시 봄)
+    반환: ClusteringRun (online) 또는 None
+    """
+    from app.core.database import SessionLocal, Base, engine
+    from app.domains.issues.models import IssueLabel, ClusteringRun
+    from app.domains.publishers.models import Publisher  # noqa: F401 (관계 매핑 등록용)
+
+    Base.metadata.create_all(bind=engine)
+    backend = backend or get_backend()
+    db = SessionLocal()
+    try:
+        full_run = latest_full_run(db)
+        if full_run is None:
+            print("⚠️ 전체 학습 기록이 없어 배정할 이슈가 없습니다.")
+            return None
+        embedding_key = store_key(backend)
+        if full_run.embedding_key != embedding_key:
+            print(f"⚠️ 이슈 중심({full_run.embedding_key})과 임베딩({embedding_key})이 달라 배정할 수 없습니다.")
+            return None
+
+        issue_ids, matrix, thresholds = load_centroids(db, full_run)
+        runs = _online_runs(db, full_run)
+        cursor = runs[-1].cursor if runs and runs[-1].cursor else full_run.cursor
+        start_date = (full_run.created_at - timedelta(days=1)).strftime("%Y-%m-%d")
+        dataset = read_crawl_dataset(source, columns=ASSIGN_COLUMNS + ORDER_COLUMNS, start_date=start_date)
+        df = _after_cursor(dataset, cursor).reset_index(drop=True)
+        if df.empty:
+            print("새로 수집된 기사가 없습니다.")
+            return None
+
+        docs = [topic_document(t, c) for t, c in zip(df['title'], df['content'])]
+        with EmbeddingStore(embedding_key) as store:
+            embeddings = store.embed(docs, backend.encode)
+        best, sims = nearest_centroid(embeddings, matrix, thresholds)
+
+        assigned_sims = []
+        added = {}
+        for i, row_art in df.iterrows():
+            if best[i] < 0:
+                continue
+            issue_id = int(issue_ids[best[i]])
+            result, _ = save_article(db, row_art, issue_id, near_duplicate)
+            if result in (SAVED, LINKED):
+                added[issue_id] = added.get(issue_id, 0) + 1
+                assigned_sims.append(float(sims[i]))
+        for issue_id, n in added.items():
+            issue = db.get(IssueLabel, issue_id)
+            issue.total_count = (issue.total_count or 0) + n
+
+        run = ClusteringRun(
+            kind="online", embedding_key=embedding_key, n_articles=len(df), n_assigned=len(assigned_sims),
+            n_outliers=int((best < 0).sum()),
+            mean_similarity=float(np.mean(assigned_sims)) if assigned_sims else None,
+            # 읽은 범위 전체 기준으로 기록 (범위에 있는 실행들의 위치가 모두 남도록)
+            cursor=format_cursor(dataset) or cursor,
+        )
+        db.add(run)
+        db.commit()
+        print(f"🧭 새 기사 {len(df)}건: 이슈 배정 {run.n_assigned}건, 아웃라이어 {run.n_outliers}건 "
+              f"(이슈 {len(added)}개 갱신)")
+        return run
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="주중에 수집된 기사를 기존 이슈에 배정 (전체 재학습 없이)")
+    parser.add_argument("--source", default=DEFAULT_SINK_DIR, help="crawl_sink 데이터셋 디렉터리")
+    parser.add_argument("--recluster", action="store_true", help="재학습 기준을 넘으면 전체 재학습 실행")
+    parser.add_argument("--near-duplicate", choices=["reject", "link", "none"], default=NEAR_DUPLICATE_MODE or "none",
+                        help="이전 기사와 본문이 거의 같은 기사 처리 (기본: NEAR_DUPLICATE_MODE, 없으면 검사 안 함)")
+    args = parser.parse_args()
+
+    assign_new_articles(args.source, near_duplicate=None if args.near_duplicate == "none" else args.near_duplicate)
+
+    from app.core.database import SessionLocal
+    db = SessionLocal()
+    try:
+        needed, reason = recluster_status(db)
+    finally:
+        db.close()
+    print(f"{'🔁 전체 재학습 필요' if needed else '✅ 재학습 불필요'}: {reason}")
+    if needed and args.recluster:
+        from app.scroller.clustering import analyze_weekly_top10
+        from datetime import datetime
+        week_start = (datetime.now() - timedelta(days=6)).strftime("%Y-%m-%d")
+        analyze_weekly_top10(args.source, start_date=week_start)
@@ -0,0 +1,136 @@
+import os
+import json
+import time
+
+from app.core.llm_client import get_llm_client
+from app.core.llm_scheduler import BATCH
+
+# ==========================================
+# [설정] 이슈 제목 생성 (Gemini)
+# ==========================================
+LABEL_MODEL = "gemini-2.0-flash"
+# batch: 상위 이슈 전체를 한 번에 요청하고, 파싱 못 한 이슈만 하나씩 다시 요청
+# single: 이슈마다 한 번씩 요청 (기존 방식)
+LABEL_MODE = os.getenv("LABEL_MODE", "batch")
+# 이슈 하나당 프롬프트에 넣는 제목 수
+TITLES_PER_TOPIC = 10
+# 제목 길이 제한 (작성 규칙의 15자 + 여유). 넘으면 파싱 실패로 보고 개별 요청
+MAX_LABEL_LENGTH = 30
+
+LABEL_RULES = """
+        [작성 규칙]
+        1. 15자 이내로 짧게 작성할 것.
+        2. 주관적이거나 자극적인 표현을 배제할 것 (중립적 어조).
+        3. '~논란', '~발표', '~개최' 등 명사형으로 끝맺을 것."""
+
+
+def get_model():
+    """ 공용 LLM 클라이언트 (배치 우선순위: 대화형 요청이 먼저 나감, 같은 프롬프트는 응답 캐시 재사용) """
+    return get_llm_client(LABEL_MODEL, priority=BATCH)
+
+
+def _clean_label(text):
+    return str(text).strip().replace('"', '').replace("'", "")
+
+
+def generate_title(titles, model=None):
+    """ 이슈 하나의 제목 요청. 실패하면 첫 기사 제목 """
+    try:
+        model = model or get_model()
+        prompt = f"""
+        다음은 동일한 뉴스 사건에 대한 기사 제목들입니다:
+        {titles[:TITLES_PER_TOPIC]} (총 {len(titles)}건)
+
+        이 뉴스들을 모두 포괄하는 **하나의 간결하고 중립적인 이슈 제목**을 작성해주세요.
+        {LABEL_RULES}
+        4. 따옴표나 설명 없이 오직 제목 텍스트만 출력할 것.
+        """
+        response = model.generate_content(prompt)
+        return _clean_label(response.text)
+    except Exception as e:
+        print(f"   ⚠️ Gemini 호출 실패: {e}")
+        return titles[0]
+
+
+def build_batch_prompt(topic_titles):
+    """ topic_titles: topic_id -> 기사 제목 리스트 """
+    blocks = "\n".join(
+        f"[이슈 {topic_id}] (총 {len(titles)}건) {titles[:TITLES_PER_TOPIC]}"
+        for topic_id, titles in topic_titles.items()
+    )
+    return f"""
+        다음은 뉴스 이슈별 기사 제목들입니다. 각 이슈는 동일한 뉴스 사건에 대한 기사들입니다.
+        {blocks}
+
+        각 이슈마다 그 기사들을 모두 포괄하는 **하나의 간결하고 중립적인 이슈 제목**을 작성해주세요.
+        {LABEL_RULES}
+        4. 모든 이슈 번호에 대해 하나씩, 아래 JSON 형식으로만 출력할 것.
+
+        [출력 형식 (JSON)]
+        {{"labels": [{{"topic_id": 이슈 번호, "label": "이슈 제목"}}]}}
+        """
+
+
+def parse_batch_labels(text, topic_ids):
+    """ 배치 응답에서 topic_id -> 제목. 형식이 어긋난 항목은 빠짐 """
+    clean_text = str(text).strip().replace("```json", "").replace("```", "")
+    try:
+        data = json.loads(clean_text)
+    except ValueError:
+        return {}
+    items = data.get("labels", []) if isinstance(data, dict) else data
+    if not isinstance(items, list):
+        return {}
+
+    wanted = {str(t): t for t in topic_ids}
+    labels = {}
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        topic_id = wanted.get(str(item.get("topic_id")).strip())
+        label = _clean_label(item.get("label") or "")
+        if topic_id is not None and topic_id not in labels and 0 < len(label) <= MAX_LABEL_LENGTH:
+            labels[topic_id] = label
+    return labels
+
+
+def label_topics(topic_titles, model=None, mode=None):
+    """
+    이슈별 제목 생성. topic_titles: topic_id -> 기사 제목 리스트 (순서 유지)
+    - batch: 한 번의 JSON 요청으로 전부 받고, 응답에 없거나 형식이 어긋난 이슈만 개별 요청
+    - single: 이슈마다 개별 요청
+    반환: (topic_id -> 제목, 통계 {"requests", "fallbacks", "seconds"})
+    """
+    mode = mode or LABEL_MODE
+    start = time.perf_counter()
+    model = model or get_model()
+    labels = {}
+    requests = 0
+
+    if mode == "batch" and topic_titles:
+        try:
+            prompt = build_batch_prompt(topic_titles)
+            generation_config = {"response_mime_type": "application/json"}
+            response = model.generate_content(prompt, generation_config=generation_config)
+            labels = parse_batch_labels(response.text, list(topic_titles))
+            if not labels and hasattr(model, "invalidate"):
+                # 전혀 파싱하지 못한 응답은 캐시에 남기지 않음 (다음 실행에서 다시 요청)
+                model.invalidate(prompt, generation_config)
+        except Exception as e:
+            print(f"   ⚠️ Gemini 배치 호출 실패, 이슈별로 요청합니다: {e}")
+        requests += 1
+
+    missing = [topic_id for topic_id in topic_titles if topic_id not in labels]
+    # 요청 간격/429 재시도는 공용 스케줄러가 맡음
+    for topic_id in missing:
+        labels[topic_id] = generate_title(topic_titles[topic_id], model)
+        requests += 1
+
+    stats = {
+        "requests": requests,
+        "fallbacks": len(missing) if mode == "batch" else 0,
+        "seconds": time.perf_counter() - start,
+    }
+    print(f"🏷️ 이슈 제목 {len(labels)}개 생성 ({mode}): 요청 {requests}회, "
+          f"개별 재요청 {stats['fallbacks']}개, {stats['seconds']:.1f}초")
+    return {topic_id: labels[topic_id] for topic_id in topic_titles}, stats
@@ -1,13 +1,20 @@
-import requests
 import os
+import asyncio
+import threading
+import time
 from dotenv import load_dotenv
 import json
-import google.generativeai as genai
 from newspaper import Article
 from datetime import datetime
 from collections import Counter
 import html
 import re
+import unicodedata
+from app.core.http_client import get_http_client, AsyncHttpClient
+from app.core.html_cache import get_html_cache
+from app.core.llm_client import get_llm_client
+from app.core.llm_scheduler import INTERACTIVE
+from app.core.result_cache import ResultCache
 
 
 # Load .env from backend root
@@ -16,50 +23,119 @@ load_dotenv(os.path.join(BASE_DIR, ".env"))
 
 NAVER_CLIENT_ID = os.getenv("NAVER_CLIENT_ID")
 NAVER_CLIENT_SECRET = os.getenv("NAVER_CLIENT_SECRET")
-GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
+NAVER_SEARCH_URL = "https://openapi.naver.com/v1/search/news.json"
+BRIEFING_MODEL = 'gemini-2.0-flash'
+# 검색 결과 수 / 본문까지 가져오는 상위 기사 수
+SEARCH_DISPLAY = 15
+FULL_TEXT_TOP_N = 3
+# 공유 에이전트의 비동기 커넥션 풀 크기 (동시 요청 전체가 나눠 씀)
+ASYNC_MAX_CONNECTIONS = 32
+# /scroller/nlp 요청 하나의 전체 마감 시간 (초)과 단계별 예산
+# 검색/본문 단계는 예산과 남은 시간 중 짧은 쪽, 브리핑은 남은 시간 전부를 씀
+NLP_DEADLINE = float(os.getenv("NLP_DEADLINE", "15"))
+SEARCH_BUDGET = 3.0
+FULL_TEXT_BUDGET = 4.0
+# 같은 검색어 결과 재사용: 속보 때 몰리는 같은 질의는 TTL 동안 한 번만 계산 (0이면 저장 안 함, 동시 요청 합치기만)
+NLP_RESULT_TTL = float(os.getenv("NLP_RESULT_TTL", "120"))
+NLP_RESULT_MAX_ENTRIES = int(os.getenv("NLP_RESULT_MAX_ENTRIES", "256"))
+
+
+class Deadline:
+    """ 요청 마감 시각. budget(초)은 단계 예산과 남은 시간 중 짧은 쪽 """
+    def __init__(self, seconds):
+        self.expires = time.monotonic() + seconds
+
+    def remaining(self):
+        return max(0.0, self.expires - time.monotonic())
+
+    def budget(self, seconds=None):
+        remaining = self.remaining()
+        return remaining if seconds is None else min(seconds, remaining)
+
+
+def normalize_query(query):
+    """ 결과 캐시 키: 전각/반각 통일, 소문자, 공백 정리, 앞뒤 따옴표/물음표 등 제거 """
+    query = unicodedata.normalize("NFKC", str(query)).lower()
+    return " ".join(query.split()).strip(" \"'?!.,")
+
+
+def is_cacheable(result):
+    """ 줄이지 않고 끝까지 만든 성공 응답만 저장 (실패/부분 결과는 다음 요청에서 다시 계산) """
+    return bool(result.get("success")) and not result.get("degraded")
+
+
+_shared_results = None
+_results_lock = threading.Lock()
+
+
+def get_result_cache():
+    """ 프로세스 전역 검색어 결과 캐시 (동기/비동기 에이전트가 공유) """
+    global _shared_results
+    if _shared_results is None:
+        with _results_lock:
+            if _shared_results is None:
+                _shared_results = ResultCache(NLP_RESULT_TTL, NLP_RESULT_MAX_ENTRIES, cacheable=is_cacheable)
+    return _shared_results
+
+
+def with_query(result, user_query):
+    """ 합쳐진/캐시된 응답에 이번 요청의 원래 검색어를 넣음 """
+    if result.get("data"):
+        result["data"]["original_query"] = user_query
+    return result
 
-genai.configure(api_key=GOOGLE_API_KEY)
 
 class NewsBriefingAgent:
-    def __init__(self):
+    def __init__(self, cache=None, results=None):
         self.headers = {
             "X-Naver-Client-Id": NAVER_CLIENT_ID,
             "X-Naver-Client-Secret": NAVER_CLIENT_SECRET
         }
+        # 크롤러와 같은 커넥션 풀/재시도 정책을 공유
+        self.http = get_http_client()
+        # 기사 본문 HTML은 크롤러와 같은 디스크 캐시를 거쳐서 가져옴
+        self.cache = cache or get_html_cache()
+        # 같은 기사들로 만든 브리핑 요청은 LLM 응답 캐시에서 재사용
+        # 사용자가 기다리는 요청이라 배치 제목 생성보다 먼저 호출
+        self.llm = get_llm_client(BRIEFING_MODEL, priority=INTERACTIVE)
+        # 같은(정규화된) 검색어의 결과 캐시 + 동시 요청 합치기
+        self.results = results or get_result_cache()
 
     def search_naver(self, query, display=10):
         """ 네이버 뉴스 검색 """
-        url = "https://openapi.naver.com/v1/search/news.json"
         params = {"query": query, "display": display, "sort": "date"}
         try:
-            res = requests.get(url, headers=self.headers, params=params)
+            res = self.http.get(NAVER_SEARCH_URL, headers=self.headers, params=params)
             return res.json().get('items', []) if res.status_code == 200 else []
         except:
             return []
 
+    def parse_full_content(self, url, html_text):
+        """ 기사 HTML에서 본문 추출 (너무 짧으면 None) """
+        article = Article(url, language='ko')
+        article.download(input_html=html_text)
+        article.parse()
+        if len(article.text) < 50: return None
+        return article.text
+
     def fetch_full_content(self, url):
         """ 기사 본문 스크래핑 (상위 기사용) """
         try:
-            article = Article(url, language='ko')
-            article.download()
-            article.parse()
-            if len(article.text) < 50: return None
-            return article.text
+            res = self.cache.fetch(url, "article")
+            if res.status_code != 200: return None
+            return self.parse_full_content(url, res.text)
         except:
             return None
 
-    def generate_briefing(self, query, articles_data):
-        try:
-            model = genai.GenerativeModel('gemini-2.0-flash')
-            
-            # AI에게 줄 컨텍스트 데이터 구성
-            context_text = ""
-            for i, art in enumerate(articles_data):
-                # 상위 3개는 본문 전체, 나머지는 요약본만 제공 (토큰 절약 및 속도)
-                content = art.get('full_text', art['description']) 
-                context_text += f"[{i+1}] 언론사: {art['source']} | 제목: {art['title']}\n내용: {content[:1000]}\n\n"
-
-            prompt = f"""
+    def build_briefing_prompt(self, query, articles_data):
+        # AI에게 줄 컨텍스트 데이터 구성
+        context_text = ""
+        for i, art in enumerate(articles_data):
+            # 상위 3개는 본문 전체, 나머지는 요약본만 제공 (토큰 절약 및 속도)
+            content = art.get('full_text', art['description']) 
+            context_text += f"[{i+1}] 언론사: {art['source']} | 제목: {art['title']}\n내용: {content[:1000]}\n\n"
+
+        return f"""
             당신은 정치/사회 이슈 전문 분석가입니다.
             사용자가 요청한 검색어: "{query}"
             
@@ -79,11 +155,21 @@ class NewsBriefingAgent:
                 "keywords": ["키워드1", "키워드2", "키워드3", "키워드4", "키워드5"]
             }}
             """
-            
-            response = model.generate_content(prompt)
-            clean_text = response.text.strip().replace("```json", "").replace("```", "")
+
+    def parse_briefing(self, prompt, text):
+        """ 브리핑 응답 JSON 파싱. 파싱 못 한 응답은 캐시에 남기지 않음 """
+        clean_text = text.strip().replace("```json", "").replace("```", "")
+        try:
             return json.loads(clean_text)
-            
+        except ValueError:
+            self.llm.invalidate(prompt)
+            raise
+
+    def generate_briefing(self, query, articles_data):
+        try:
+            prompt = self.build_briefing_prompt(query, articles_data)
+            response = self.llm.generate(prompt)
+            return self.parse_briefing(prompt, response.text)
         except Exception as e:
             print(f"⚠️ 브리핑 생성 실패: {e}")
             return None
@@ -123,53 +209,38 @@ class NewsBriefingAgent:
         
         return "기타 언론사" # 매핑 리스트에 없는 경우
 
-    def run(self, user_query):
-        print(f"🔍 '{user_query}' 관련 기사 수집 중...")
-        
-        # 1. 검색 (15개 가져옴)
-        items = self.search_naver(user_query, display=15)
-        if not items: 
-            print("❌ 네이버 검색 결과가 없습니다.")
-            return {"success": False}
-
-        processed_articles = []
-        source_counter = Counter()
-
-        # 2. 데이터 가공 (상위 3개만 Deep Dive)
-        for idx, item in enumerate(items):
-            # 언론사명 파싱
-            press_name = self.get_press_name(item['link'], item.get('originallink'))
-
-            art_data = {
-                "title": self.clean_text(item['title']),
-                "link": item['link'],
-                "description": self.clean_text(item['description']),
-                "pubDate": item['pubDate'],
-                "source": press_name
-            }
-
-            # 상위 3개는 본문 긁어오기
-            if idx < 3:
-                full_text = self.fetch_full_content(item['link'])
-                if full_text:
-                    art_data['full_text'] = full_text
-            
-            processed_articles.append(art_data)
-            source_counter[press_name] += 1
+    def article_data(self, item):
+        """ 검색 결과 하나 -> 브리핑/응답용 기사 데이터 """
+        # 언론사명 파싱
+        press_name = self.get_press_name(item['link'], item.get('originallink'))
+        return {
+            "title": self.clean_text(item['title']),
+            "link": item['link'],
+            "description": self.clean_text(item['description']),
+            "pubDate": item['pubDate'],
+            "source": press_name
+        }
 
-        # 3. 종합 브리핑 생성
-        print("🤖 AI 분석가가 보고서를 작성 중입니다...")
-        briefing = self.generate_briefing(user_query, processed_articles)
-        
+    def build_result(self, user_query, processed_articles, briefing, degraded=()):
+        """
+        브리핑 결과로 API 응답 구성
+        degraded: 마감 시간 때문에 줄여서 처리한 단계 ("search", "full_text", "briefing")
+        """
+        degraded = list(degraded)
+        # 브리핑이 시간 안에 안 끝났으면 요약 없이 기사 목록만 응답 (부분 결과)
+        if not briefing and "briefing" in degraded:
+            briefing = {}
         # 브리핑 실패 시 예외 처리
-        if not briefing:
+        elif not briefing:
              return {
                 "success": False,
-                "message": "AI 브리핑 생성에 실패했습니다."
+                "message": "AI 브리핑 생성에 실패했습니다.",
+                "degraded": degraded
             }
 
         # 4. Response Body 구성
         final_keywords = briefing.get('keywords', [])
+        source_counter = Counter(art['source'] for art in processed_articles)
         
         # 기사 리스트 포맷팅
         formatted_articles = []
@@ -197,9 +268,171 @@ class NewsBriefingAgent:
                 "total_results": len(formatted_articles),
                 "articles": formatted_articles,
                 "by_source": dict(source_counter)
-            }
+            },
+            "degraded": degraded
         }
 
+    def run(self, user_query):
+        """ 결과 캐시를 거친 run. 같은 검색어로 계산 중이면 그 결과를 함께 받음 """
+        result = self.results.get_or_compute(normalize_query(user_query), lambda: self.compute(user_query))
+        return with_query(result, user_query)
+
+    def compute(self, user_query):
+        print(f"🔍 '{user_query}' 관련 기사 수집 중...")
+        
+        # 1. 검색 (15개 가져옴)
+        items = self.search_naver(user_query, display=SEARCH_DISPLAY)
+        if not items: 
+            print("❌ 네이버 검색 결과가 없습니다.")
+            return {"success": False}
+
+        # 2. 데이터 가공 (상위 3개만 Deep Dive)
+        processed_articles = []
+        for idx, item in enumerate(items):
+            art_data = self.article_data(item)
+
+            # 상위 3개는 본문 긁어오기
+            if idx < FULL_TEXT_TOP_N:
+                full_text = self.fetch_full_content(item['link'])
+                if full_text:
+                    art_data['full_text'] = full_text
+            
+            processed_articles.append(art_data)
+
+        # 3. 종합 브리핑 생성
+        print("🤖 AI 분석가가 보고서를 작성 중입니다...")
+        briefing = self.generate_briefing(user_query, processed_articles)
+        return self.build_result(user_query, processed_articles, briefing)
+
+
+class AsyncNewsBriefingAgent(NewsBriefingAgent):
+    """
+    NewsBriefingAgent의 asyncio 버전 (/scroller/nlp용)
+    - 네이버 검색과 본문 요청은 공용 비동기 커넥션 풀(AsyncHttpClient), 상위 기사 본문은 동시에 요청
+    - 본문 추출(newspaper 파싱)은 CPU 작업이라 스레드에서 처리
+    - 브리핑은 Gemini async API + 공용 LLM 스케줄러
+    요청마다 만들지 않고 get_briefing_agent()로 프로세스에서 하나를 공유합니다.
+    """
+    def __init__(self, cache=None, http=None, results=None):
+        super().__init__(cache, results)
+        self.ahttp = http or AsyncHttpClient(max_connections=ASYNC_MAX_CONNECTIONS)
+
+    async def asearch_naver(self, query, display=10):
+        params = {"query": query, "display": display, "sort": "date"}
+        try:
+            # httpx는 값이 None인 헤더를 받지 않음 (requests는 알아서 뺌)
+            headers = {k: v for k, v in self.headers.items() if v is not None}
+            res = await self.ahttp.get(NAVER_SEARCH_URL, headers=headers, params=params)
+            return res.json().get('items', []) if res.status_code == 200 else []
+        except Exception:
+            return []
+
+    async def afetch_full_content(self, url):
+        try:
+            res = await self.cache.afetch(url, "article", self.ahttp)
+            if res.status_code != 200: return None
+            return await asyncio.to_thread(self.parse_full_content, url, res.text)
+        except Exception:
+            return None
+
+    async def agenerate_briefing(self, query, articles_data):
+        try:
+            prompt = self.build_briefing_prompt(query, articles_data)
+            response = await self.llm.agenerate(prompt)
+            return self.parse_briefing(prompt, response.text)
+        except Exception as e:
+            print(f"⚠️ 브리핑 생성 실패: {e}")
+            return None
+
+    async def afetch_full_texts(self, articles, timeout):
+        """
+        articles의 본문을 동시에 요청해 'full_text'를 채움 (실패/시간 초과 기사는 description만 사용)
+        반환: 시간 안에 못 받은 기사 수
+        """
+        tasks = [asyncio.ensure_future(self.afetch_full_content(art['link'])) for art in articles]
+        if not tasks:
+            return 0
+        done, pending = await asyncio.wait(tasks, timeout=timeout)
+        for task in pending:
+            task.cancel()
+        # 취소가 끝날 때까지 기다려야 마감 뒤에도 돌거나 "Task was destroyed" 경고가 남지 않음
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        for art_data, task in zip(articles, tasks):
+            if task in done and task.result():
+                art_data['full_text'] = task.result()
+        return len(pending)
+
+    async def arun(self, user_query, deadline=None):
+        """ 결과 캐시를 거친 acompute. 같은 검색어로 계산 중이면 그 결과를 함께 받음 (마감 시간도 먼저 온 요청 기준) """
+        result = await self.results.aget_or_compute(normalize_query(user_query),
+                                                    lambda: self.acompute(user_query, deadline))
+        return with_query(result, user_query)
+
+    async def acompute(self, user_query, deadline=None):
+        """
+        deadline(초, 기본 NLP_DEADLINE) 안에 응답. 단계별 예산을 넘기면
+        - 검색: 실패 응답
+        - 본문: 못 받은 기사는 description으로 브리핑
+        - 브리핑: 요약 없이 기사 목록만 응답
+        으로 줄이고, 줄인 단계는 응답의 "degraded"에 담습니다.
+        """
+        deadline = Deadline(NLP_DEADLINE if deadline is None else deadline)
+        degraded = []
+        print(f"🔍 '{user_query}' 관련 기사 수집 중...")
+
+        try:
+            items = await asyncio.wait_for(self.asearch_naver(user_query, display=SEARCH_DISPLAY),
+                                           deadline.budget(SEARCH_BUDGET))
+        except asyncio.TimeoutError:
+            print("⏱️ 네이버 검색 시간 초과")
+            return {"success": False, "message": "뉴스 검색 시간이 초과되었습니다.", "degraded": ["search"]}
+        if not items:
+            print("❌ 네이버 검색 결과가 없습니다.")
+            return {"success": False}
+
+        processed_articles = [self.article_data(item) for item in items]
+        # 상위 기사 본문은 동시에 요청
+        missed = await self.afetch_full_texts(processed_articles[:FULL_TEXT_TOP_N], deadline.budget(FULL_TEXT_BUDGET))
+        if missed:
+            print(f"⏱️ 본문 {missed}건 시간 초과, 요약본으로 대체")
+            degraded.append("full_text")
+
+        print("🤖 AI 분석가가 보고서를 작성 중입니다...")
+        try:
+            briefing = await asyncio.wait_for(self.agenerate_briefing(user_query, processed_articles),
+                                              deadline.budget())
+        except asyncio.TimeoutError:
+            print("⏱️ 브리핑 생성 시간 초과, 기사 목록만 응답합니다.")
+            briefing = None
+            degraded.append("briefing")
+        return self.build_result(user_query, processed_articles, briefing, degraded)
+
+    async def aclose(self):
+        await self.ahttp.aclose()
+
+
+_shared_agent = None
+_shared_lock = threading.Lock()
+
+
+def get_briefing_agent():
+    """ 프로세스 전역 공용 AsyncNewsBriefingAgent (커넥션 풀/캐시/LLM 클라이언트를 요청들이 공유) """
+    global _shared_agent
+    if _shared_agent is None:
+        with _shared_lock:
+            if _shared_agent is None:
+                _shared_agent = AsyncNewsBriefingAgent()
+    return _shared_agent
+
+
+async def close_briefing_agent():
+    global _shared_agent
+    if _shared_agent is not None:
+        await _shared_agent.aclose()
+        _shared_agent = None
+
+
 # ==========================================
 # 실행
 # ==========================================
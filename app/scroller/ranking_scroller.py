@@ -1,31 +1,82 @@
-import requests
+import sys
+import os
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(BASE_DIR)
+
 from bs4 import BeautifulSoup
 import pandas as pd
+import re
 import time
 import random
+import argparse
 from datetime import datetime, timedelta
+from app.core.http_client import get_http_client
+from app.core.html_cache import get_html_cache
+try:
+    from app.scroller.article_extractor import extract_article_detail
+except ImportError: # lxml이 없으면 BeautifulSoup 경로만 사용
+    extract_article_detail = None
+from app.scroller.crawl_index import CrawlIndex, DEFAULT_INDEX_PATH, COLLECTED, SEEN_ONLY, naver_article_id
+from app.scroller.section_filter import SectionPrefilter, section_hint, REJECT, DEFAULT_VERIFY_RATE
+from app.scroller.crawl_sink import open_sink, DEFAULT_SINK_DIR
 
 # ==========================================
 # [설정] 수집 대상
 # ==========================================
 TARGET_PRESS_DICT = {
-    "한겨레": "028", "경향신문": "032", 
+    "한겨레": "028", "경향신문": "032",
     "조선일보": "023", "동아일보": "020", "연합뉴스": "001"
 }
 
 DAYS_TO_CRAWL = 7
 # 필터링 및 중복 제거를 고려해 넉넉히 탐색
-SCAN_LIMIT = 50 
+SCAN_LIMIT = 50
+# 언론사별 하루 최대 저장 개수
+MAX_PER_PRESS = 10
+# 본문이 이보다 짧으면 버림
+MIN_CONTENT_LENGTH = 50
+
+NAVER_NEWS_BASE = "https://news.naver.com"
+HEADERS = {"User-Agent": "Mozilla/5.0"}
+# 상세 페이지 사이 대기 시간 (초)
+REQUEST_DELAY = (0.05, 0.1)
+# 상세 페이지 파서: "fast" (lxml, 비정치 기사는 조기 중단) 또는 "bs4" (기준 구현)
+DETAIL_PARSER = "fast"
+
+
+def ranking_page_url(oid, date_str, base_url=NAVER_NEWS_BASE):
+    """ 언론사별 랭킹 페이지 URL """
+    return f"{base_url}/main/ranking/office.naver?officeId={oid}&date={date_str}"
+
+
+def extract_article_id(link):
+    """
+    URL에서 고유 식별자(article id)만 추출합니다.
+    예: https://n.news.naver.com/article/028/0002674384 -> '028/0002674384'
+        .../read.naver?oid=028&aid=0002787755 -> '028/0002787755'
+    """
+    return naver_article_id(link) or link # 실패하면 링크 전체 사용
+
 
 # ==========================================
-# 1. 상세 수집 함수 (기존과 동일)
+# 1. 상세 수집 함수
 # ==========================================
-def get_article_detail_with_section(url):
-    headers = {"User-Agent": "Mozilla/5.0"}
+def parse_article_detail(html, engine=DETAIL_PARSER):
+    """ 상세 페이지 HTML에서 섹션/본문/이미지/날짜를 추출합니다. 정치 기사가 아니면 None """
+    if engine == "fast" and extract_article_detail is not None:
+        try:
+            return extract_article_detail(html)
+        except Exception:
+            pass # 고속 경로가 처리하지 못한 입력은 기준 구현으로
+    return parse_article_detail_bs4(html)
+
+
+def parse_article_detail_bs4(html):
+    """ BeautifulSoup(html.parser) 기준 구현. 고속 추출기의 정답 기준이기도 합니다. """
     try:
-        res = requests.get(url, headers=headers, timeout=5)
-        soup = BeautifulSoup(res.text, 'html.parser')
-        
+        soup = BeautifulSoup(html, 'html.parser')
+
         # 1. 섹션 확인
         section = ""
         meta_section = soup.select_one('meta[property="article:section"]')
@@ -35,10 +86,10 @@ def get_article_detail_with_section(url):
             cat_tag = soup.select_one('.media_end_categorize_item')
             if cat_tag:
                 section = cat_tag.get_text(strip=True)
-        
+
         if section != "정치":
-            return None 
-            
+            return None
+
         # 2. 본문 추출
         content_area = soup.select_one('#dic_area') or soup.select_one('#newsct_article')
         content = ""
@@ -46,11 +97,11 @@ def get_article_detail_with_section(url):
             for tag in content_area.select('.img_desc, .end_photo_org, .media_end_summary, .byline_s'):
                 tag.extract()
             content = content_area.get_text(strip=True)
-            
+
         # 3. 이미지 & 날짜
         img_tag = soup.select_one('meta[property="og:image"]')
         image_url = img_tag['content'] if img_tag else ""
-        
+
         date_tag = soup.select_one('.media_end_head_info_datestamp span')
         pub_date = date_tag['data-date-time'] if date_tag else ""
 
@@ -63,105 +114,357 @@ def get_article_detail_with_section(url):
     except Exception:
         return None
 
+
+def ranking_cache_class(date_str):
+    """ 오늘자 랭킹은 계속 바뀌고, 지난 날짜 랭킹은 거의 고정이라 캐시 TTL을 다르게 씁니다. """
+    return "ranking" if date_str >= datetime.now().strftime("%Y%m%d") else "ranking_archive"
+
+
+# 속성 순서와 관계없이 (property가 content보다 뒤에 와도) 찾도록 property는 lookahead로 확인
+_META_SECTION = re.compile(
+    r"""<meta(?=[^>]*\bproperty=["']article:section["'])[^>]*\bcontent=["']([^"']*)["']""", re.IGNORECASE)
+_CATEGORY_SECTION = re.compile(r'class="media_end_categorize_item"[^>]*>\s*([^<]*?)\s*<')
+
+
+def is_settled(status_code, html, detail):
+    """
+    상세 결과가 확정인지: 정치 기사로 파싱됐거나, 정상 페이지의 섹션 표시가 정치가 아님
+    (타임아웃/5xx/섹션 표시가 없는 페이지는 False -> 본 기사로 기록하지 않고 다음 실행에서 다시 시도)
+    """
+    if detail is not None:
+        return True
+    if status_code != 200 or not html:
+        return False
+    match = _META_SECTION.search(html) or _CATEGORY_SECTION.search(html)
+    return bool(match and match.group(1)) and match.group(1) != "정치"
+
+
+def fetch_article_detail(url, cache=None):
+    """ 반환: (상세 dict 또는 None, 확정 여부 is_settled) """
+    try:
+        if cache is not None:
+            res = cache.fetch(url, "article", headers=HEADERS)
+        else:
+            # 공용 클라이언트: 커넥션 재사용 + 일시적 실패 재시도, 타임아웃은 호스트별 설정
+            res = get_http_client().get(url, headers=HEADERS)
+        html = res.text
+        detail = parse_article_detail(html) if res.status_code == 200 else None
+        return detail, is_settled(res.status_code, html, detail)
+    except Exception:
+        return None, False
+
+
+def get_article_detail_with_section(url, cache=None):
+    return fetch_article_detail(url, cache)[0]
+
+
+def parse_ranking_items(html, base_url=NAVER_NEWS_BASE):
+    """
+    랭킹 페이지에서 (link, article_id, title, sid) 목록을 순서대로 뽑습니다.
+    href가 없는 항목을 만나면 기존 크롤러처럼 그 언론사 탐색을 거기서 멈춥니다.
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+    items = []
+    for item in soup.select('.rankingnews_list li'):
+        link_tag = item.select_one('a')
+        if not link_tag: continue
+
+        link = link_tag.get('href')
+        if link is None: break
+        if link.startswith("/"): link = base_url + link
+
+        items.append({
+            "link": link,
+            "article_id": extract_article_id(link),
+            "title": link_tag.get_text(strip=True),
+            "sid": section_hint(link)
+        })
+    return items
+
+
+class PoliticsNewsCollector:
+    """
+    랭킹 목록을 원래 순서대로 소비하면서 중복 제거와 언론사별 상한을 적용합니다.
+    동기/비동기 크롤러가 같은 규칙을 쓰도록 분리했습니다.
+    sink(crawl_sink)가 있으면 언론사 하나를 마칠 때마다 행을 sink로 내보내고 메모리에서 비웁니다.
+    """
+    def __init__(self, per_press_limit=MAX_PER_PRESS, index=None, sink=None):
+        self.rows = []
+        # 🔥 [핵심] 중복 방지용 '기사 ID' 저장소
+        self.seen_articles = set()
+        self.per_press_limit = per_press_limit
+        self.collected_count = 0
+        # 증분 모드: 이전 실행/DB에서 이미 본 기사는 상세 페이지를 받지 않음
+        self.index = index
+        self.sink = sink
+        self.done_shards = set()
+        self.skipped_known = 0
+        self.failed_shards = 0
+        self.start_shard()
+
+    def resume(self, done_shards, rows):
+        """ 중단된 실행의 완료 구간과 결과를 이어받습니다. """
+        self.done_shards = set(done_shards)
+        # sink를 쓰는 실행이면 완료 구간의 행은 이미 파일로 나가 있음
+        if self.sink is None:
+            self.rows.extend(rows)
+
+    def is_done(self, display_date, press_name):
+        return (display_date, press_name) in self.done_shards
+
+    def start_shard(self):
+        self.collected_count = 0
+        self.shard_start = len(self.rows)
+        self.shard_seen = []
+        self.shard_collected = set()
+
+    def finish_shard(self, display_date, press_name):
+        """ 언론사 하나를 다 돌았을 때 호출. 인덱스가 있으면 체크포인트를 커밋합니다. """
+        shard_rows = self.rows[self.shard_start:]
+        if self.sink is not None:
+            self.sink.write(shard_rows)
+            # 체크포인트보다 파일이 먼저: 재개 시 행이 빠지는 일이 없도록 (중복은 읽을 때 제거)
+            if self.index is not None:
+                self.sink.flush()
+        if self.index is not None:
+            self.index.complete_shard(display_date, press_name, shard_rows,
+                                      self.shard_seen, self.shard_collected)
+        if self.sink is not None:
+            del self.rows[self.shard_start:]
+        return len(shard_rows)
+
+    def is_full(self):
+        return self.collected_count >= self.per_press_limit
+
+    def _known_state(self, article_id):
+        if self.index is None:
+            return None
+        found = self.index.lookup(article_id)
+        if found is None:
+            return None
+        state, run_id = found
+        # 재개된 실행: 이번 실행이 앞 구간에서 이미 본 기사는 단순 중복
+        if run_id is not None and run_id == self.index.run_id:
+            return SEEN_ONLY
+        return state
+
+    def is_new(self, article_id):
+        """ 상세 페이지를 받아야 하는 기사인지 (상태를 바꾸지 않음, 선요청 판단용) """
+        return article_id not in self.seen_articles and self._known_state(article_id) is None
+
+    def claim(self, article_id):
+        """
+        처음 보는 기사면 도장을 찍고 True, 이미 본 기사면 False
+        인덱스에는 결과가 확정된 뒤(mark_seen)에만 기록합니다.
+        """
+        if article_id in self.seen_articles:
+            return False
+        self.seen_articles.add(article_id)
+
+        state = self._known_state(article_id)
+        if state is not None:
+            self.skipped_known += 1
+            # 예전에 수집한 기사는 다시 받지 않되, 전체 수집과 같은 결과가 되도록 상한에는 반영
+            if state == COLLECTED:
+                self.collected_count += 1
+            return False
+        return True
+
+    def mark_seen(self, article_id):
+        """ 사전 필터로 거른 기사, 또는 상세 페이지로 결과가 확정된 기사 (받기 실패한 기사는 기록하지 않음) """
+        self.shard_seen.append(article_id)
+
+    def accept(self, display_date, press_name, item, detail):
+        if not detail or len(detail['content']) <= MIN_CONTENT_LENGTH:
+            return False
+        self.rows.append({
+            "collection_date": display_date,
+            "press": press_name,
+            "title": item['title'],
+            "section": detail['section'],
+            "content": detail['content'],
+            "image_url": detail['image_url'],
+            "pub_date": detail['pub_date'],
+            "link": item['link']
+        })
+        self.collected_count += 1
+        self.shard_collected.add(item['article_id'])
+        return True
+
+
+def crawl_run_key(days, press_dict, today):
+    """ 같은 조건의 수집 실행을 식별하는 키 (재개/분산 큐에서 사용) """
+    return f"{today:%Y%m%d}|{days}|{','.join(press_dict.values())}"
+
+
+def open_crawl_index(days, press_dict, today, index_path=DEFAULT_INDEX_PATH, seed_db=False):
+    """ 증분 모드용 인덱스를 열고, 같은 조건의 중단된 실행이 있으면 이어받을 준비를 합니다. """
+    index = CrawlIndex(index_path)
+    if seed_db:
+        print(f"🗂️ DB 기사 {index.seed_from_db()}건을 인덱스에 반영했습니다.")
+    done, rows = index.start_or_resume(crawl_run_key(days, press_dict, today))
+    if done:
+        print(f"♻️ 중단된 수집을 이어갑니다: 완료 {len(done)}개 구간, 기존 {len(rows)}건")
+    return index, done, rows
+
+
+def iter_crawl_shards(days=DAYS_TO_CRAWL, press_dict=TARGET_PRESS_DICT, today=None):
+    """ 수집 단위인 (날짜, 언론사) 조합을 기존 순서대로 돌려줍니다. """
+    today = today or datetime.now()
+    for day_offset in range(days):
+        target_date = today - timedelta(days=day_offset)
+        for press_name, oid in press_dict.items():
+            yield day_offset, target_date, press_name, oid
+
+
+def fetch_ranking_page(http, cache, oid, date_str, base_url=NAVER_NEWS_BASE):
+    url = ranking_page_url(oid, date_str, base_url)
+    if cache is not None:
+        res = cache.fetch(url, ranking_cache_class(date_str), headers=HEADERS)
+    else:
+        res = http.get(url, headers=HEADERS)
+    return parse_ranking_items(res.text, base_url)
+
+
+def collect_shard(collector, section_filter, list_items, display_date, press_name, cache=None, delay=REQUEST_DELAY):
+    """ 한 (날짜, 언론사)의 랭킹 목록을 순서대로 돌며 상세 페이지를 받아 collector에 담습니다. """
+    collector.start_shard()
+    for item in list_items:
+        # 언론사별 하루 10개만 저장
+        if collector.is_full(): break
+
+        # 🔥 [중복 검사] 이미 수집한 기사면 패스!
+        if not collector.claim(item['article_id']):
+            continue
+
+        # 🔥 [사전 필터] 비정치가 확실하면 상세 페이지를 받지 않음 (본 기사로는 기록)
+        if section_filter.classify(item) == REJECT:
+            collector.mark_seen(item['article_id'])
+            if section_filter.should_verify(item):
+                section_filter.record_verification(*fetch_article_detail(item['link'], cache))
+            continue
+
+        # 상세 페이지 접속 & 정치 여부 확인
+        detail, settled = fetch_article_detail(item['link'], cache)
+        collector.accept(display_date, press_name, item, detail)
+        if settled:
+            collector.mark_seen(item['article_id'])
+
+        if delay:
+            time.sleep(random.uniform(*delay))
+    return collector.finish_shard(display_date, press_name)
+
+
 # ==========================================
 # 2. 메인 크롤러 (중복 제거 로직 추가)
 # ==========================================
-def crawl_unique_politics_news():
-    all_news = []
-    
-    # 🔥 [핵심] 중복 방지용 '기사 ID' 저장소
-    # URL이나 기사 고유 ID를 저장해두고, 이미 있으면 건너뜁니다.
-    seen_articles = set()
-    
-    today = datetime.now()
-    headers = {"User-Agent": "Mozilla/5.0"}
-    
+def crawl_unique_politics_news(days=DAYS_TO_CRAWL, press_dict=TARGET_PRESS_DICT, today=None,
+                               base_url=NAVER_NEWS_BASE, delay=REQUEST_DELAY,
+                               incremental=False, index_path=DEFAULT_INDEX_PATH, seed_db=False,
+                               use_cache=False, prefilter=True, verify_rate=DEFAULT_VERIFY_RATE, sink=None):
+    """
+    incremental=True 이면 영구 인덱스(crawl_index)를 사용합니다.
+    - 이전 실행/DB에 있는 기사는 상세 페이지를 받지 않고 건너뜀 (결과에는 새 기사만 포함)
+    - 중단된 실행은 마지막으로 끝난 (날짜, 언론사) 다음부터 재개
+    use_cache=True 이면 랭킹/상세 페이지를 디스크 HTML 캐시(html_cache)를 거쳐 가져옵니다.
+    prefilter=True 이면 링크의 sid로 비정치가 확실한 기사는 상세 페이지를 받지 않습니다. (section_filter)
+    sink를 주면 행을 언론사 단위로 sink에 흘려 쓰고, 반환하는 DataFrame은 비어 있습니다.
+    """
+    today = today or datetime.now()
+    http = get_http_client()
+    cache = get_html_cache() if use_cache else None
+    section_filter = SectionPrefilter(prefilter, verify_rate)
+    index = None
+    collector = PoliticsNewsCollector(sink=sink)
+    if incremental:
+        index, done, rows = open_crawl_index(days, press_dict, today, index_path, seed_db)
+        collector = PoliticsNewsCollector(index=index, sink=sink)
+        collector.resume(done, rows)
+
     print(f"🚀 정치 뉴스 수집 시작 (중복 원천 차단)...\n")
-    
-    for day_offset in range(DAYS_TO_CRAWL):
+
+    for day_offset in range(days):
         target_date = today - timedelta(days=day_offset)
         date_str = target_date.strftime("%Y%m%d")
         display_date = target_date.strftime("%Y-%m-%d")
-        
-        print(f"📅 [Day {day_offset+1}/{DAYS_TO_CRAWL}] {display_date} 탐색 중...")
-        
-        for press_name, oid in TARGET_PRESS_DICT.items():
-            url = f"https://news.naver.com/main/ranking/office.naver?officeId={oid}&date={date_str}"
-            
+
+        print(f"📅 [Day {day_offset+1}/{days}] {display_date} 탐색 중...")
+
+        for press_name, oid in press_dict.items():
+            if collector.is_done(display_date, press_name): continue
+
             try:
-                res = requests.get(url, headers=headers)
-                soup = BeautifulSoup(res.text, 'html.parser')
-                list_items = soup.select('.rankingnews_list li')
-                
+                list_items = fetch_ranking_page(http, cache, oid, date_str, base_url)
+                new_count = collect_shard(collector, section_filter, list_items, display_date, press_name,
+                                          cache, delay)
                 if not list_items: continue
+                print(f"   ✅ {press_name}: 신규 {new_count}개 저장")
 
-                collected_count = 0
-                for item in list_items:
-                    # 언론사별 하루 10개만 저장
-                    if collected_count >= 10: break 
-                    
-                    link_tag = item.select_one('a')
-                    if not link_tag: continue
-                    
-                    link = link_tag['href']
-                    if link.startswith("/"): link = "https://news.naver.com" + link
-                    
-                    # 💡 URL에서 고유 식별자(article id)만 추출해서 비교하면 더 정확함
-                    # 예: https://n.news.naver.com/article/028/0002674384 -> '028/0002674384'
-                    try:
-                        article_id = link.split("/article/")[1]
-                        # ?sid=... 같은 파라미터 제거
-                        article_id = article_id.split("?")[0] 
-                    except:
-                        article_id = link # 실패하면 링크 전체 사용
-
-                    # 🔥 [중복 검사] 이미 수집한 기사면 패스!
-                    if article_id in seen_articles:
-                        continue
-                        
-                    # 수집 목록에 도장 쾅!
-                    seen_articles.add(article_id)
-                    
-                    title = link_tag.get_text(strip=True)
-                    
-                    # 상세 페이지 접속 & 정치 여부 확인
-                    detail = get_article_detail_with_section(link)
-                    
-                    if detail and len(detail['content']) > 50:
-                        all_news.append({
-                            "collection_date": display_date,
-                            "press": press_name,
-                            "title": title,
-                            "section": detail['section'],
-                            "content": detail['content'],
-                            "image_url": detail['image_url'],
-                            "pub_date": detail['pub_date'],
-                            "link": link
-                        })
-                        collected_count += 1
-                    
-                    time.sleep(random.uniform(0.05, 0.1))
-                
-                print(f"   ✅ {press_name}: 신규 {collected_count}개 저장")
-                
             except Exception as e:
                 print(f"   ⚠️ {press_name} 에러: {e}")
-                
-    return pd.DataFrame(all_news)
+                collector.failed_shards += 1
+
+    if sink is not None:
+        sink.flush()
+        print(f"\n📦 {sink.root}: {sink.rows_written}건, 파일 {sink.files_written}개")
+    if index is not None:
+        # 실패한 구간이 있으면 실행을 열어두고 다음 실행에서 그 구간만 다시 수집
+        if collector.failed_shards == 0:
+            index.finish_run()
+        index.close()
+        print(f"\n⏭️ 인덱스로 건너뛴 상세 페이지: {collector.skipped_known}건")
+    if section_filter.enabled:
+        print(f"\n🧹 섹션 사전 필터: {section_filter.snapshot()}")
+    print(f"\n🔌 HTTP 통계: {http.stats.snapshot()}")
+    if cache is not None:
+        print(f"🗄️ HTML 캐시 통계: {cache.stats.snapshot()}")
+    return pd.DataFrame(collector.rows)
 
 # 실행
 if __name__ == "__main__":
-    df_unique = crawl_unique_politics_news()
-    
-    if not df_unique.empty:
+    parser = argparse.ArgumentParser(description="네이버 언론사별 랭킹 정치 뉴스 수집")
+    parser.add_argument("--async", dest="use_async", action="store_true", help="asyncio 동시 수집 모드")
+    parser.add_argument("--concurrency", type=int, default=None, help="전체 동시 요청 수 (async)")
+    parser.add_argument("--per-host", type=int, default=None, help="호스트별 동시 요청 수 (async)")
+    parser.add_argument("--incremental", action="store_true", help="영구 인덱스로 이미 본 기사 건너뛰기 + 중단 시 재개")
+    parser.add_argument("--index", default=DEFAULT_INDEX_PATH, help="증분 인덱스 SQLite 경로")
+    parser.add_argument("--seed-db", action="store_true", help="articles 테이블의 기사를 인덱스에 반영")
+    parser.add_argument("--cache", action="store_true", help="디스크 HTML 캐시 사용 (재수집 시 조건부 GET)")
+    parser.add_argument("--output", choices=["auto", "parquet", "jsonl", "csv"], default="auto",
+                        help="저장 형식. auto는 pyarrow가 있으면 parquet, 없으면 jsonl (csv는 기존 단일 파일)")
+    parser.add_argument("--sink-dir", default=DEFAULT_SINK_DIR, help="parquet/jsonl 데이터셋 디렉터리")
+    parser.add_argument("--no-prefilter", action="store_true", help="sid 기반 섹션 사전 필터 끄기")
+    parser.add_argument("--verify-rate", type=float, default=DEFAULT_VERIFY_RATE,
+                        help="사전 필터로 거른 기사 중 상세 페이지로 검증할 비율 (오탐률 측정)")
+    args = parser.parse_args()
+    index_options = dict(incremental=args.incremental, index_path=args.index, seed_db=args.seed_db,
+                         use_cache=args.cache, prefilter=not args.no_prefilter, verify_rate=args.verify_rate)
+    sink = None if args.output == "csv" else open_sink(args.sink_dir, args.output)
+
+    if args.use_async:
+        import asyncio
+        from app.scroller.async_crawler import crawl_unique_politics_news_async, DEFAULT_CONCURRENCY, DEFAULT_PER_HOST
+
+        df_unique = asyncio.run(crawl_unique_politics_news_async(
+            concurrency=args.concurrency or DEFAULT_CONCURRENCY,
+            per_host=args.per_host or DEFAULT_PER_HOST,
+            sink=sink, **index_options
+        ))
+    else:
+        df_unique = crawl_unique_politics_news(sink=sink, **index_options)
+
+    if sink is not None:
+        sink.close()
+        print(f"\n🎉 수집 완료! 총 {sink.rows_written}개 -> '{sink.root}'")
+    elif not df_unique.empty:
         print(f"\n🎉 수집 완료! 총 {len(df_unique)}개")
-        
+
         # 중복이 진짜 없는지 확인
         print(f"중복 제거 전: {len(df_unique) + (len(df_unique) - len(df_unique['link'].unique()))}") # 예시 계산
         print(f"중복 제거 후: {len(df_unique)}")
-        
+
         filename = "weekly_politics_news_clean.csv"
         df_unique.to_csv(filename, index=False, encoding="utf-8-sig")
         print(f"📁 '{filename}'에 깔끔하게 저장되었습니다.")
     else:
-        print("수집된 데이터가 없습니다.")
\ No newline at end of file
+        print("수집된 데이터가 없습니다.")
@@ -1,7 +1,8 @@
 from fastapi import APIRouter
 from pydantic import BaseModel
 from typing import List, Dict, Optional, Any
-from app.scroller.nlp_search import NewsBriefingAgent
+from app.scroller.nlp_search import get_briefing_agent, close_briefing_agent, get_result_cache
+from app.core.llm_client import llm_stats
 
 router = APIRouter()
 
@@ -13,6 +14,28 @@ async def search_news_nlp(request: SearchRequest):
     """
     NLP 기반 뉴스 검색 및 브리핑 API
     """
-    agent = NewsBriefingAgent()
-    result = agent.run(request.query)
+    # 요청마다 에이전트를 만들지 않고 공용 인스턴스(커넥션 풀, 캐시)를 사용. 이벤트 루프를 막지 않음
+    agent = get_briefing_agent()
+    result = await agent.arun(request.query)
     return result
+
+
+@router.get("/nlp/stats")
+async def get_nlp_stats():
+    """
+    검색어 결과 캐시 통계 (hit, 진행 중인 계산에 합류한 요청 수, 만료/밀려난 항목 수)
+    """
+    return get_result_cache().snapshot()
+
+
+@router.on_event("shutdown")
+async def shutdown_briefing_agent():
+    await close_briefing_agent()
+
+
+@router.get("/llm/stats")
+async def get_llm_stats():
+    """
+    LLM 호출 스케줄러(대기열 대기 시간, 429 횟수, 현재 속도)와 응답 캐시 hit 통계
+    """
+    return llm_stats()
@@ -0,0 +1,108 @@
+import hashlib
+import threading
+from collections import Counter
+from urllib.parse import urlsplit, parse_qs
+
+# ==========================================
+# [설정] 섹션 사전 필터
+# ==========================================
+# 네이버 뉴스 섹션 코드(sid). 100만 정치
+POLITICS_SID = "100"
+KNOWN_SIDS = {
+    "100": "정치", "101": "경제", "102": "사회", "103": "생활/문화",
+    "104": "세계", "105": "IT/과학", "106": "연예", "107": "스포츠",
+}
+# 기사 상세가 아예 다른 서비스로 가는 호스트 (정치 기사가 올 수 없음)
+NON_NEWS_HOST_SUFFIXES = ("sports.naver.com", "sports.news.naver.com", "entertain.naver.com")
+# 거른 기사 중 이 비율만큼은 그래도 상세 페이지를 받아 오탐(정치인데 거름)을 측정
+DEFAULT_VERIFY_RATE = 0.0
+
+# classify 결과
+FETCH = "fetch"          # 정치로 보이거나 판단 근거가 없음 -> 상세 페이지를 받음
+REJECT = "reject"        # 정치가 아님이 확실 -> 상세 페이지를 받지 않음
+
+
+def section_hint(link):
+    """
+    랭킹 목록의 링크만 보고 섹션 코드(sid)를 추정합니다. 알 수 없으면 None
+    - https://n.news.naver.com/article/028/0002674384?sid=100 -> '100'
+    - https://news.naver.com/main/read.naver?mode=LSD&sid1=101&oid=...&aid=... -> '101'
+    - https://m.sports.naver.com/... -> '107', https://m.entertain.naver.com/... -> '106'
+    """
+    if not link:
+        return None
+    parts = urlsplit(link)
+    host = (parts.hostname or "").lower()
+    if host.endswith(NON_NEWS_HOST_SUFFIXES):
+        return "106" if "entertain" in host else "107"
+    qs = parse_qs(parts.query)
+    for key in ("sid", "sid1"):
+        if key in qs and qs[key][0] in KNOWN_SIDS:
+            return qs[key][0]
+    return None
+
+
+class SectionPrefilter:
+    """
+    상세 페이지를 받기 전에, 랭킹 목록에 이미 있는 정보(링크의 sid, 호스트)로 비정치 기사를 거릅니다.
+    - 정치(sid=100)이거나 근거가 없으면 받고, 다른 섹션이 확실할 때만 거릅니다.
+    - 검증 샘플: 거른 기사 중 verify_rate 비율은 상세 페이지를 받아 실제 섹션을 확인합니다.
+      샘플 여부는 기사 id 해시로 정하므로 동기/비동기 크롤러가 같은 기사를 검증합니다.
+      검증 결과는 측정용이라 수집 결과에는 반영하지 않습니다.
+    """
+    def __init__(self, enabled=True, verify_rate=DEFAULT_VERIFY_RATE):
+        self.enabled = enabled
+        self.verify_rate = verify_rate
+        self._lock = threading.Lock()
+        self._counts = Counter()
+
+    def _incr(self, key, n=1):
+        with self._lock:
+            self._counts[key] += n
+
+    def _decide(self, item):
+        sid = item.get("sid")
+        if not self.enabled or sid is None or sid == POLITICS_SID:
+            return FETCH
+        return REJECT
+
+    def classify(self, item):
+        """ FETCH 또는 REJECT. 통계에 반영됩니다. """
+        decision = self._decide(item)
+        if not self.enabled:
+            return decision
+        if decision == REJECT:
+            self._incr("rejected")
+        else:
+            self._incr("politics" if item.get("sid") == POLITICS_SID else "unknown")
+        return decision
+
+    def wants_detail(self, item):
+        """ 상세 페이지가 필요한 기사인지 (통계에 반영하지 않음, 선요청 판단용) """
+        return self._decide(item) == FETCH or self.should_verify(item)
+
+    def should_verify(self, item):
+        """ 거른 기사 중 검증 샘플에 들어가는지 """
+        if self.verify_rate <= 0:
+            return False
+        digest = hashlib.md5(item["article_id"].encode("utf-8")).digest()
+        return int.from_bytes(digest[:4], "big") / 2 ** 32 < self.verify_rate
+
+    def record_verification(self, detail, settled=True):
+        """
+        검증 샘플의 상세 결과 (fetch_article_detail 반환값) 기록
+        받지 못했거나 섹션을 확인할 수 없는 페이지(settled=False)는 verify_failed로 따로 세고 오탐률 계산에서 뺌
+        """
+        if detail is None and not settled:
+            self._incr("verify_failed")
+            return
+        self._incr("verified")
+        if detail is not None:
+            self._incr("false_rejects")
+
+    def snapshot(self):
+        with self._lock:
+            counts = dict(self._counts)
+        verified = counts.get("verified", 0)
+        counts["false_reject_rate"] = round(counts.get("false_rejects", 0) / verified, 4) if verified else None
+        return counts
@@ -0,0 +1,137 @@
+import sys
+import os
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(BASE_DIR)
+
+import hashlib
+
+from app.scroller.tokenizer import tokenize_batch, TOKENIZER_VERSION
+
+# ==========================================
+# [설정] 토큰 저장소
+# ==========================================
+# IN 조회 한 번에 넣는 해시 수
+LOOKUP_CHUNK = 500
+
+
+def content_hash(text):
+    """ 토크나이저 버전 + 분석 텍스트의 sha256 (저장소 키) """
+    return hashlib.sha256(f"{TOKENIZER_VERSION}\n{text}".encode("utf-8")).hexdigest()
+
+
+def analysis_text(title, content):
+    """ 키워드 네트워크에 쓰는 분석 텍스트 (clustering과 같은 규칙: 제목 + 공백 + 본문) """
+    return f"{title} {content if content is not None else ''}"
+
+
+def load_tokens(db, hashes):
+    """ 저장된 토큰 {해시: 명사 리스트} """
+    from app.domains.articles.models import ArticleTokens
+
+    hashes = list(set(hashes))
+    found = {}
+    for start in range(0, len(hashes), LOOKUP_CHUNK):
+        rows = (db.query(ArticleTokens.content_hash, ArticleTokens.nouns)
+                .filter(ArticleTokens.content_hash.in_(hashes[start:start + LOOKUP_CHUNK])).all())
+        found.update(rows)
+    return found
+
+
+def save_tokens(db, rows):
+    """
+    토큰 행들을 저장(commit)합니다. 동시에 돈 다른 실행이 먼저 넣은 해시는 건너뜀 (ON CONFLICT DO NOTHING)
+    rows: {"content_hash", "tokenizer_version", "nouns"} 딕셔너리 리스트
+    """
+    from app.domains.articles.models import ArticleTokens
+
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        for row in rows:
+            db.merge(ArticleTokens(**row))
+        db.commit()
+        return
+    for start in range(0, len(rows), LOOKUP_CHUNK):
+        stmt = insert(ArticleTokens).values(rows[start:start + LOOKUP_CHUNK])
+        db.execute(stmt.on_conflict_do_nothing(index_elements=["content_hash"]))
+    db.commit()
+
+
+def tokenize_with_store(db, texts, workers=None):
+    """
+    texts를 토큰화하되, 저장소에 있는 텍스트는 다시 토큰화하지 않습니다.
+    없는 텍스트만 한 번에 배치 토큰화해서 저장(commit)하고, 입력 순서대로 명사 리스트를 돌려줍니다.
+    (토큰화 건수, 재사용 건수)는 두 번째 반환값입니다.
+    """
+    from app.domains.articles.models import ArticleTokens
+
+    texts = [str(t) for t in texts]
+    hashes = [content_hash(t) for t in texts]
+    tokens = load_tokens(db, hashes)
+
+    # 같은 실행 안에서 같은 텍스트는 한 번만 토큰화
+    missing = {}
+    for h, t in zip(hashes, texts):
+        if h not in tokens:
+            missing.setdefault(h, t)
+    if missing:
+        new_tokens = tokenize_batch(list(missing.values()), workers=workers)
+        for h, nouns in zip(missing, new_tokens):
+            tokens[h] = nouns
+        try:
+            save_tokens(db, [{"content_hash": h, "tokenizer_version": TOKENIZER_VERSION, "nouns": tokens[h]}
+                             for h in missing])
+        except Exception as e:
+            # 저장에 실패해도 이미 만든 토큰은 그대로 사용 (다음 실행에서 다시 저장)
+            db.rollback()
+            print(f"⚠️ 토큰 저장 실패 ({len(missing)}건): {e}")
+
+    return [list(tokens[h]) for h in hashes], (len(missing), len(texts) - len(missing))
+
+
+def article_tokens(db, article_ids, workers=None):
+    """ 저장된 기사들의 명사 리스트 {article_id: 명사 리스트} (키워드/검색 기능용) """
+    from app.domains.articles.models import Article, ArticleBody
+
+    rows = (db.query(Article.id, Article.title, ArticleBody.raw_content)
+            .outerjoin(ArticleBody, ArticleBody.article_id == Article.id)
+            .filter(Article.id.in_(list(article_ids))).all())
+    tokens, _ = tokenize_with_store(db, [analysis_text(title, content) for _, title, content in rows], workers)
+    return {article_id: nouns for (article_id, _, _), nouns in zip(rows, tokens)}
+
+
+def backfill_tokens(db, batch_size=500, workers=None):
+    """ 저장된 기사 중 토큰이 없는 기사를 토큰화합니다. 새로 토큰화한 개수를 돌려줍니다. """
+    from app.domains.articles.models import Article, ArticleBody
+
+    created = 0
+    last_id = 0
+    while True:
+        rows = (db.query(Article.id, Article.title, ArticleBody.raw_content)
+                .join(ArticleBody, ArticleBody.article_id == Article.id)
+                .filter(Article.id > last_id).order_by(Article.id).limit(batch_size).all())
+        if not rows:
+            break
+        _, (tokenized, _) = tokenize_with_store(
+            db, [analysis_text(title, content) for _, title, content in rows], workers)
+        created += tokenized
+        last_id = rows[-1][0]
+    return created
+
+
+if __name__ == "__main__":
+    # 기존 기사 토큰 채우기: python app/scroller/token_store.py
+    from app.core.database import SessionLocal, Base, engine
+    from app.domains.issues.models import IssueLabel  # noqa: F401 (관계 매핑 등록용)
+    from app.domains.publishers.models import Publisher  # noqa: F401
+
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        print(f"🔤 기사 {backfill_tokens(db, workers=int(os.getenv('TOKENIZER_WORKERS', '1')))}건을 토큰화했습니다.")
+    finally:
+        db.close()
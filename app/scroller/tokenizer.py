@@ -0,0 +1,96 @@
+import os
+import hashlib
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+# ==========================================
+# [설정] 명사 추출기
+# ==========================================
+# 불용어 (계속 추가해서 관리하면 좋습니다)
+STOPWORDS = frozenset([
+    '뉴스', '종합', '속보', '기자', '특파원', '위해', '밝혔다', '대해', '관련',
+    '오늘', '오후', '오전', '것으로', '따르면', '있는', '했다', '말했다',
+    '민주당', '국민의힘', '의원', '대통령', '대표', '무단전재', '배포', '금지',
+    '이날', '어제', '내일', '이번', '지난', '가장', '통해', '때문', '경우',
+    '정도', '사실', '내용', '모두', '우리', '자신', '문제', '생각', '사람',
+    '그', '이', '저', '수', '것', '등', '안', '전', '후', '약', '중'
+])
+MIN_NOUN_LENGTH = 2
+# 저장된 토큰(token_store)이 어떤 규칙으로 만들어졌는지. 불용어/길이 기준이 바뀌면 값이 달라져 다시 토큰화됨
+TOKENIZER_VERSION = "okt-nouns-" + hashlib.md5(
+    ("|".join(sorted(STOPWORDS)) + f"|{MIN_NOUN_LENGTH}").encode("utf-8")).hexdigest()[:8]
+# 프로세스 풀에 한 번에 넘기는 문서 수
+DEFAULT_CHUNK_SIZE = 64
+
+_okt = None
+_okt_lock = threading.Lock()
+_pool = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+
+def get_okt():
+    """ 프로세스당 하나의 Okt (JVM을 띄우는 비용이 커서 재사용) """
+    global _okt
+    if _okt is None:
+        with _okt_lock:
+            if _okt is None:
+                from konlpy.tag import Okt
+                _okt = Okt()
+    return _okt
+
+
+def tokenize(text):
+    """
+    Okt 형태소 분석기로 '명사'만 추출합니다. (불용어, 한 글자 제외)
+    '단식을' -> '단식', '대표는' -> '대표' 로 깔끔하게 변환됩니다.
+    """
+    return [n for n in get_okt().nouns(str(text)) if n not in STOPWORDS and len(n) >= MIN_NOUN_LENGTH]
+
+
+def _tokenize_chunk(texts):
+    return [tokenize(t) for t in texts]
+
+
+def _warm_up():
+    get_okt().nouns("초기화")
+
+
+def _get_pool(workers):
+    """ 워커마다 JVM을 한 번만 띄우도록 풀을 재사용. JVM은 fork 후 쓸 수 없어 spawn으로 만듭니다. """
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or _pool_workers != workers:
+            if _pool is not None:
+                _pool.shutdown()
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+                                        initializer=_warm_up)
+            _pool_workers = workers
+        return _pool
+
+
+def shutdown_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown()
+            _pool = None
+
+
+def tokenize_batch(texts, workers=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    여러 문서를 한 번에 토큰화합니다. 결과 순서는 입력 순서와 같습니다.
+    workers가 2 이상이고 문서가 chunk_size보다 많으면 프로세스 풀로 나눠 처리합니다. (0이면 CPU 수만큼)
+    """
+    texts = list(texts)
+    if workers == 0:
+        workers = os.cpu_count() or 1
+    if not workers or workers < 2 or len(texts) <= chunk_size:
+        return _tokenize_chunk(texts)
+
+    chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+    results = []
+    for chunk_tokens in _get_pool(workers).map(_tokenize_chunk, chunks):
+        results.extend(chunk_tokens)
+    return results
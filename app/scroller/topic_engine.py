@@ -0,0 +1,143 @@
+import os
+
+import numpy as np
+
+# ==========================================
+# [설정] 토픽 모델 구성
+# ==========================================
+# full: UMAP(5차원) + HDBSCAN + 문서 x 토픽 확률 행렬 (기존 설정)
+# fast: PCA/랜덤 투영 + MiniBatchKMeans, 문서별 최선 토픽 확률만 계산 (수만 건 이상용)
+CLUSTER_MODE = os.getenv("CLUSTER_MODE", "full")
+# fast 모드 차원 축소: "pca" 또는 "random" (GaussianRandomProjection)
+FAST_REDUCER = os.getenv("FAST_REDUCER", "pca")
+FAST_PCA_COMPONENTS = 16
+# 랜덤 투영은 거리 보존을 위해 PCA보다 차원을 넉넉히 둠
+FAST_RANDOM_COMPONENTS = 64
+# 군집 하나당 평균 문서 수 (군집 수 = 문서 수 / 이 값, 이후 nr_topics="auto"로 비슷한 토픽을 합침)
+FAST_DOCS_PER_CLUSTER = 40
+FAST_MIN_CLUSTERS = 15
+FAST_MAX_CLUSTERS = 400
+FAST_BATCH_SIZE = 4096
+# 중심과의 거리가 군집 안 이 분위수보다 먼 문서는 아웃라이어(-1)로 둠 (HDBSCAN처럼 잡음을 걸러냄)
+FAST_OUTLIER_QUANTILE = 0.9
+MIN_TOPIC_SIZE = 7
+
+
+class MiniBatchClusterer:
+    """
+    BERTopic hdbscan_model 자리에 쓰는 MiniBatchKMeans 군집기
+    - labels_: 문서별 군집 번호 (중심에서 먼 문서는 -1)
+    - probabilities_: 문서별 최선 군집 확신도 (1 - 최근접/차근접 거리 비, 0~1)
+      BERTopic은 calculate_probabilities=False일 때 이 1차원 값을 그대로 probs로 돌려줍니다.
+    """
+    def __init__(self, n_clusters=None, docs_per_cluster=FAST_DOCS_PER_CLUSTER,
+                 outlier_quantile=FAST_OUTLIER_QUANTILE, batch_size=FAST_BATCH_SIZE, random_state=42):
+        self.n_clusters = n_clusters
+        self.docs_per_cluster = docs_per_cluster
+        self.outlier_quantile = outlier_quantile
+        self.batch_size = batch_size
+        self.random_state = random_state
+        self.model = None
+
+    def _n_clusters(self, n_docs):
+        if self.n_clusters:
+            return min(self.n_clusters, n_docs)
+        k = n_docs // self.docs_per_cluster
+        return max(1, min(n_docs, max(FAST_MIN_CLUSTERS, min(FAST_MAX_CLUSTERS, k))))
+
+    def _assign(self, X):
+        """ 가장 가까운 두 중심까지의 거리로 (군집, 최근접 거리, 확신도) """
+        distances = self.model.transform(X)
+        if distances.shape[1] < 2:
+            return np.zeros(len(X), dtype=np.int64), distances[:, 0], np.ones(len(X))
+        nearest = np.argpartition(distances, 1, axis=1)[:, :2]
+        d = np.take_along_axis(distances, nearest, axis=1)
+        swap = d[:, 0] > d[:, 1]
+        d[swap] = d[swap][:, ::-1]
+        nearest[swap] = nearest[swap][:, ::-1]
+        confidence = 1.0 - d[:, 0] / np.maximum(d[:, 1], 1e-12)
+        return nearest[:, 0], d[:, 0], confidence
+
+    def fit(self, X, y=None):
+        from sklearn.cluster import MiniBatchKMeans
+
+        X = np.asarray(X, dtype=np.float32)
+        self.model = MiniBatchKMeans(n_clusters=self._n_clusters(len(X)), batch_size=self.batch_size,
+                                     n_init=3, random_state=self.random_state)
+        self.model.fit(X)
+        labels, dist, confidence = self._assign(X)
+
+        # 군집별 거리 한계 (이보다 먼 문서는 아웃라이어)
+        self.radius_ = np.full(self.model.n_clusters, np.inf)
+        for c in np.unique(labels):
+            self.radius_[c] = np.quantile(dist[labels == c], self.outlier_quantile)
+        outliers = dist > self.radius_[labels]
+        self.labels_ = np.where(outliers, -1, labels)
+        self.probabilities_ = np.where(outliers, 0.0, confidence)
+        return self
+
+    def predict(self, X):
+        labels, dist, _ = self._assign(np.asarray(X, dtype=np.float32))
+        return np.where(dist > self.radius_[labels], -1, labels)
+
+
+def make_reducer(kind=FAST_REDUCER, random_state=42):
+    if kind == "random":
+        from sklearn.random_projection import GaussianRandomProjection
+        return GaussianRandomProjection(n_components=FAST_RANDOM_COMPONENTS, random_state=random_state)
+    if kind == "pca":
+        from sklearn.decomposition import PCA
+        return PCA(n_components=FAST_PCA_COMPONENTS, svd_solver="randomized", random_state=random_state)
+    raise ValueError(f"알 수 없는 차원 축소 방식: {kind} (가능: pca, random)")
+
+
+def build_topic_model(mode=None, vectorizer=None, embedding_model=None, seed=None, verbose=False):
+    """
+    analyze_weekly_top10과 벤치마크가 같이 쓰는 BERTopic 구성
+    - full: 문서 x 토픽 확률 행렬을 계산 (probs는 2차원)
+    - fast: 최선 토픽 확률만 계산 (probs는 1차원)
+    seed: UMAP/군집 시드 (None이면 UMAP은 시드 없이 병렬로 실행)
+    """
+    from bertopic import BERTopic
+
+    mode = mode or CLUSTER_MODE
+    if mode == "full":
+        from hdbscan import HDBSCAN
+        from umap import UMAP
+
+        umap_model = None
+        if seed is not None:
+            umap_model = UMAP(n_neighbors=15, n_components=5, min_dist=0.0, metric="cosine", random_state=seed)
+        return BERTopic(
+            embedding_model=embedding_model,
+            umap_model=umap_model,
+            vectorizer_model=vectorizer,
+            hdbscan_model=HDBSCAN(min_cluster_size=7, min_samples=3, prediction_data=True),
+            nr_topics="auto",
+            min_topic_size=MIN_TOPIC_SIZE,
+            calculate_probabilities=True,
+            verbose=verbose
+        )
+    if mode == "fast":
+        random_state = 42 if seed is None else seed
+        return BERTopic(
+            embedding_model=embedding_model,
+            umap_model=make_reducer(random_state=random_state),
+            vectorizer_model=vectorizer,
+            hdbscan_model=MiniBatchClusterer(random_state=random_state),
+            nr_topics="auto",
+            min_topic_size=MIN_TOPIC_SIZE,
+            calculate_probabilities=False,
+            verbose=verbose
+        )
+    raise ValueError(f"알 수 없는 클러스터링 모드: {mode} (가능: full, fast)")
+
+
+def best_topic_prob(probs, n_docs):
+    """ fit_transform의 probs(2차원 확률 행렬 또는 1차원 최선 확률)에서 문서별 최선 토픽 확률 """
+    if probs is None:
+        return np.ones(n_docs)
+    probs = np.asarray(probs)
+    if probs.ndim > 1:
+        return probs.max(axis=1)
+    return probs
@@ -0,0 +1,118 @@
+"""
+클러스터링 모드 벤치마크: full (UMAP + HDBSCAN + 확률 행렬) / fast (PCA·랜덤 투영 + MiniBatchKMeans)
+
+- 모드마다 새 프로세스에서 build_topic_model().fit_transform()을 실행해 걸린 시간과 최대 RSS를 잽니다.
+- full 모드 배정과의 일치도(ARI, NMI)를 출력합니다. 합성 코퍼스면 정답 군집과의 ARI도 출력합니다.
+- 임베딩은 미리 만들어 두 모드에 똑같이 넘깁니다. (인코딩 시간은 제외)
+
+    python benchmarks/bench_clustering.py --synthetic 50000
+    python benchmarks/bench_clustering.py --corpus data/politics_news --modes full fast:pca fast:random
+"""
+import sys
+import os
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BASE_DIR)
+
+import argparse
+import multiprocessing
+import resource
+import time
+
+import numpy as np
+
+DIM = 768
+SYNTHETIC_VOCAB = 40
+
+
+def synthetic_corpus(n_docs, n_topics, seed=0):
+    """ 토픽별 중심 주변의 임베딩 + 토픽별 어휘로 만든 문서. 반환: docs, embeddings, 정답 토픽 """
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(n_topics, DIM)).astype(np.float32)
+    # 큰 토픽과 작은 토픽이 섞이도록 (실제 뉴스처럼 몇 개 이슈에 기사가 몰림)
+    weights = 1.0 / np.arange(1, n_topics + 1) ** 0.8
+    truth = rng.choice(n_topics, size=n_docs, p=weights / weights.sum())
+    embeddings = centers[truth] + 0.6 * rng.normal(size=(n_docs, DIM)).astype(np.float32)
+    words = rng.integers(0, SYNTHETIC_VOCAB, size=(n_docs, 8))
+    docs = [" ".join(f"t{t}w{w}" for w in row) for t, row in zip(truth, words)]
+    return docs, embeddings, truth
+
+
+def corpus_embeddings(corpus, backend):
+    from app.scroller.crawl_sink import read_crawl_dataset
+    from app.scroller.embedding import get_backend, store_key, topic_document
+    from app.scroller.embedding_store import EmbeddingStore
+
+    df = read_crawl_dataset(corpus, columns=["title", "content"])
+    docs = [topic_document(t, c) for t, c in zip(df["title"], df["content"].fillna(""))]
+    backend = get_backend(backend)
+    with EmbeddingStore(store_key(backend)) as store:
+        embeddings = store.embed(docs, backend.encode)
+    return docs, embeddings
+
+
+def run_mode(mode, docs, embeddings, seed):
+    """ (새 프로세스에서) 토픽 모델 학습. 반환: 토픽, 최선 확률, 초, 최대 RSS(MB) """
+    from sklearn.feature_extraction.text import CountVectorizer
+    from app.scroller import topic_engine
+
+    mode, _, reducer = mode.partition(":")
+    if reducer:
+        topic_engine.FAST_REDUCER = reducer
+    model = topic_engine.build_topic_model(mode, CountVectorizer(), seed=seed)
+    start = time.perf_counter()
+    topics, probs = model.fit_transform(docs, embeddings=embeddings)
+    elapsed = time.perf_counter() - start
+    # Linux ru_maxrss 단위는 KB
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    return np.asarray(topics), topic_engine.best_topic_prob(probs, len(docs)), elapsed, peak_rss
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--modes", nargs="+", default=["full", "fast:pca", "fast:random"],
+                        help="full, fast:pca, fast:random")
+    parser.add_argument("--corpus", help="crawl_sink 데이터셋 디렉터리 (없으면 합성 코퍼스)")
+    parser.add_argument("--backend", default=None, help="--corpus 임베딩 백엔드")
+    parser.add_argument("--synthetic", type=int, default=20000, help="합성 문서 수")
+    parser.add_argument("--topics", type=int, default=60, help="합성 토픽 수")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    truth = None
+    if args.corpus:
+        docs, embeddings = corpus_embeddings(args.corpus, args.backend)
+    else:
+        docs, embeddings, truth = synthetic_corpus(args.synthetic, args.topics)
+    print(f"🧪 문서 {len(docs)}건, 임베딩 {embeddings.shape[1]}차원")
+
+    ctx = multiprocessing.get_context("spawn")
+    results = {}
+    for mode in args.modes:
+        # 모드마다 새 프로세스: RSS가 앞선 모드에 섞이지 않도록
+        with ctx.Pool(1) as pool:
+            try:
+                results[mode] = pool.apply(run_mode, (mode, docs, embeddings, args.seed))
+            except Exception as e:
+                print(f"⚠️ [{mode}] 실행 실패: {e}")
+
+    from sklearn.metrics import adjusted_rand_score, normalized_mutual_info_score
+
+    baseline = results.get("full")
+    print(f"\n{'모드':<12} | {'시간':>8} | {'최대 RSS':>9} | {'토픽':>4} | {'아웃라이어':>6} | "
+          f"{'ARI(full)':>9} | {'NMI(full)':>9} | {'ARI(정답)':>9}")
+    for mode, (topics, prob, elapsed, peak_rss) in results.items():
+        ari = nmi = truth_ari = float("nan")
+        if baseline is not None:
+            ari = adjusted_rand_score(baseline[0], topics)
+            nmi = normalized_mutual_info_score(baseline[0], topics)
+        if truth is not None:
+            truth_ari = adjusted_rand_score(truth, topics)
+        n_topics = len(set(topics.tolist()) - {-1})
+        print(f"{mode:<12} | {elapsed:7.1f}s | {peak_rss:7.0f}MB | {n_topics:4d} | {np.mean(topics == -1):6.1%} | "
+              f"{ari:9.3f} | {nmi:9.3f} | {truth_ari:9.3f}")
+    return 0 if results else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+"""
+키워드 동시 출현 벤치마크: 기존 쌍 튜플 Counter 구현(reference)과 희소 행렬 엔진(sparse)을
+이슈 크기(기사 수)별로 비교하고, 두 결과(top 노드, 노드 개수, edge_counts 순서까지)가 같은지 확인합니다.
+
+    python benchmarks/bench_cooccurrence.py --sizes 10 100 1000 5000 --reference-max 1000
+
+기준 구현은 5,000건에서 쌍 튜플만 수 GB라 --reference-max보다 큰 크기에서는 sparse만 측정합니다.
+"""
+import sys
+import os
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BASE_DIR)
+
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+
+from app.scroller.cooccurrence import count_cooccurrence, count_cooccurrence_reference
+
+SYLLABLES = list("가나다라마바사아자차카타파하정치국회여야대통령선거법안예산경제외교안보")
+
+
+def synthetic_issue(n_articles, vocab_size=20000, nouns_per_article=250, seed=0):
+    """
+    한 이슈의 기사별 명사 리스트 흉내: 이슈 핵심 어휘(자주 등장) + zipf 분포 일반 어휘.
+    기사 한 건은 중복 포함 명사 nouns_per_article개 안팎 (정치 기사 본문 기준)
+    """
+    rng = np.random.default_rng(seed)
+    vocab = np.array(["".join(rng.choice(SYLLABLES, size=rng.integers(2, 4))) + str(i) for i in range(vocab_size)])
+    core = rng.choice(vocab_size, size=40, replace=False)
+    docs = []
+    for _ in range(n_articles):
+        size = max(int(rng.normal(nouns_per_article, nouns_per_article / 4)), 10)
+        common = (rng.zipf(1.3, size=size) - 1) % vocab_size
+        issue = core[rng.random(len(core)) < 0.35]
+        docs.append(list(vocab[np.r_[common, issue]]))
+    return docs
+
+
+def measure(fn, docs):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn(docs)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak / 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 5000])
+    parser.add_argument("--nouns", type=int, default=250)
+    parser.add_argument("--reference-max", type=int, default=1000)
+    args = parser.parse_args()
+
+    mismatches = 0
+    print(f"{'기사 수':>8} | {'reference':>18} | {'sparse':>18} | 배율")
+    for n in args.sizes:
+        docs = synthetic_issue(n, nouns_per_article=args.nouns, seed=n)
+        actual, fast_time, fast_mem = measure(count_cooccurrence, docs)
+        if n > args.reference_max:
+            print(f"{n:>8} | {'(생략)':>18} | {fast_time:7.3f}s {fast_mem:7.1f}MB |")
+            continue
+        expected, ref_time, ref_mem = measure(count_cooccurrence_reference, docs)
+        same = expected[0] == actual[0] and expected[2] == actual[2] and \
+            all(expected[1][k] == actual[1][k] for k in expected[0])
+        mismatches += not same
+        print(f"{n:>8} | {ref_time:7.3f}s {ref_mem:7.1f}MB | {fast_time:7.3f}s {fast_mem:7.1f}MB | "
+              f"{ref_time / fast_time:5.1f}x {'✅' if same else '❌'}")
+    print(f"{'✅' if not mismatches else '❌'} 결과 불일치 {mismatches}건")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,180 @@
+"""
+크롤러 벤치마크: 로컬 HTTP 픽스처 서버를 띄워 순차 모드와 asyncio 모드의 pages/sec를 비교합니다.
+두 모드의 결과 DataFrame이 완전히 같은지도 함께 확인합니다.
+
+    python benchmarks/bench_crawler.py --latency 50
+"""
+import sys
+import os
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BASE_DIR)
+
+import argparse
+import asyncio
+import hashlib
+import threading
+import time
+from datetime import datetime
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs
+
+import pandas as pd
+
+from app.scroller.ranking_scroller import crawl_unique_politics_news
+from app.scroller.async_crawler import crawl_unique_politics_news_async
+from app.scroller.crawl_sink import open_sink, read_crawl_dataset
+
+SECTIONS = ["정치", "정치", "경제", "사회", "세계", "IT/과학"]
+SECTION_SIDS = {"정치": "100", "경제": "101", "사회": "102", "세계": "104", "IT/과학": "105"}
+ITEMS_PER_RANKING = 50
+
+
+def _pick(key, choices):
+    digest = hashlib.md5(key.encode()).digest()
+    return choices[digest[0] % len(choices)]
+
+
+def ranking_html(host, oid, date_str):
+    items = []
+    for rank in range(ITEMS_PER_RANKING):
+        # 날짜가 달라도 일부 기사는 겹치게 만들어 중복 제거 경로도 태움
+        aid = int(date_str) % 7 * 20 + rank
+        # 일부 링크에만 sid를 붙여 섹션 사전 필터의 '판단 불가' 경로도 태움
+        sid = f"&sid={SECTION_SIDS[_pick(f'{oid}/{aid:010d}', SECTIONS)]}" if rank % 3 else ""
+        items.append(
+            f'<li><div class="list_content">'
+            f'<a href="http://{host}/article/{oid}/{aid:010d}?ntype=RANKING{sid}">기사 제목 {oid}-{aid}</a>'
+            f'</div></li>'
+        )
+    return f'<html><body><ul class="rankingnews_list">{"".join(items)}</ul></body></html>'
+
+
+def article_html(oid, aid):
+    section = _pick(f"{oid}/{aid}", SECTIONS)
+    paragraphs = "".join(f"<br>문단 {i} 정치권 공방이 이어졌다." for i in range(40))
+    return f"""<html><head>
+<meta property="article:section" content="{section}">
+<meta property="og:image" content="https://imgnews.example/{oid}/{aid}.jpg">
+</head><body>
+<div class="media_end_head_info_datestamp"><span class="media_end_head_info_datestamp_time" data-date-time="2026-01-20 10:{int(aid) % 60:02d}:00">2026.01.20.</span></div>
+<article id="dic_area" class="go_trans _article_content">
+<span class="end_photo_org"><img src="x.jpg"><em class="img_desc">사진 설명</em></span>
+{oid}/{aid} 본문 시작{paragraphs}
+<div class="byline_s">기자 이름</div>
+</article></body></html>"""
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    latency = 0.0
+    hits = 0
+    lock = threading.Lock()
+
+    def do_GET(self):
+        with FixtureHandler.lock:
+            FixtureHandler.hits += 1
+        time.sleep(self.latency)
+
+        parts = urlsplit(self.path)
+        if parts.path.startswith("/main/ranking/office.naver"):
+            qs = parse_qs(parts.query)
+            body = ranking_html(self.headers["Host"], qs["officeId"][0], qs["date"][0])
+        elif parts.path.startswith("/article/"):
+            _, _, oid, aid = parts.path.split("/")
+            body = article_html(oid, aid)
+        else:
+            self.send_error(404)
+            return
+
+        payload = body.encode("utf-8")
+        etag = '"%s"' % hashlib.md5(payload).hexdigest()
+        try:
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=UTF-8")
+            self.send_header("Content-Length", str(len(payload)))
+            self.send_header("ETag", etag)
+            self.end_headers()
+            self.wfile.write(payload)
+        except (BrokenPipeError, ConnectionResetError):
+            # 크롤러가 취소한 선요청
+            self.close_connection = True
+
+    def log_message(self, *args):
+        pass
+
+
+def start_fixture_server(latency):
+    FixtureHandler.latency = latency
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FixtureHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def timed(label, fn):
+    FixtureHandler.hits = 0
+    start = time.perf_counter()
+    df = fn()
+    elapsed = time.perf_counter() - start
+    pages = FixtureHandler.hits
+    print(f"{label:<20} {pages:>5} pages  {elapsed:7.2f}s  {pages / elapsed:8.1f} pages/sec  rows={len(df)}")
+    return df
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--latency", type=float, default=50, help="픽스처 응답 지연 (ms)")
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--per-host", type=int, default=8)
+    parser.add_argument("--no-delay", action="store_true", help="순차 모드의 요청 간 sleep 제거")
+    parser.add_argument("--verify-rate", type=float, default=0.1, help="사전 필터 검증 샘플 비율 (sync)")
+    parser.add_argument("--sink-dir", default=None, help="지정하면 parquet/jsonl sink로도 수집해 결과를 비교")
+    parser.add_argument("--cache-dir", default=None, help="지정하면 HTML 캐시를 켜고 async 모드를 한 번 더 실행 (재수집)")
+    args = parser.parse_args()
+
+    server = start_fixture_server(args.latency / 1000)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    today = datetime(2026, 1, 22)
+
+    df_unfiltered = timed("sync (no prefilter)", lambda: crawl_unique_politics_news(
+        days=args.days, today=today, base_url=base_url, delay=None if args.no_delay else (0.05, 0.1),
+        prefilter=False))
+    df_sync = timed("sync", lambda: crawl_unique_politics_news(
+        days=args.days, today=today, base_url=base_url, delay=None if args.no_delay else (0.05, 0.1),
+        verify_rate=args.verify_rate))
+    df_async = timed("async", lambda: asyncio.run(crawl_unique_politics_news_async(
+        days=args.days, today=today, base_url=base_url,
+        concurrency=args.concurrency, per_host=args.per_host)))
+
+    pd.testing.assert_frame_equal(df_unfiltered, df_sync)
+    pd.testing.assert_frame_equal(df_sync, df_async)
+    print("✅ 사전 필터 유무, 두 모드의 결과 DataFrame이 모두 동일합니다.")
+
+    if args.sink_dir:
+        for fmt in ("parquet", "jsonl"):
+            with open_sink(os.path.join(args.sink_dir, fmt), fmt, batch_rows=20) as sink:
+                timed(f"async+{fmt}", lambda: asyncio.run(crawl_unique_politics_news_async(
+                    days=args.days, today=today, base_url=base_url,
+                    concurrency=args.concurrency, per_host=args.per_host, sink=sink)))
+            df_sink = read_crawl_dataset(sink.root, columns=list(df_sync.columns))
+            pd.testing.assert_frame_equal(df_sync, df_sink)
+        print("✅ sink 데이터셋을 읽은 결과가 메모리 결과와 동일합니다.")
+
+    if args.cache_dir:
+        import app.core.html_cache as html_cache
+        html_cache._shared_cache = html_cache.HtmlCache(root=args.cache_dir)
+        for label in ("cold", "warm"):
+            df_cached = timed(f"async+cache ({label})", lambda: asyncio.run(crawl_unique_politics_news_async(
+                days=args.days, today=today, base_url=base_url,
+                concurrency=args.concurrency, per_host=args.per_host, use_cache=True)))
+            pd.testing.assert_frame_equal(df_sync, df_cached)
+    server.shutdown()
@@ -0,0 +1,73 @@
+"""
+중복 제거 벤치마크: 기존 O(n^2) 코사인 훑기(bruteforce)와 LSH 엔진을 1k/10k/100k 문서에서 비교합니다.
+기준 구현을 돌린 크기에서는 살아남는 문서 집합이 같은지도 확인합니다.
+
+    python benchmarks/bench_dedup.py --sizes 1000 10000 100000 --reference-max 10000
+"""
+import sys
+import os
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BASE_DIR)
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from app.scroller.dedup import dedup_tfidf, bruteforce_duplicate_indices, lsh_duplicate_indices
+
+SYLLABLES = list("가나다라마바사아자차카타파하정치국회여야대통령선거법안예산경제외교안보")
+
+
+def synthetic_corpus(n, dup_rate=0.15, vocab_size=5000, n_topics=300, seed=0):
+    """
+    기사 본문 흉내: 주제별 어휘 + 공통 어휘로 만든 문서와, 앞선 문서를 조금씩 고친 근중복 문서
+    (단어 몇 개 교체 / 완전 복사 등 임계값 근처 사례를 섞음)
+    """
+    rng = np.random.default_rng(seed)
+    vocab = np.array(["".join(rng.choice(SYLLABLES, size=rng.integers(2, 4))) for _ in range(vocab_size)])
+    topics = [rng.choice(vocab_size, size=60, replace=False) for _ in range(n_topics)]
+    docs = []
+    for i in range(n):
+        if i > 0 and rng.random() < dup_rate:
+            words = docs[rng.integers(0, i)].split()
+            for _ in range(rng.integers(0, 12)):
+                words[rng.integers(0, len(words))] = vocab[rng.integers(0, vocab_size)]
+            docs.append(" ".join(words))
+        else:
+            common = rng.zipf(1.5, size=20) % vocab_size
+            own = rng.choice(topics[rng.integers(0, n_topics)], size=60)
+            words = vocab[np.concatenate([common, own])]
+            rng.shuffle(words)
+            docs.append(" ".join(words))
+    return pd.DataFrame({"content": docs})
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--reference-max", type=int, default=10000, help="이 크기까지만 기준 구현 실행")
+    parser.add_argument("--threshold", type=float, default=0.90)
+    args = parser.parse_args()
+
+    print(f"{'docs':>7} {'engine':<10} {'sec':>8} {'removed':>8}  비고")
+    failed = False
+    for n in args.sizes:
+        tfidf = dedup_tfidf(synthetic_corpus(n))
+        lsh, lsh_sec = timed(lambda: lsh_duplicate_indices(tfidf, args.threshold))
+        print(f"{n:>7} {'lsh':<10} {lsh_sec:8.2f} {len(lsh):>8}")
+        if n <= args.reference_max:
+            ref, ref_sec = timed(lambda: bruteforce_duplicate_indices(tfidf, args.threshold))
+            same = set(map(int, ref)) == lsh
+            failed |= not same
+            print(f"{n:>7} {'bruteforce':<10} {ref_sec:8.2f} {len(ref):>8}  "
+                  f"{'✅ 결과 동일' if same else '❌ 결과 다름'}  (x{ref_sec / lsh_sec:.1f})")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,131 @@
+"""
+임베딩 백엔드 벤치마크: fp32 / int8 / onnx 백엔드를 고정 코퍼스에서 비교합니다.
+
+- 백엔드마다 새 프로세스에서 모델을 올려 docs/sec, 모델 로딩 시간, 최대 RSS를 잽니다.
+- 각 백엔드 임베딩으로 파이프라인과 같은 설정의 BERTopic(UMAP 시드 고정)을 학습해
+  fp32 기준 토픽 배정과의 일치도(ARI, NMI)와 벡터 코사인 유사도를 출력합니다.
+
+    python benchmarks/bench_embedding.py --backends fp32 int8 onnx --threads 4
+    python benchmarks/bench_embedding.py --corpus data/politics_news --repeat 1
+"""
+import sys
+import os
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BASE_DIR)
+
+import argparse
+import multiprocessing
+import resource
+import time
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_CORPUS = os.path.join(BASE_DIR, "mockdata", "weekly_top_issues.csv")
+
+
+def load_docs(corpus, repeat):
+    """ 파이프라인과 같은 문서 형태 (제목 x3 + 본문 앞 100자) """
+    if os.path.isdir(corpus):
+        from app.scroller.crawl_sink import read_crawl_dataset
+        df = read_crawl_dataset(corpus, columns=["title", "content"])
+    else:
+        df = pd.read_csv(corpus)
+    content = df["content"] if "content" in df else pd.Series([""] * len(df))
+    docs = [str(t) + " " + str(t) + " " + str(t) + " " + str(c)[:100]
+            for t, c in zip(df["title"], content.fillna(""))]
+    return docs * repeat
+
+
+def run_backend(name, docs, threads):
+    """ (새 프로세스에서) 모델 로딩 + 인코딩. 반환: 임베딩, 로딩 초, 인코딩 초, 최대 RSS(MB) """
+    from app.scroller.embedding import get_backend
+
+    backend = get_backend(name, threads=threads)
+    start = time.perf_counter()
+    backend.load()
+    backend.encode(docs[:8])  # 첫 호출 초기화 비용 제외
+    loaded = time.perf_counter() - start
+
+    start = time.perf_counter()
+    embeddings = backend.encode(docs)
+    elapsed = time.perf_counter() - start
+    # Linux ru_maxrss 단위는 KB
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    return embeddings, loaded, elapsed, peak_rss
+
+
+def assign_topics(docs, embeddings, seed=42):
+    """ analyze_weekly_top10과 같은 설정 + 고정 시드 UMAP으로 토픽 배정 """
+    from bertopic import BERTopic
+    from hdbscan import HDBSCAN
+    from umap import UMAP
+    from sklearn.feature_extraction.text import CountVectorizer
+
+    topic_model = BERTopic(
+        embedding_model=None,
+        umap_model=UMAP(n_neighbors=15, n_components=5, min_dist=0.0, metric="cosine", random_state=seed),
+        vectorizer_model=CountVectorizer(),
+        hdbscan_model=HDBSCAN(min_cluster_size=7, min_samples=3, prediction_data=True),
+        nr_topics="auto",
+        min_topic_size=7,
+        calculate_probabilities=True,
+    )
+    topics, _ = topic_model.fit_transform(docs, embeddings=embeddings)
+    return np.asarray(topics)
+
+
+def cosine_rows(a, b):
+    a = a / np.linalg.norm(a, axis=1, keepdims=True)
+    b = b / np.linalg.norm(b, axis=1, keepdims=True)
+    return (a * b).sum(axis=1)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backends", nargs="+", default=["fp32", "int8", "onnx"])
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS, help="CSV 또는 crawl_sink 데이터셋 디렉터리")
+    parser.add_argument("--repeat", type=int, default=8, help="처리량 측정용 코퍼스 반복 횟수")
+    parser.add_argument("--threads", type=int, default=0)
+    parser.add_argument("--skip-topics", action="store_true", help="토픽 일치도 계산 생략")
+    args = parser.parse_args()
+
+    docs = load_docs(args.corpus, args.repeat)
+    unique_docs = docs[:len(docs) // args.repeat]
+    print(f"🧪 문서 {len(docs)}건 (고유 {len(unique_docs)}건), 스레드 {args.threads or '기본'}")
+
+    backends = ["fp32"] + [b for b in args.backends if b != "fp32"]
+    ctx = multiprocessing.get_context("spawn")
+    results = {}
+    for name in backends:
+        # 백엔드마다 새 프로세스: RSS가 앞선 모델에 섞이지 않도록
+        with ctx.Pool(1) as pool:
+            try:
+                results[name] = pool.apply(run_backend, (name, docs, args.threads))
+            except Exception as e:
+                print(f"⚠️ [{name}] 실행 실패: {e}")
+
+    baseline = results.get("fp32")
+    baseline_topics = None
+    if baseline is not None and not args.skip_topics:
+        baseline_topics = assign_topics(unique_docs, baseline[0][:len(unique_docs)])
+
+    print(f"\n{'백엔드':<6} | {'로딩':>7} | {'docs/sec':>9} | {'최대 RSS':>9} | {'코사인':>6} | {'ARI':>5} | {'NMI':>5}")
+    for name, (embeddings, loaded, elapsed, peak_rss) in results.items():
+        cosine = ari = nmi = float("nan")
+        if baseline is not None:
+            cosine = float(cosine_rows(embeddings, baseline[0]).mean())
+        if baseline_topics is not None:
+            from sklearn.metrics import adjusted_rand_score, normalized_mutual_info_score
+            topics = baseline_topics if name == "fp32" else \
+                assign_topics(unique_docs, embeddings[:len(unique_docs)])
+            ari = adjusted_rand_score(baseline_topics, topics)
+            nmi = normalized_mutual_info_score(baseline_topics, topics)
+        print(f"{name:<6} | {loaded:6.1f}s | {len(docs) / elapsed:9.1f} | {peak_rss:7.0f}MB | "
+              f"{cosine:6.4f} | {ari:5.3f} | {nmi:5.3f}")
+    return 0 if results else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+"""
+기사 상세 페이지 추출기 검증 + 처리량 벤치마크
+
+- fixtures/article_pages/*.html 골든 코퍼스에 대해 기준 구현(bs4)과 고속 추출기(fast)의 결과가
+  저장된 정답(*.json)과 모두 같은지 확인합니다.
+- 같은 코퍼스를 반복 파싱해 엔진별 docs/sec, MB/sec를 출력합니다.
+
+    python benchmarks/bench_extractor.py            # 검증 + 벤치마크
+    python benchmarks/bench_extractor.py --regen    # 기준 구현으로 정답 파일 재생성
+"""
+import sys
+import os
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BASE_DIR)
+
+import argparse
+import glob
+import json
+import time
+
+from app.scroller.ranking_scroller import parse_article_detail, parse_article_detail_bs4
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "article_pages")
+ENGINES = {
+    "bs4": parse_article_detail_bs4,
+    "fast": lambda html: parse_article_detail(html, engine="fast"),
+}
+
+
+def load_corpus():
+    corpus = []
+    for path in sorted(glob.glob(os.path.join(FIXTURE_DIR, "*.html"))):
+        with open(path, encoding="utf-8") as f:
+            corpus.append((path, f.read()))
+    return corpus
+
+
+def regen(corpus):
+    for path, html in corpus:
+        with open(path[:-len(".html")] + ".json", "w", encoding="utf-8") as f:
+            json.dump(parse_article_detail_bs4(html), f, ensure_ascii=False, indent=2)
+            f.write("\n")
+    print(f"📝 정답 파일 {len(corpus)}개를 다시 만들었습니다.")
+
+
+def verify(corpus):
+    failures = 0
+    for path, html in corpus:
+        with open(path[:-len(".html")] + ".json", encoding="utf-8") as f:
+            expected = json.load(f)
+        for name, engine in ENGINES.items():
+            actual = engine(html)
+            if actual != expected:
+                failures += 1
+                print(f"❌ [{name}] {os.path.basename(path)}\n   기대: {expected}\n   실제: {actual}")
+    print(f"{'✅' if not failures else '⚠️'} 골든 코퍼스 {len(corpus)}건 x 엔진 {len(ENGINES)}개, 불일치 {failures}건")
+    return failures
+
+
+def bench(corpus, rounds):
+    total_bytes = sum(len(html.encode("utf-8")) for _, html in corpus)
+    for subset_name, subset in (("전체", corpus),
+                                ("정치", [c for c in corpus if "politics" in os.path.basename(c[0])]),
+                                ("비정치", [c for c in corpus if "politics" not in os.path.basename(c[0])])):
+        subset_bytes = sum(len(html.encode("utf-8")) for _, html in subset)
+        for name, engine in ENGINES.items():
+            start = time.perf_counter()
+            for _ in range(rounds):
+                for _, html in subset:
+                    engine(html)
+            elapsed = time.perf_counter() - start
+            docs = rounds * len(subset)
+            print(f"{subset_name:<4} {name:<5} {docs / elapsed:9.1f} docs/sec  "
+                  f"{rounds * subset_bytes / elapsed / 1e6:7.2f} MB/sec")
+    print(f"(코퍼스 {len(corpus)}건, {total_bytes / 1e3:.0f} KB, {rounds}회 반복)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--regen", action="store_true")
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    corpus = load_corpus()
+    if args.regen:
+        regen(corpus)
+    failed = verify(corpus)
+    bench(corpus, args.rounds)
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,82 @@
+"""
+이슈 제목 생성 벤치마크: batch (한 번의 JSON 요청) / single (이슈마다 요청)
+
+- 기본은 로컬 StubBackend (요청마다 --latency초 대기)로 요청 수와 전체 소요 시간을 비교합니다.
+- --drop으로 배치 응답에서 일부 이슈를 빼서 개별 재요청 경로도 확인합니다.
+- --live면 실제 Gemini로 요청합니다. (GOOGLE_API_KEY 필요)
+
+    python benchmarks/bench_labeling.py --topics 15 --latency 1.5
+    python benchmarks/bench_labeling.py --live
+"""
+import sys
+import os
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BASE_DIR)
+
+import argparse
+import json
+import re
+
+import pandas as pd
+
+from app.core.llm_client import LLMClient, StubBackend
+from app.core.llm_scheduler import LLMScheduler, LLM_RPM
+from app.scroller import issue_labeler
+
+DEFAULT_CORPUS = os.path.join(BASE_DIR, "mockdata", "weekly_top_issues.csv")
+
+
+def load_topic_titles(corpus, n_topics):
+    """ 코퍼스 제목을 n_topics개 이슈로 나눔 (제목 생성 요청 크기만 흉내냄) """
+    titles = pd.read_csv(corpus)["title"].astype(str).tolist()
+    per_topic = max(7, len(titles) // n_topics)
+    return {t: (titles[t * per_topic:(t + 1) * per_topic] or titles[:per_topic]) for t in range(n_topics)}
+
+
+def stub_responses(drop):
+    """ 배치 프롬프트면 drop개를 뺀 JSON, 개별 프롬프트면 제목 하나 """
+    def respond(prompt):
+        topic_ids = [int(t) for t in re.findall(r"\[이슈 (-?\d+)\]", prompt)]
+        if topic_ids:
+            kept = topic_ids[drop:]
+            return json.dumps({"labels": [{"topic_id": t, "label": f"이슈 {t} 논란"} for t in kept]},
+                              ensure_ascii=False)
+        return "개별 이슈 제목"
+    return respond
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS)
+    parser.add_argument("--topics", type=int, default=15)
+    parser.add_argument("--latency", type=float, default=1.0, help="stub 요청당 대기 초")
+    parser.add_argument("--drop", type=int, default=0, help="stub 배치 응답에서 뺄 이슈 수")
+    parser.add_argument("--live", action="store_true", help="실제 Gemini 사용")
+    parser.add_argument("--rpm", type=int, default=0, help="분당 요청 한도 (0이면 stub은 무제한, live는 LLM_RPM)")
+    args = parser.parse_args()
+
+    topic_titles = load_topic_titles(args.corpus, args.topics)
+    print(f"🧪 이슈 {len(topic_titles)}개, {'Gemini' if args.live else f'stub (요청당 {args.latency}초)'}")
+
+    results = {}
+    for mode in ["single", "batch"]:
+        # 모드끼리 응답 캐시를 공유하지 않도록 캐시 없이 요청
+        backend = None if args.live else StubBackend(responses=stub_responses(args.drop), latency=args.latency)
+        rpm = args.rpm or (LLM_RPM if args.live else 10 ** 9)
+        model = LLMClient(issue_labeler.LABEL_MODEL, backend=backend, use_cache=False,
+                          scheduler=LLMScheduler(rpm=rpm))
+        labels, stats = issue_labeler.label_topics(topic_titles, model=model, mode=mode)
+        results[mode] = (labels, stats)
+
+    print(f"\n{'모드':<6} | {'요청':>4} | {'재요청':>6} | {'시간':>7}")
+    for mode, (_, stats) in results.items():
+        print(f"{mode:<6} | {stats['requests']:4d} | {stats['fallbacks']:6d} | {stats['seconds']:6.2f}s")
+    if args.live:
+        for topic_id in topic_titles:
+            print(f"   [{topic_id}] {results['single'][0][topic_id]} / {results['batch'][0][topic_id]}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,63 @@
+"""
+LLM 응답 캐시 벤치마크: 로컬 StubBackend (요청마다 --latency초)로 반복 요청 시 hit 비율과 아낀 시간을 봅니다.
+
+- 인기 검색어처럼 일부 프롬프트가 자주 반복되도록 Zipf 분포로 --requests번 요청합니다.
+- 절반은 일반 응답(generate), 절반은 스트리밍(stream)으로 요청해 조각 재생도 확인합니다.
+
+    python benchmarks/bench_llm_cache.py --prompts 50 --requests 300 --latency 0.05
+"""
+import sys
+import os
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BASE_DIR)
+
+import argparse
+import tempfile
+import time
+
+import numpy as np
+
+from app.core.llm_client import LLMClient, LLMCache, StubBackend
+from app.core.llm_scheduler import LLMScheduler
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--prompts", type=int, default=50, help="고유 프롬프트 수")
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--latency", type=float, default=0.05, help="stub 요청당 대기 초")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    picks = np.minimum(rng.zipf(1.3, size=args.requests), args.prompts) - 1
+    prompts = [f"""
+        사용자가 요청한 검색어: "검색어 {i}"
+        아래 기사들을 종합해 이슈 브리핑을 작성해주세요.
+        """ for i in range(args.prompts)]
+
+    with tempfile.TemporaryDirectory() as root:
+        backend = StubBackend(latency=args.latency)
+        # 캐시 효과만 보려고 분당 한도 없는 스케줄러 사용
+        scheduler = LLMScheduler(rpm=10 ** 9, tpm=10 ** 12)
+        client = LLMClient("bench-model", backend=backend, cache=LLMCache(root), scheduler=scheduler)
+
+        start = time.perf_counter()
+        for n, i in enumerate(picks):
+            if n % 2:
+                "".join(client.stream(prompts[i]))
+            else:
+                client.generate(prompts[i])
+        elapsed = time.perf_counter() - start
+
+        stats = client.stats.snapshot()
+        uncached = args.requests * args.latency
+        print(f"🧪 요청 {args.requests}회 (고유 {len(set(picks.tolist()))}개), 모델 호출 {len(backend.prompts)}회")
+        print(f"   hit 비율 {stats['hit_ratio']:.1%}, 아낀 모델 시간 {stats['seconds_saved']:.2f}초")
+        print(f"   소요 {elapsed:.2f}초 (캐시 없이 약 {uncached:.2f}초)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
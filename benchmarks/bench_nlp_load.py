@@ -0,0 +1,210 @@
+"""
+/scroller/nlp 부하 테스트: 로컬 픽스처 서버(네이버 검색 + 기사 페이지)와 StubBackend로
+기존 방식(요청마다 NewsBriefingAgent를 만들고 async 핸들러 안에서 동기 run 호출)과
+공용 AsyncNewsBriefingAgent.arun을 같은 이벤트 루프, 같은 도착 속도로 비교합니다. (p50/p99 지연)
+
+- 기본은 요청마다 검색어가 달라 결과/HTML/LLM 캐시가 hit하지 않습니다.
+  --distinct-queries K면 K개 검색어를 돌려 쓰고 (표기만 조금씩 다르게), 공용 에이전트의
+  검색어 결과 캐시 / 동시 요청 합치기 효과를 봅니다. (기존 방식은 결과 캐시 없음)
+- --stuck-every N이면 기사 페이지 N개 중 하나가 --stuck-latency초 동안 응답하지 않습니다.
+  (arun은 --deadline 안에서 본문 예산을 넘긴 기사를 description으로 대체)
+- 실제 서버처럼 요청들은 하나의 이벤트 루프에서 처리합니다. (uvicorn 워커 1개)
+
+    python benchmarks/bench_nlp_load.py --requests 30 --rate 2
+    python benchmarks/bench_nlp_load.py --stuck-every 7 --stuck-latency 20 --deadline 6
+    python benchmarks/bench_nlp_load.py --requests 60 --rate 10 --distinct-queries 3 --skip-sync
+"""
+import sys
+import os
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BASE_DIR)
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import tempfile
+import threading
+import time
+from collections import Counter
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs, quote
+
+import numpy as np
+
+from app.core.html_cache import HtmlCache
+from app.core.llm_client import LLMClient, LLMCache, StubBackend
+from app.core.llm_scheduler import LLMScheduler, LLM_MAX_CONCURRENCY
+from app.core.result_cache import ResultCache
+from app.scroller import nlp_search
+
+BRIEFING = json.dumps({"summary_content": "요약", "keywords": ["기사", "정부"]}, ensure_ascii=False)
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    search_latency = 0.0
+    article_latency = 0.0
+    stuck_every = 0
+    stuck_latency = 0.0
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        if parts.path == "/search":
+            time.sleep(self.search_latency)
+            query = parse_qs(parts.query)["query"][0]
+            display = int(parse_qs(parts.query)["display"][0])
+            host = self.headers["Host"]
+            items = [{
+                "title": f"<b>{query}</b> 관련 기사 {i}",
+                "link": f"http://{host}/article/{quote(query)}/{i}",
+                "originallink": f"https://www.yna.co.kr/view/{i}",
+                "description": f"{query} 기사 {i} 요약, 정부 입장",
+                "pubDate": "Mon, 19 Jan 2026 10:00:00 +0900",
+            } for i in range(display)]
+            body, content_type = json.dumps({"items": items}, ensure_ascii=False), "application/json"
+        elif parts.path.startswith("/article/"):
+            index = int(parts.path.rsplit("/", 1)[1]) + sum(map(ord, parts.path))
+            stuck = self.stuck_every and index % self.stuck_every == 0
+            time.sleep(self.stuck_latency if stuck else self.article_latency)
+            paragraphs = "".join(f"<p>문단 {i} 정치권 공방이 이어졌다.</p>" for i in range(30))
+            body, content_type = f"<html><body><article>{paragraphs}</article></body></html>", "text/html"
+        else:
+            self.send_error(404)
+            return
+
+        payload = body.encode("utf-8")
+        try:
+            self.send_response(200)
+            self.send_header("Content-Type", f"{content_type}; charset=UTF-8")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+        except (BrokenPipeError, ConnectionResetError):
+            # 마감 시간으로 취소된 요청
+            self.close_connection = True
+
+    def log_message(self, *args):
+        pass
+
+
+def start_fixture_server(search_latency, article_latency, stuck_every=0, stuck_latency=0.0):
+    FixtureHandler.search_latency = search_latency
+    FixtureHandler.article_latency = article_latency
+    FixtureHandler.stuck_every = stuck_every
+    FixtureHandler.stuck_latency = stuck_latency
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FixtureHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def make_llm(latency, cache_root, concurrency):
+    # 분당 한도는 빼고 동시 호출 수만 제한 (지연 비교가 목적)
+    scheduler = LLMScheduler(rpm=10 ** 9, tpm=10 ** 12, max_concurrency=concurrency)
+    return LLMClient(nlp_search.BRIEFING_MODEL, backend=StubBackend(responses=[BRIEFING], latency=latency),
+                     cache=LLMCache(cache_root), scheduler=scheduler)
+
+
+def query_for(i, tag, distinct):
+    """ distinct개 검색어를 돌려 쓰되 공백/물음표 표기를 섞음 (정규화 후 같은 키) """
+    if not distinct:
+        return f"{tag} 검색어 {i}"
+    return f"{tag}  검색어 {i % distinct}?" if i % 2 else f"{tag} 검색어 {i % distinct}"
+
+
+async def load(handler, n_requests, rate, tag, distinct=0):
+    """
+    초당 rate개씩 요청이 도착한다고 보고 (open-loop) 요청별 지연과 전체 소요 시간을 돌려줌
+    지연은 예정된 도착 시각부터 재므로 이벤트 루프가 막혀 늦게 시작한 요청의 대기도 포함됩니다.
+    반환: (요청별 지연, 전체 소요 시간, 단계별 degraded 응답 수)
+    """
+    latencies = []
+    degraded = Counter()
+    start = time.perf_counter()
+
+    async def one(i):
+        arrival = start + i / rate
+        await asyncio.sleep(max(0.0, arrival - time.perf_counter()))
+        result = await handler(query_for(i, tag, distinct))
+        latencies.append(time.perf_counter() - arrival)
+        assert result.get("success"), result
+        degraded.update(result.get("degraded", []))
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        await asyncio.gather(*(one(i) for i in range(n_requests)))
+    return np.array(latencies), time.perf_counter() - start, degraded
+
+
+def report(label, latencies, elapsed, degraded):
+    p50, p99 = np.percentile(latencies, [50, 99])
+    print(f"{label:<22} p50 {p50:6.2f}s  p99 {p99:6.2f}s  max {latencies.max():6.2f}s  "
+          f"{len(latencies) / elapsed:6.1f} req/s  degraded {dict(degraded) or '-'}")
+    return p99
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=30)
+    parser.add_argument("--rate", type=float, default=2.0, help="초당 도착 요청 수")
+    parser.add_argument("--search-latency", type=float, default=0.1, help="네이버 검색 응답 대기 초")
+    parser.add_argument("--article-latency", type=float, default=0.3, help="기사 페이지 응답 대기 초")
+    parser.add_argument("--llm-latency", type=float, default=1.0, help="stub 브리핑 생성 대기 초")
+    parser.add_argument("--llm-concurrency", type=int, default=LLM_MAX_CONCURRENCY)
+    parser.add_argument("--stuck-every", type=int, default=0, help="기사 N개 중 하나를 멈춘 사이트로 (0이면 없음)")
+    parser.add_argument("--stuck-latency", type=float, default=20.0)
+    parser.add_argument("--deadline", type=float, default=nlp_search.NLP_DEADLINE, help="arun 요청 마감 초")
+    parser.add_argument("--distinct-queries", type=int, default=0, help="돌려 쓸 검색어 수 (0이면 모두 다름)")
+    parser.add_argument("--result-ttl", type=float, default=nlp_search.NLP_RESULT_TTL, help="검색어 결과 캐시 TTL 초")
+    parser.add_argument("--skip-sync", action="store_true", help="기존 방식 측정 생략 (멈춘 사이트가 있으면 오래 걸림)")
+    args = parser.parse_args()
+
+    server = start_fixture_server(args.search_latency, args.article_latency, args.stuck_every, args.stuck_latency)
+    nlp_search.NAVER_SEARCH_URL = f"http://127.0.0.1:{server.server_address[1]}/search"
+    print(f"🧪 요청 {args.requests}개, 초당 {args.rate}개 도착 (검색 {args.search_latency}s, "
+          f"기사 {args.article_latency}s, 브리핑 {args.llm_latency}s, LLM 동시 호출 {args.llm_concurrency}, "
+          f"마감 {args.deadline}s)")
+
+    with tempfile.TemporaryDirectory() as root:
+        cache = HtmlCache(os.path.join(root, "html"))
+        sync_llm = make_llm(args.llm_latency, os.path.join(root, "llm_sync"), args.llm_concurrency)
+        async_llm = make_llm(args.llm_latency, os.path.join(root, "llm_async"), args.llm_concurrency)
+
+        async def legacy_endpoint(query):
+            # 기존 라우터: 요청마다 에이전트 생성 + 이벤트 루프를 막는 동기 run (결과 캐시 없음)
+            agent = nlp_search.NewsBriefingAgent(cache=cache)
+            agent.llm = sync_llm
+            return agent.compute(query)
+
+        results = ResultCache(args.result_ttl, nlp_search.NLP_RESULT_MAX_ENTRIES, cacheable=nlp_search.is_cacheable)
+        shared = nlp_search.AsyncNewsBriefingAgent(cache=cache, results=results)
+        shared.llm = async_llm
+
+        async def async_endpoint(query):
+            return await shared.arun(query, deadline=args.deadline)
+
+        async def run_all():
+            sync_result = None if args.skip_sync else await load(legacy_endpoint, args.requests, args.rate, "sync", args.distinct_queries)
+            async_result = await load(async_endpoint, args.requests, args.rate, "async", args.distinct_queries)
+            await shared.aclose()
+            return sync_result, async_result
+
+        sync_result, async_result = asyncio.run(run_all())
+
+    print()
+    async_p99 = report("async arun (공용)", *async_result)
+    if sync_result is not None:
+        sync_p99 = report("sync run (기존)", *sync_result)
+        print(f"\n📉 p99 {sync_p99:.2f}s -> {async_p99:.2f}s ({sync_p99 / async_p99:.1f}배)")
+    print(f"   검색어 결과 캐시: {results.snapshot()}")
+    print(f"   브리핑 생성 호출: {len(async_llm.backend.prompts)}회")
+    print(f"   새 커넥션 수 (async 풀): {shared.ahttp.stats.snapshot().get('connections_opened', 0)}")
+    server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,48 @@
+"""
+분산 수집 벤치마크: 로컬 HTTP 픽스처 서버에 대해 워커 수를 바꿔가며 구간(shard)/sec를 비교합니다.
+워커 수와 관계없이 같은 구간 집합이 모두 done이 되는지, 수집 건수가 같은지도 확인합니다.
+
+    python benchmarks/bench_queue.py --latency 50 --workers 1 2 4 8
+"""
+import sys
+import os
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BASE_DIR)
+
+import argparse
+import tempfile
+import time
+from datetime import datetime
+
+from bench_crawler import start_fixture_server, FixtureHandler
+from app.scroller.crawl_queue import crawl_distributed
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--latency", type=float, default=50, help="픽스처 응답 지연 (ms)")
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    server = start_fixture_server(args.latency / 1000)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    today = datetime(2026, 1, 22)
+
+    results = []
+    for workers in args.workers:
+        with tempfile.TemporaryDirectory() as tmp:
+            FixtureHandler.hits = 0
+            start = time.perf_counter()
+            df = crawl_distributed(days=args.days, today=today, base_url=base_url, workers=workers,
+                                   queue_path=os.path.join(tmp, "queue.sqlite3"), delay=None)
+            elapsed = time.perf_counter() - start
+        shards = args.days * 5
+        results.append((workers, elapsed, len(df), FixtureHandler.hits))
+        assert df[["collection_date", "press"]].drop_duplicates().shape[0] <= shards
+
+    print(f"\n{'workers':>7} {'sec':>7} {'shards/sec':>10} {'pages':>6} {'rows':>5} {'speedup':>8}")
+    base = results[0][1]
+    for workers, elapsed, rows, pages in results:
+        print(f"{workers:>7} {elapsed:7.2f} {args.days * 5 / elapsed:10.2f} {pages:>6} {rows:>5} {base / elapsed:7.2f}x")
+    server.shutdown()
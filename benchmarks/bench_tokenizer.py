@@ -0,0 +1,95 @@
+"""
+명사 추출(토크나이저) 처리량 벤치마크
+
+- 기존 simple_tokenizer (호출마다 Okt() 생성 + 리스트 불용어)와 tokenizer 엔진의
+  단건 / 배치 / 프로세스 풀 모드 결과가 모두 같은지 확인합니다.
+- 모드별 docs/sec를 출력합니다. (Okt는 JVM이 필요합니다)
+
+    python benchmarks/bench_tokenizer.py --docs 2000 --workers 4
+"""
+import sys
+import os
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BASE_DIR)
+
+import argparse
+import glob
+import json
+import time
+
+from app.scroller.tokenizer import tokenize, tokenize_batch, shutdown_pool
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "article_pages")
+
+
+def legacy_tokenizer(text):
+    """ 기존 clustering.simple_tokenizer 그대로 (비교 기준) """
+    from konlpy.tag import Okt
+    okt = Okt()
+    stopwords = [
+        '뉴스', '종합', '속보', '기자', '특파원', '위해', '밝혔다', '대해', '관련',
+        '오늘', '오후', '오전', '것으로', '따르면', '있는', '했다', '말했다',
+        '민주당', '국민의힘', '의원', '대통령', '대표', '무단전재', '배포', '금지',
+        '이날', '어제', '내일', '이번', '지난', '가장', '통해', '때문', '경우',
+        '정도', '사실', '내용', '모두', '우리', '자신', '문제', '생각', '사람',
+        '그', '이', '저', '수', '것', '등', '안', '전', '후', '약', '중'
+    ]
+    nouns = okt.nouns(str(text))
+    return [n for n in nouns if n not in stopwords and len(n) >= 2]
+
+
+def load_corpus(n_docs):
+    """ 골든 코퍼스 본문을 문장 단위로 섞어 n_docs개의 기사 길이 문서를 만듭니다. """
+    sentences = []
+    for path in sorted(glob.glob(os.path.join(FIXTURE_DIR, "*.json"))):
+        with open(path, encoding="utf-8") as f:
+            content = (json.load(f) or {}).get("content") or ""
+        sentences.extend(s.strip() + "." for s in content.split(".") if s.strip())
+    if not sentences:
+        raise SystemExit("fixtures/article_pages에 본문이 없습니다.")
+    docs = []
+    for i in range(n_docs):
+        docs.append(" ".join(sentences[(i * 7 + k) % len(sentences)] for k in range(12)))
+    return docs
+
+
+def timed(label, fn, n_docs):
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    print(f"   {label:<22} {elapsed:7.2f}s  {n_docs / elapsed:8.1f} docs/sec")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--docs", type=int, default=2000)
+    parser.add_argument("--legacy-docs", type=int, default=200, help="기존 구현은 느려서 앞부분만 측정")
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    docs = load_corpus(args.docs)
+    legacy_docs = docs[:args.legacy_docs]
+    print(f"🧪 문서 {len(docs)}건 (기존 구현은 {len(legacy_docs)}건)")
+
+    # JVM 기동 비용은 측정에서 제외
+    tokenize("초기화")
+
+    expected = timed("legacy (Okt per call)", lambda: [legacy_tokenizer(t) for t in legacy_docs], len(legacy_docs))
+    single = timed("engine tokenize()", lambda: [tokenize(t) for t in docs], len(docs))
+    batch = timed("engine batch", lambda: tokenize_batch(docs, workers=1), len(docs))
+    # 풀 기동(워커별 JVM)은 첫 호출에 포함되므로 한 번 데운 뒤 측정
+    tokenize_batch(docs[:args.workers * 128], workers=args.workers)
+    pooled = timed(f"engine pool x{args.workers}", lambda: tokenize_batch(docs, workers=args.workers), len(docs))
+    shutdown_pool()
+
+    mismatches = sum(a != b for a, b in zip(expected, single))
+    mismatches += sum(a != b for a, b in zip(single, batch))
+    mismatches += sum(a != b for a, b in zip(single, pooled))
+    print(f"{'✅' if not mismatches else '❌'} 결과 불일치 {mismatches}건")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,15 @@
+import sys
+import os
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BASE_DIR)
+
+import pytest
+
+from app.core.llm_scheduler import LLMScheduler
+
+
+@pytest.fixture
+def scheduler():
+    # 분당 한도 없이 바로 호출 (한도 동작은 스케줄러 테스트가 아니면 보지 않음)
+    return LLMScheduler(rpm=10 ** 9, tpm=10 ** 12)
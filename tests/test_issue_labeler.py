@@ -0,0 +1,108 @@
+import json
+import re
+
+from app.core.llm_client import LLMClient, LLMCache, StubBackend
+from app.scroller.issue_labeler import label_topics, parse_batch_labels, MAX_LABEL_LENGTH
+
+TOPICS = {0: ["국회 예산안 처리"], 1: ["대통령 순방 일정"], 2: ["지방선거 여론조사"]}
+
+
+def batch_stub(batch_response):
+    """ 배치 프롬프트면 batch_response, 개별 프롬프트면 '개별 제목' """
+    batch_prompts = []
+
+    def respond(prompt):
+        if re.search(r"\[이슈 -?\d+\]", prompt):
+            batch_prompts.append(prompt)
+            return batch_response
+        return "개별 제목"
+    return respond, batch_prompts
+
+
+def make_model(tmp_path, scheduler, responses):
+    return LLMClient("label-model", backend=StubBackend(responses=responses), cache=LLMCache(str(tmp_path)),
+                     scheduler=scheduler, use_cache=True)
+
+
+def labels_json(*items):
+    return json.dumps({"labels": [{"topic_id": t, "label": label} for t, label in items]}, ensure_ascii=False)
+
+
+def test_parse_accepts_code_fence_and_string_ids():
+    text = "```json\n" + labels_json(("0", "예산안 처리"), (1, "'순방' 일정")) + "\n```"
+
+    assert parse_batch_labels(text, [0, 1, 2]) == {0: "예산안 처리", 1: "순방 일정"}
+
+
+def test_parse_rejects_truncated_json():
+    truncated = labels_json((0, "예산안 처리"), (1, "순방 일정"))[:-10]
+
+    assert parse_batch_labels(truncated, [0, 1]) == {}
+    assert parse_batch_labels('{"labels": "없음"}', [0]) == {}
+
+
+def test_parse_skips_unknown_duplicate_and_bad_items():
+    text = labels_json((0, "예산안 처리"), (0, "중복 제목"), (7, "없는 이슈"), (1, ""), (2, "가" * (MAX_LABEL_LENGTH + 1)))
+
+    assert parse_batch_labels(text, [0, 1, 2]) == {0: "예산안 처리"}
+    assert parse_batch_labels('{"labels": ["문자열", null, {"label": "번호 없음"}]}', [0]) == {}
+
+
+def test_label_topics_falls_back_for_missing_topics(tmp_path, scheduler):
+    respond, batch_prompts = batch_stub(labels_json((0, "예산안 처리"), (9, "엉뚱한 이슈")))
+    model = make_model(tmp_path, scheduler, respond)
+
+    labels, stats = label_topics(TOPICS, model=model, mode="batch")
+
+    assert labels == {0: "예산안 처리", 1: "개별 제목", 2: "개별 제목"}
+    assert list(labels) == list(TOPICS)
+    assert stats["requests"] == 3 and stats["fallbacks"] == 2
+    assert len(batch_prompts) == 1
+
+
+def test_over_long_labels_are_requested_again(tmp_path, scheduler):
+    respond, _ = batch_stub(labels_json((0, "가" * 100), (1, "순방 일정"), (2, "여론조사 발표")))
+    model = make_model(tmp_path, scheduler, respond)
+
+    labels, stats = label_topics(TOPICS, model=model, mode="batch")
+
+    assert labels[0] == "개별 제목"
+    assert stats["fallbacks"] == 1
+
+
+def test_unparseable_batch_response_is_not_reused(tmp_path, scheduler):
+    respond, batch_prompts = batch_stub("제목을 만들 수 없습니다")
+    model = make_model(tmp_path, scheduler, respond)
+
+    first, stats = label_topics(TOPICS, model=model, mode="batch")
+    label_topics(TOPICS, model=model, mode="batch")
+
+    assert set(first.values()) == {"개별 제목"}
+    assert stats["fallbacks"] == len(TOPICS)
+    # 캐시에서 지웠으므로 다음 실행도 배치 요청을 다시 보냄 (개별 제목 응답은 캐시 hit)
+    assert len(batch_prompts) == 2
+
+
+def test_parsed_batch_response_is_reused(tmp_path, scheduler):
+    respond, batch_prompts = batch_stub(labels_json((0, "예산안 처리"), (1, "순방 일정"), (2, "여론조사 발표")))
+    model = make_model(tmp_path, scheduler, respond)
+
+    label_topics(TOPICS, model=model, mode="batch")
+    labels, stats = label_topics(TOPICS, model=model, mode="batch")
+
+    assert labels == {0: "예산안 처리", 1: "순방 일정", 2: "여론조사 발표"}
+    assert stats["fallbacks"] == 0
+    assert len(batch_prompts) == 1
+
+
+def test_failed_batch_call_uses_single_requests(tmp_path, scheduler):
+    def respond(prompt):
+        if re.search(r"\[이슈 -?\d+\]", prompt):
+            return RuntimeError("server error")
+        return "개별 제목"
+    model = make_model(tmp_path, scheduler, respond)
+
+    labels, stats = label_topics(TOPICS, model=model, mode="batch")
+
+    assert set(labels.values()) == {"개별 제목"}
+    assert stats["requests"] == 1 + len(TOPICS)
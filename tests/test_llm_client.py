@@ -0,0 +1,144 @@
+import asyncio
+
+from app.core import llm_client
+from app.core.llm_client import LLMClient, LLMCache, StubBackend, cache_key
+
+
+def make_client(tmp_path, scheduler, model="stub-model", backend=None, **cache_kwargs):
+    backend = backend or StubBackend()
+    cache = LLMCache(str(tmp_path), **cache_kwargs)
+    return LLMClient(model, backend=backend, cache=cache, scheduler=scheduler, use_cache=True), backend
+
+
+def test_generate_hits_cache_for_same_prompt(tmp_path, scheduler):
+    client, backend = make_client(tmp_path, scheduler, backend=StubBackend(responses=["첫 응답", "두 번째 응답"]))
+
+    first = client.generate("이슈 제목을 지어줘")
+    # 들여쓰기/빈 줄만 다른 프롬프트도 같은 키
+    second = client.generate("  이슈 제목을   지어줘\n\n")
+
+    assert first.text == second.text == "첫 응답"
+    assert not first.from_cache and second.from_cache
+    assert len(backend.prompts) == 1
+    assert client.stats.snapshot()["hit"] == 1
+
+
+def test_cache_key_separates_model_and_config(tmp_path, scheduler):
+    cache = LLMCache(str(tmp_path))
+    backend_a, backend_b = StubBackend(responses=["a"]), StubBackend(responses=["b"])
+    client_a = LLMClient("model-a", backend=backend_a, cache=cache, scheduler=scheduler, use_cache=True)
+    client_b = LLMClient("model-b", backend=backend_b, cache=cache, scheduler=scheduler, use_cache=True)
+
+    assert client_a.generate("같은 프롬프트").text == "a"
+    assert client_b.generate("같은 프롬프트").text == "b"
+    client_a.generate("같은 프롬프트", generation_config={"temperature": 0.1})
+    client_a.generate("같은 프롬프트", generation_config={"temperature": 0.1})
+
+    assert len(backend_a.prompts) == 2
+    assert len(backend_b.prompts) == 1
+    assert cache_key("model-a", "p", {"x": 1, "y": 2}) == cache_key("model-a", "p", {"y": 2, "x": 1})
+    assert cache_key("model-a", "p") != cache_key("model-b", "p")
+
+
+def test_expired_entries_are_not_served(tmp_path, scheduler, monkeypatch):
+    client, backend = make_client(tmp_path, scheduler, ttl=60)
+    now = [1_000_000.0]
+    monkeypatch.setattr(llm_client.time, "time", lambda: now[0])
+
+    client.generate("프롬프트")
+    now[0] += 59
+    assert client.generate("프롬프트").from_cache
+    now[0] += 2
+    assert not client.generate("프롬프트").from_cache
+    assert len(backend.prompts) == 2
+
+
+def test_eviction_keeps_cache_under_size_limit(tmp_path, scheduler, monkeypatch):
+    payload = "가" * 100
+    entry_bytes = len(f'"{payload}"'.encode("utf-8"))
+    client, backend = make_client(tmp_path, scheduler, backend=StubBackend(responses=[payload]),
+                                  max_bytes=entry_bytes * 3)
+    now = [1_000_000.0]
+    monkeypatch.setattr(llm_client.time, "time", lambda: now[0])
+
+    for i in range(3):
+        client.generate(f"프롬프트 {i}")
+        now[0] += 1
+    # 0번을 다시 써서 가장 오래 안 쓴 항목은 1번
+    assert client.generate("프롬프트 0").from_cache
+    now[0] += 1
+    client.generate("프롬프트 3")
+
+    assert client.cache.total_bytes() <= entry_bytes * 3
+    assert client.generate("프롬프트 0").from_cache
+    assert not client.generate("프롬프트 1").from_cache
+
+
+def test_stream_replays_same_chunks(tmp_path, scheduler):
+    client, backend = make_client(tmp_path, scheduler,
+                                  backend=StubBackend(responses=["스트리밍 응답 " * 5], chunk_chars=7))
+
+    first = list(client.stream("초안을 써줘"))
+    second = list(client.stream("초안을 써줘"))
+
+    assert len(first) > 1
+    assert second == first
+    assert len(backend.prompts) == 1
+    # 일반 응답과 스트리밍 응답은 따로 저장
+    assert not client.generate("초안을 써줘").from_cache
+
+
+def test_interrupted_stream_is_not_cached(tmp_path, scheduler):
+    client, backend = make_client(tmp_path, scheduler, backend=StubBackend(responses=["a" * 50], chunk_chars=5))
+
+    stream = client.stream("프롬프트")
+    next(stream)
+    stream.close()
+    list(client.stream("프롬프트"))
+
+    assert len(backend.prompts) == 2
+    assert scheduler.snapshot()["active"] == 0
+
+
+def test_astream_shares_cache_with_stream(tmp_path, scheduler):
+    client, backend = make_client(tmp_path, scheduler, backend=StubBackend(responses=["비동기 응답 " * 5], chunk_chars=6))
+
+    async def collect():
+        return [chunk async for chunk in client.astream("프롬프트")]
+
+    first = asyncio.run(collect())
+    assert list(client.stream("프롬프트")) == first
+    assert asyncio.run(collect()) == first
+    assert len(backend.prompts) == 1
+
+
+def test_invalidate_drops_text_and_stream_entries(tmp_path, scheduler):
+    client, backend = make_client(tmp_path, scheduler, backend=StubBackend(responses=["깨진 JSON", "{}"]))
+
+    client.generate("프롬프트")
+    list(client.stream("프롬프트"))
+    client.invalidate("프롬프트")
+
+    assert client.generate("프롬프트").text == "{}"
+    assert list(client.stream("프롬프트")) == ["{}"]
+    assert len(backend.prompts) == 4
+
+
+def test_agenerate_uses_cache(tmp_path, scheduler):
+    client, backend = make_client(tmp_path, scheduler)
+
+    async def twice():
+        return await client.agenerate("프롬프트"), await client.agenerate("프롬프트")
+
+    first, second = asyncio.run(twice())
+    assert second.from_cache and second.text == first.text
+    assert len(backend.prompts) == 1
+
+
+def test_stub_backend_matches_gemini_constructor(monkeypatch):
+    monkeypatch.setattr(llm_client, "LLM_BACKEND", "stub")
+    client = LLMClient("gemini-x", use_cache=False)
+
+    assert isinstance(client.backend, StubBackend)
+    assert client.backend.model_name == "gemini-x"
+    assert client.generate("안녕").text.startswith("stub:")
@@ -0,0 +1,151 @@
+import asyncio
+import json
+
+import pytest
+
+pytest.importorskip("newspaper")
+
+from app.core.html_cache import HtmlCache
+from app.core.llm_client import LLMClient, LLMCache, StubBackend
+from app.core.result_cache import ResultCache
+from app.scroller import nlp_search
+from benchmarks.bench_nlp_load import start_fixture_server, FixtureHandler
+
+BRIEFING = json.dumps({"summary_content": "요약", "keywords": ["기사", "정부"]}, ensure_ascii=False)
+
+
+@pytest.fixture(scope="module")
+def fixture_server():
+    server = start_fixture_server(search_latency=0.05, article_latency=0.05)
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+@pytest.fixture
+def make_agent(tmp_path, fixture_server, scheduler, monkeypatch):
+    """ 로컬 픽스처 서버 + StubBackend로 에이전트 생성 (반환: (에이전트, 백엔드)) """
+    monkeypatch.setattr(nlp_search, "NAVER_SEARCH_URL", f"{fixture_server}/search")
+
+    def make(agent_class=nlp_search.AsyncNewsBriefingAgent, responses=(BRIEFING,), latency=0.0):
+        backend = StubBackend(responses=list(responses), latency=latency)
+        llm = LLMClient(nlp_search.BRIEFING_MODEL, backend=backend, cache=LLMCache(str(tmp_path / "llm")),
+                        scheduler=scheduler, use_cache=True)
+        # 공용 LLM 클라이언트/디스크 캐시 대신 테스트용 클라이언트
+        monkeypatch.setattr(nlp_search, "get_llm_client", lambda *args, **kwargs: llm)
+        results = ResultCache(60, 16, cacheable=nlp_search.is_cacheable)
+        agent = agent_class(cache=HtmlCache(str(tmp_path / "html")), results=results)
+        return agent, backend
+
+    return make
+
+
+def run_with(agent, scenario):
+    """ 비동기 커넥션 풀은 루프에 묶이므로 한 루프에서 실행하고 닫음 """
+    async def main():
+        try:
+            return await scenario()
+        finally:
+            await agent.aclose()
+    return asyncio.run(main())
+
+
+def test_arun_coalesces_equivalent_queries(make_agent):
+    agent, backend = make_agent(latency=0.2)
+
+    async def scenario():
+        return await asyncio.gather(agent.arun("정부 예산"), agent.arun("  정부   예산?"))
+
+    first, second = run_with(agent, scenario)
+    assert first["success"] and second["success"]
+    assert first["data"]["original_query"] == "정부 예산"
+    assert second["data"]["original_query"] == "  정부   예산?"
+    assert first["data"]["articles"] == second["data"]["articles"]
+    assert len(backend.prompts) == 1
+    assert agent.results.snapshot()["coalesced"] == 1
+
+
+def test_arun_follower_survives_cancelled_leader(make_agent):
+    agent, backend = make_agent(latency=0.3)
+
+    async def scenario():
+        leader = asyncio.ensure_future(agent.arun("국회 본회의"))
+        await asyncio.sleep(0.05)
+        follower = asyncio.ensure_future(agent.arun("국회 본회의"))
+        await asyncio.sleep(0.05)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await follower
+
+    result = run_with(agent, scenario)
+    assert result["success"] and not result["degraded"]
+    assert len(backend.prompts) == 1
+
+
+def test_cached_result_is_isolated_from_callers(make_agent):
+    agent, backend = make_agent()
+
+    async def scenario():
+        first = await agent.arun("선거 여론조사")
+        first["data"]["articles"].clear()
+        return await agent.arun("선거 여론조사")
+
+    second = run_with(agent, scenario)
+
+    assert second["data"]["articles"]
+    assert len(backend.prompts) == 1
+
+
+def test_sync_run_shares_result_cache(make_agent):
+    agent, backend = make_agent(agent_class=nlp_search.NewsBriefingAgent)
+
+    first = agent.run("외교 순방")
+    second = agent.run("외교 순방!")
+
+    assert first["success"] and second["success"]
+    assert second["data"]["original_query"] == "외교 순방!"
+    assert len(backend.prompts) == 1
+
+
+def test_unparseable_briefing_is_not_cached(make_agent):
+    agent, backend = make_agent(responses=("JSON이 아닌 응답", BRIEFING))
+
+    async def scenario():
+        return await agent.arun("지방 선거"), await agent.arun("지방 선거")
+
+    failed, retried = run_with(agent, scenario)
+
+    assert not failed["success"]
+    assert retried["success"]
+    # 실패 응답은 결과 캐시에도, LLM 응답 캐시에도 남지 않아 다시 호출
+    assert len(backend.prompts) == 2
+
+
+def test_briefing_over_deadline_returns_article_list(make_agent):
+    agent, _ = make_agent(latency=2.0)
+
+    result = run_with(agent, lambda: agent.arun("정당 지지율", deadline=0.8))
+
+    assert result["success"]
+    assert result["degraded"] == ["briefing"]
+    assert result["data"]["articles"] and result["data"]["ai_summary"] == ""
+    # 줄인 응답은 결과 캐시에 저장하지 않음
+    assert agent.results.get(nlp_search.normalize_query("정당 지지율")) is None
+
+
+def test_full_texts_over_budget_are_cancelled_and_awaited(make_agent, fixture_server, monkeypatch):
+    agent, _ = make_agent()
+    monkeypatch.setattr(FixtureHandler, "stuck_every", 1)
+    monkeypatch.setattr(FixtureHandler, "stuck_latency", 3.0)
+    articles = [{"link": f"{fixture_server}/article/stuck/{i}"} for i in range(3)]
+
+    async def scenario():
+        missed = await agent.afetch_full_texts(articles, timeout=0.3)
+        # 취소한 본문 요청이 마감 뒤에 남아 돌지 않음
+        others = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+        return missed, others
+
+    missed, others = run_with(agent, scenario)
+    assert missed == 3
+    assert others == []
+    assert not any("full_text" in art for art in articles)
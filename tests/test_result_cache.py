@@ -0,0 +1,141 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.core.result_cache import ResultCache
+
+
+def test_concurrent_callers_share_one_computation():
+    cache = ResultCache(ttl=60, max_entries=8)
+    calls = []
+    start = threading.Barrier(5)
+    results = []
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.2)
+        return {"value": 1}
+
+    def worker():
+        start.wait()
+        results.append(cache.get_or_compute("key", compute))
+
+    threads = [threading.Thread(target=worker) for _ in range(5)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1
+    assert results == [{"value": 1}] * 5
+    stats = cache.snapshot()
+    assert stats["miss"] == 1 and stats["coalesced"] == 4 and stats["in_flight"] == 0
+
+
+def test_leader_error_reaches_followers_and_is_not_cached():
+    cache = ResultCache(ttl=60, max_entries=8)
+    entered = threading.Event()
+    release = threading.Event()
+    errors = []
+
+    def failing():
+        entered.set()
+        release.wait()
+        raise RuntimeError("upstream down")
+
+    def call():
+        try:
+            cache.get_or_compute("key", failing)
+        except RuntimeError as e:
+            errors.append(str(e))
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    entered.wait()
+    follower = threading.Thread(target=call)
+    follower.start()
+    time.sleep(0.05)
+    release.set()
+    leader.join()
+    follower.join()
+
+    assert errors == ["upstream down"] * 2
+    assert cache.get_or_compute("key", lambda: {"ok": True}) == {"ok": True}
+
+
+def test_results_are_copied_in_and_out():
+    cache = ResultCache(ttl=60, max_entries=8)
+    original = {"items": [1, 2]}
+    returned = cache.get_or_compute("key", lambda: original)
+
+    original["items"].append(3)
+    returned["items"].append(4)
+
+    assert cache.get("key") == {"items": [1, 2]}
+
+
+def test_uncacheable_results_are_only_shared_in_flight():
+    cache = ResultCache(ttl=60, max_entries=8, cacheable=lambda result: result.get("success"))
+    cache.get_or_compute("key", lambda: {"success": False})
+
+    assert cache.get("key") is None
+    assert cache.snapshot()["not_stored"] == 1
+
+
+def test_ttl_and_max_entries(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("app.core.result_cache.time.monotonic", lambda: now[0])
+    cache = ResultCache(ttl=10, max_entries=2)
+    for key in ("a", "b"):
+        cache.put(key, key)
+    cache.get("a")
+    cache.put("c", "c")
+
+    assert cache.get("b") is None  # 가장 오래 안 쓴 항목이 밀려남
+    assert cache.get("a") == "a"
+    now[0] += 10
+    assert cache.get("a") is None
+    assert cache.snapshot()["expired"] >= 1
+
+
+def test_async_followers_survive_cancelled_leader():
+    cache = ResultCache(ttl=60, max_entries=8)
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.1)
+        return {"value": 1}
+
+    async def scenario():
+        leader = asyncio.ensure_future(cache.aget_or_compute("key", compute))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(cache.aget_or_compute("key", compute))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await follower
+
+    assert asyncio.run(scenario()) == {"value": 1}
+    assert len(calls) == 1
+    assert cache.get("key") == {"value": 1}
+
+
+def test_async_error_propagates_to_all_waiters():
+    cache = ResultCache(ttl=60, max_entries=8)
+
+    async def failing():
+        await asyncio.sleep(0.05)
+        raise ValueError("bad response")
+
+    async def scenario():
+        return await asyncio.gather(*(cache.aget_or_compute("key", failing) for _ in range(3)),
+                                    return_exceptions=True)
+
+    results = asyncio.run(scenario())
+    assert all(isinstance(r, ValueError) for r in results)
+    assert cache.get("key") is None
+    assert cache.snapshot()["in_flight"] == 0